@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import json
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
@@ -51,16 +52,18 @@ def _validate_json(building: Building) -> dict:
     """Run all validators and return structured results."""
     errors = validate_all_phases(building)
     details = []
+    counts: Counter[str] = Counter()
     for e in errors:
+        counts[e.severity] += 1
         detail = {"severity": e.severity, "message": e.message}
-        if hasattr(e, "element_type") and e.element_type:
+        if e.element_type:
             detail["element_type"] = e.element_type
         details.append(detail)
 
     return {
-        "errors": sum(1 for e in errors if e.severity == "error"),
-        "warnings": sum(1 for e in errors if e.severity == "warning"),
-        "optimizations": sum(1 for e in errors if e.severity == "optimization"),
+        "errors": counts["error"],
+        "warnings": counts["warning"],
+        "optimizations": counts["optimization"],
         "details": details,
     }
 
@@ -169,7 +169,7 @@ def render_floorplan(
         lb_count = sum(1 for w in story.walls if w.load_bearing)
         part_count = len(story.walls) - lb_count
         info_lines = [
-            f"Floor area: {sum(s.area for s in story.slabs if s.is_floor):.1f} m²",
+            f"Floor area: {story.floor_area:.1f} m²",
             f"Walls: {len(story.walls)} ({lb_count} load-bearing [green], {part_count} partition [yellow])",
             f"Doors: {len(story.doors)}",
             f"Windows: {len(story.windows)}",
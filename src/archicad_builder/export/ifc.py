@@ -264,9 +264,7 @@ class IFCExporter:
             )
 
         # Export spaces (IfcSpace) — these aggregate under the storey
-        all_spaces = list(story.spaces)
-        for apt in story.apartments:
-            all_spaces.extend(apt.spaces)
+        all_spaces = story.all_spaces
         if all_spaces:
             ifc_spaces = []
             for space in all_spaces:
@@ -53,32 +53,83 @@ class Story(BaseModel):
     spaces: list[Space] = Field(default_factory=list)
     apartments: list[Apartment] = Field(default_factory=list)
 
+    @property
+    def all_spaces(self) -> tuple[Space, ...]:
+        """All spaces of the story: top-level spaces, then apartment rooms."""
+        return tuple(self.spaces) + tuple(
+            space for apt in self.apartments for space in apt.spaces
+        )
+
+    @property
+    def floor_slabs(self) -> list[Slab]:
+        """Slabs with is_floor=True, in story order."""
+        return [s for s in self.slabs if s.is_floor]
+
+    @property
+    def floor_area(self) -> float:
+        """Summed area of the story's floor slabs."""
+        return sum(s.area for s in self.floor_slabs)
+
+    @property
+    def floor_slab_thickness(self) -> float:
+        """Thickest floor slab on the story (0.0 when there is none)."""
+        return max((s.thickness for s in self.floor_slabs), default=0.0)
+
     def get_wall(self, wall_id: str) -> Wall | None:
         """Find a wall by GlobalId."""
         return next((w for w in self.walls if w.global_id == wall_id), None)
 
     def get_wall_by_name(self, name: str) -> Wall | None:
         """Find a wall by name (case-insensitive)."""
-        return next(
-            (w for w in self.walls if w.name.lower() == name.lower()), None
-        )
+        lower = name.lower()
+        return next((w for w in self.walls if w.name.lower() == lower), None)
+
+    def get_space_by_name(self, name: str) -> Space | None:
+        """Find a space by name (case-insensitive), including apartment rooms."""
+        lower = name.lower()
+        for space in self.spaces:
+            if space.name.lower() == lower:
+                return space
+        for apt in self.apartments:
+            for space in apt.spaces:
+                if space.name.lower() == lower:
+                    return space
+        return None
+
+    def get_element(
+        self, global_id: str
+    ) -> Wall | Staircase | Space | Apartment | None:
+        """Find a wall, staircase, space, apartment or apartment room by GlobalId."""
+        for group in (self.walls, self.staircases, self.spaces):
+            for element in group:
+                if element.global_id == global_id:
+                    return element
+        for apt in self.apartments:
+            if apt.global_id == global_id:
+                return apt
+            for space in apt.spaces:
+                if space.global_id == global_id:
+                    return space
+        return None
 
     def get_door_by_name(self, name: str) -> Door | None:
         """Find a door by name (case-insensitive)."""
-        return next(
-            (d for d in self.doors if d.name.lower() == name.lower()), None
-        )
+        lower = name.lower()
+        return next((d for d in self.doors if d.name.lower() == lower), None)
 
     def get_window_by_name(self, name: str) -> Window | None:
         """Find a window by name (case-insensitive)."""
-        return next(
-            (w for w in self.windows if w.name.lower() == name.lower()), None
-        )
+        lower = name.lower()
+        return next((w for w in self.windows if w.name.lower() == lower), None)
 
     def wall_ids(self) -> set[str]:
         """Set of all wall GlobalIds in this story."""
         return {w.global_id for w in self.walls}
 
+    def external_wall_ids(self) -> frozenset[str]:
+        """GlobalIds of all exterior (facade) walls in this story."""
+        return frozenset(w.global_id for w in self.walls if w.is_external)
+
     def ensure_tags(self) -> None:
         """Auto-generate tags for elements that don't have one.
 
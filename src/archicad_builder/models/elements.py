@@ -6,7 +6,10 @@ so the same ID appears in our JSON model and the exported IFC file.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import Enum
+from functools import cached_property
+from typing import Any, Self
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -32,11 +35,49 @@ class Wall(BaseModel):
     load_bearing: bool = Field(default=False, description="Pset_WallCommon.LoadBearing")
     is_external: bool = Field(default=False, description="Pset_WallCommon.IsExternal")
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("start", "end"):
+            for cached in ("center", "length", "unit_tangent", "unit_normal"):
+                self.__dict__.pop(cached, None)
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False,
+    ) -> Self:
+        # The copy shares __dict__ contents and ``update`` bypasses
+        # __setattr__, so drop the cached geometry
+        copy = super().model_copy(update=update, deep=deep)
+        for cached in ("center", "length", "unit_tangent", "unit_normal"):
+            copy.__dict__.pop(cached, None)
+        return copy
+
+    # Derived geometry below is cached; reassigning ``start``/``end`` clears it.
+
+    @cached_property
     def length(self) -> float:
         """Wall length (centerline)."""
         return self.start.distance_to(self.end)
 
+    @cached_property
+    def center(self) -> Point2D:
+        """Wall midpoint."""
+        return Point2D(
+            x=(self.start.x + self.end.x) / 2,
+            y=(self.start.y + self.end.y) / 2,
+        )
+
+    @cached_property
+    def unit_tangent(self) -> tuple[float, float]:
+        """Unit direction vector from start to end."""
+        length = self.length
+        return ((self.end.x - self.start.x) / length, (self.end.y - self.start.y) / length)
+
+    @cached_property
+    def unit_normal(self) -> tuple[float, float]:
+        """Unit normal: the tangent rotated 90° counter-clockwise."""
+        tx, ty = self.unit_tangent
+        return (-ty, tx)
+
     @model_validator(mode="after")
     def start_and_end_differ(self) -> Wall:
         if self.start == self.end:
@@ -244,6 +285,11 @@ class Staircase(BaseModel):
         """Staircase footprint area."""
         return self.outline.area
 
+    @property
+    def center(self) -> Point2D:
+        """Centroid of the footprint outline."""
+        return self.outline.center
+
 
 class VirtualElement(BaseModel):
     """An imaginary boundary between spaces — no physical properties.
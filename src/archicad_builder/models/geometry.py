@@ -3,16 +3,35 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Self
 
 from pydantic import BaseModel, field_validator
 
 
-class Point2D(BaseModel):
-    """2D point in the XY plane (meters)."""
+@dataclass(frozen=True, slots=True, eq=False, init=False)
+class Point2D:
+    """2D point in the XY plane (meters).
+
+    A slotted dataclass rather than a pydantic model: points are the most
+    numerous objects in a building, and this makes them cheaper to create
+    and to read. Pydantic still validates and serializes them as fields of
+    the models that hold them.
+
+    Frozen: points are hashed and shared between models, and walls and
+    polygons cache geometry derived from them. Move a point by assigning
+    a new one.
+    """
 
     x: float
     y: float
 
+    def __init__(self, x: float, y: float) -> None:
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
+
     def distance_to(self, other: Point2D) -> float:
         """Euclidean distance to another point."""
         return math.sqrt((self.x - other.x) ** 2 + (self.y - other.y) ** 2)
@@ -56,6 +75,66 @@ class Polygon2D(BaseModel):
             raise ValueError("Polygon must have at least 3 vertices")
         return v
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "vertices":
+            for cached in ("center", "bbox", "coords", "is_axis_aligned_rect"):
+                self.__dict__.pop(cached, None)
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False,
+    ) -> Self:
+        # The copy shares __dict__ contents and ``update`` bypasses
+        # __setattr__, so drop the cached properties
+        copy = super().model_copy(update=update, deep=deep)
+        for cached in ("center", "bbox", "coords", "is_axis_aligned_rect"):
+            copy.__dict__.pop(cached, None)
+        return copy
+
+    @cached_property
+    def center(self) -> Point2D:
+        """Vertex centroid (mean of the vertices).
+
+        Cached on first access; reassigning ``vertices`` clears it.
+        """
+        n = len(self.vertices)
+        return Point2D(
+            x=sum(v.x for v in self.vertices) / n,
+            y=sum(v.y for v in self.vertices) / n,
+        )
+
+    @cached_property
+    def coords(self) -> tuple[tuple[float, float], ...]:
+        """Vertex coordinates as plain (x, y) tuples.
+
+        Cached on first access; reassigning ``vertices`` clears it.
+        Cheap to turn into a NumPy array with ``np.array(poly.coords)``.
+        """
+        return tuple((v.x, v.y) for v in self.vertices)
+
+    @cached_property
+    def is_axis_aligned_rect(self) -> bool:
+        """True for a 4-vertex polygon whose edges are all exactly axis-aligned.
+
+        Cached on first access; reassigning ``vertices`` clears it.
+        """
+        if len(self.vertices) != 4:
+            return False
+        v = self.vertices
+        return all(
+            v[i].x == v[i - 1].x or v[i].y == v[i - 1].y for i in range(4)
+        ) and len({(p.x, p.y) for p in v}) == 4
+
+    @cached_property
+    def bbox(self) -> tuple[float, float, float, float]:
+        """Axis-aligned bounding box as (min_x, min_y, max_x, max_y).
+
+        Cached on first access; reassigning ``vertices`` clears it.
+        """
+        xs = [v.x for v in self.vertices]
+        ys = [v.y for v in self.vertices]
+        return (min(xs), min(ys), max(xs), max(ys))
+
     @property
     def area(self) -> float:
         """Compute area using the shoelace formula. Returns absolute value."""
@@ -81,6 +81,11 @@ class Space(BaseModel):
         """Room perimeter length (m)."""
         return self.boundary.perimeter
 
+    @property
+    def center(self) -> Point2D:
+        """Centroid of the boundary polygon."""
+        return self.boundary.center
+
 
 class Apartment(BaseModel):
     """A dwelling unit composed of multiple spaces/rooms.
@@ -102,6 +107,11 @@ class Apartment(BaseModel):
         """Total apartment area from boundary polygon (m²)."""
         return self.boundary.area
 
+    @property
+    def center(self) -> Point2D:
+        """Centroid of the apartment boundary."""
+        return self.boundary.center
+
     @property
     def room_count(self) -> int:
         """Number of rooms (excluding hallway/corridor)."""
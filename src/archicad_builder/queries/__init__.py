@@ -28,6 +28,7 @@ from archicad_builder.queries.mermaid import (
 from archicad_builder.queries.wall_rooms import (
     get_room_walls,
     get_wall_rooms,
+    get_story_wall_rooms,
     get_room_exterior_walls,
     get_room_windows,
 )
@@ -48,6 +49,7 @@ __all__ = [
     "graph_to_mermaid_simple",
     "get_room_walls",
     "get_wall_rooms",
+    "get_story_wall_rooms",
     "get_room_exterior_walls",
     "get_room_windows",
     "ApartmentSlice",
@@ -12,9 +12,12 @@ of the host wall and check which space contains that point.
 from __future__ import annotations
 
 import math
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Optional
 
+import numpy as np
+
 from archicad_builder.models.building import Building, Story
 from archicad_builder.models.elements import Door, Wall
 from archicad_builder.models.geometry import Point2D
@@ -24,7 +27,7 @@ from archicad_builder.models.spaces import Apartment, RoomType, Space
 # ── Graph data structures ────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """A node in the connectivity graph (a room or space)."""
 
@@ -34,7 +37,7 @@ class GraphNode:
     storey: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     """An edge in the connectivity graph (a door connecting two nodes)."""
 
@@ -50,21 +53,66 @@ class ConnectivityGraph:
 
     Nodes represent rooms/spaces. Edges represent doors.
     The graph is undirected (doors connect bidirectionally).
+
+    Neighbor lookups go through an adjacency index that is built lazily
+    on the first query and dropped whenever edges are added through
+    ``add_edge``. ``edges_by_pair`` groups parallel doors between the same
+    two nodes; path queries walk one entry per neighbor, not per door.
     """
 
     storey: str
     nodes: dict[str, GraphNode] = field(default_factory=dict)
     edges: list[GraphEdge] = field(default_factory=list)
+    _adj: dict[str, list[tuple[str, GraphEdge]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pairs: dict[frozenset[str], list[GraphEdge]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _linked: dict[str, list[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _adj_edge_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def add_edge(self, edge: GraphEdge) -> None:
+        """Append an edge and invalidate the adjacency index."""
+        self.edges.append(edge)
+        self._adj = None
+
+    def _adjacency(self) -> dict[str, list[tuple[str, GraphEdge]]]:
+        """Get the adjacency index, rebuilding it if the edges changed."""
+        # Edges appended directly to the list (bypassing add_edge) are
+        # caught by the length check.
+        if self._adj is None or self._adj_edge_count != len(self.edges):
+            adj: dict[str, list[tuple[str, GraphEdge]]] = defaultdict(list)
+            pairs: dict[frozenset[str], list[GraphEdge]] = {}
+            linked: dict[str, list[str]] = defaultdict(list)
+            for edge in self.edges:
+                adj[edge.from_node].append((edge.to_node, edge))
+                if edge.to_node != edge.from_node:
+                    adj[edge.to_node].append((edge.from_node, edge))
+                pair = frozenset((edge.from_node, edge.to_node))
+                if pair not in pairs:
+                    pairs[pair] = []
+                    linked[edge.from_node].append(edge.to_node)
+                    if edge.to_node != edge.from_node:
+                        linked[edge.to_node].append(edge.from_node)
+                pairs[pair].append(edge)
+            self._adj = dict(adj)
+            self._pairs = pairs
+            self._linked = dict(linked)
+            self._adj_edge_count = len(self.edges)
+        return self._adj
+
+    @property
+    def edges_by_pair(self) -> dict[frozenset[str], list[GraphEdge]]:
+        """Edges grouped by the (unordered) pair of nodes they connect."""
+        self._adjacency()
+        return self._pairs
 
     def neighbors(self, node_name: str) -> list[tuple[str, GraphEdge]]:
         """Get all neighbors of a node with their connecting edges."""
-        result = []
-        for edge in self.edges:
-            if edge.from_node == node_name:
-                result.append((edge.to_node, edge))
-            elif edge.to_node == node_name:
-                result.append((edge.from_node, edge))
-        return result
+        return list(self._adjacency().get(node_name, ()))
 
     def has_path(self, start: str, end: str) -> bool:
         """Check if a path exists between two nodes (BFS)."""
@@ -73,10 +121,12 @@ class ConnectivityGraph:
         if start == end:
             return True
         visited = {start}
-        queue = [start]
+        queue = deque([start])
+        self._adjacency()
+        linked = self._linked
         while queue:
-            current = queue.pop(0)
-            for neighbor, _ in self.neighbors(current):
+            current = queue.popleft()
+            for neighbor in linked.get(current, ()):
                 if neighbor == end:
                     return True
                 if neighbor not in visited:
@@ -89,10 +139,12 @@ class ConnectivityGraph:
         if start not in self.nodes:
             return set()
         visited = {start}
-        queue = [start]
+        queue = deque([start])
+        self._adjacency()
+        linked = self._linked
         while queue:
-            current = queue.pop(0)
-            for neighbor, _ in self.neighbors(current):
+            current = queue.popleft()
+            for neighbor in linked.get(current, ()):
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append(neighbor)
@@ -102,7 +154,7 @@ class ConnectivityGraph:
 # ── Zone: intermediate representation for spatial matching ───────────
 
 
-@dataclass
+@dataclass(slots=True)
 class _Zone:
     """A bounded area used for point-in-polygon containment tests."""
 
@@ -110,6 +162,111 @@ class _Zone:
     zone_type: str
     vertices: list[tuple[float, float]]  # polygon vertices as (x, y) tuples
     area: float
+    bbox: tuple[float, float, float, float] = field(init=False)  # (min_x, min_y, max_x, max_y)
+
+    def __post_init__(self) -> None:
+        xs = [v[0] for v in self.vertices]
+        ys = [v[1] for v in self.vertices]
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    def bbox_contains(self, px: float, py: float, margin: float = 0.0) -> bool:
+        """Cheap reject test before the full polygon check."""
+        min_x, min_y, max_x, max_y = self.bbox
+        return (min_x - margin <= px <= max_x + margin
+                and min_y - margin <= py <= max_y + margin)
+
+
+class _ZoneIndex:
+    """Uniform grid over zone bounding boxes for door-probe queries.
+
+    Each zone is registered in every cell its bounding box overlaps, so a
+    probe only tests zones whose boxes can contain it instead of all zones
+    on the storey. Cells are sized to the median zone extent.
+
+    Zones are kept sorted by area (smallest first, stable), so candidate
+    lists come out in the order used to resolve overlaps.
+    """
+
+    def __init__(self, zones: list[_Zone]) -> None:
+        self.zones = sorted(zones, key=lambda z: z.area)
+        extents = sorted(
+            max(z.bbox[2] - z.bbox[0], z.bbox[3] - z.bbox[1]) for z in zones
+        )
+        median = extents[len(extents) // 2] if extents else 0.0
+        self.cell_size = median if median > 0.01 else 1.0
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        for i, zone in enumerate(self.zones):
+            min_x, min_y, max_x, max_y = zone.bbox
+            for cx in range(self._cell(min_x), self._cell(max_x) + 1):
+                for cy in range(self._cell(min_y), self._cell(max_y) + 1):
+                    self._cells.setdefault((cx, cy), []).append(i)
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.cell_size)
+
+    def candidates(self, px: float, py: float, margin: float = 0.0) -> list[_Zone]:
+        """Zones whose grid cells cover the point (± margin), smallest first."""
+        if margin <= 0.0:
+            hits = self._cells.get((self._cell(px), self._cell(py)), [])
+            return [self.zones[i] for i in hits]
+        found: set[int] = set()
+        for cx in range(self._cell(px - margin), self._cell(px + margin) + 1):
+            for cy in range(self._cell(py - margin), self._cell(py + margin) + 1):
+                found.update(self._cells.get((cx, cy), ()))
+        return [self.zones[i] for i in sorted(found)]
+
+
+@dataclass
+class _ZoneBuffer:
+    """All zone polygons in one flat vertex buffer (CSR-style layout).
+
+    Vertices of zone i are ``xs[offsets[i]:offsets[i + 1]]`` (same for
+    ``ys``). ``prev_xs``/``prev_ys`` hold each vertex's predecessor within
+    its own ring, so edge k runs prev[k] → vertex[k]. This lets the
+    ray-cast for many probe points against every zone run as one NumPy pass.
+    """
+
+    xs: np.ndarray
+    ys: np.ndarray
+    prev_xs: np.ndarray
+    prev_ys: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def from_zones(cls, zones: list[_Zone]) -> _ZoneBuffer:
+        """Pack zone vertices into contiguous coordinate arrays."""
+        counts = [len(z.vertices) for z in zones]
+        offsets = np.zeros(len(zones) + 1, dtype=np.intp)
+        np.cumsum(counts, out=offsets[1:])
+        coords = np.array(
+            [v for z in zones for v in z.vertices], dtype=np.float64
+        ).reshape(-1, 2)
+        prev_index = np.arange(len(coords)) - 1
+        # First vertex of each ring wraps around to that ring's last vertex
+        prev_index[offsets[:-1]] = offsets[1:] - 1
+        return cls(
+            xs=coords[:, 0],
+            ys=coords[:, 1],
+            prev_xs=coords[prev_index, 0],
+            prev_ys=coords[prev_index, 1],
+            offsets=offsets,
+        )
+
+    def contains(self, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        """Ray-casting containment of P points in all Z zones → (P, Z) bool."""
+        n_zones = len(self.offsets) - 1
+        if n_zones == 0 or len(px) == 0:
+            return np.zeros((len(px), n_zones), dtype=bool)
+        py_col = py[:, None]
+        straddles = (self.ys > py_col) != (self.prev_ys > py_col)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = (
+                (self.prev_xs - self.xs) * (py_col - self.ys)
+                / (self.prev_ys - self.ys) + self.xs
+            )
+        crossings = straddles & (px[:, None] < x_cross)
+        counts = np.add.reduceat(crossings.astype(np.intp), self.offsets[:-1], axis=1)
+        return (counts & 1).astype(bool)
 
 
 def _point_in_polygon(px: float, py: float, vertices: list[tuple[float, float]]) -> bool:
@@ -118,15 +275,15 @@ def _point_in_polygon(px: float, py: float, vertices: list[tuple[float, float]])
     Returns True if point (px, py) is inside the polygon defined by vertices.
     Vertices should be ordered (CW or CCW).
     """
-    n = len(vertices)
+    if not vertices:
+        return False
     inside = False
-    j = n - 1
-    for i in range(n):
-        xi, yi = vertices[i]
-        xj, yj = vertices[j]
+    # Walk edges as (previous, current) pairs — avoids per-vertex indexing
+    xj, yj = vertices[-1]
+    for xi, yi in vertices:
         if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
             inside = not inside
-        j = i
+        xj, yj = xi, yi
     return inside
 
 
@@ -136,33 +293,42 @@ def _point_in_polygon_with_tolerance(
     """Point-in-polygon with edge tolerance.
 
     Also returns True if the point is within `tolerance` of any edge.
+    Crossing parity and edge distances are checked in a single pass over
+    the edges, using squared distances (no sqrt).
     """
-    if _point_in_polygon(px, py, vertices):
-        return True
-    # Check distance to edges
-    n = len(vertices)
-    for i in range(n):
-        x1, y1 = vertices[i]
-        x2, y2 = vertices[(i + 1) % n]
-        dist = _point_to_segment_distance(px, py, x1, y1, x2, y2)
-        if dist <= tolerance:
+    if not vertices:
+        return False
+    tol_sq = tolerance * tolerance
+    inside = False
+    xj, yj = vertices[-1]
+    for xi, yi in vertices:
+        if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
+            inside = not inside
+        # Close to any edge counts as a hit regardless of parity
+        if _point_to_segment_distance_sq(px, py, xj, yj, xi, yi) <= tol_sq:
             return True
-    return False
+        xj, yj = xi, yi
+    return inside
 
 
-def _point_to_segment_distance(
+def _point_to_segment_distance_sq(
     px: float, py: float, x1: float, y1: float, x2: float, y2: float
 ) -> float:
-    """Distance from point (px,py) to line segment (x1,y1)-(x2,y2)."""
+    """Squared distance from point (px,py) to line segment (x1,y1)-(x2,y2)."""
     dx = x2 - x1
     dy = y2 - y1
     length_sq = dx * dx + dy * dy
     if length_sq < 1e-12:
-        return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-    t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
-    proj_x = x1 + t * dx
-    proj_y = y1 + t * dy
-    return math.sqrt((px - proj_x) ** 2 + (py - proj_y) ** 2)
+        ex, ey = px - x1, py - y1
+        return ex * ex + ey * ey
+    t = ((px - x1) * dx + (py - y1) * dy) / length_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    ex = px - (x1 + t * dx)
+    ey = py - (y1 + t * dy)
+    return ex * ex + ey * ey
 
 
 # ── Zone synthesis from walls ────────────────────────────────────────
@@ -176,15 +342,24 @@ def _synthesize_common_zones(story: Story) -> list[_Zone]:
     """
     zones: list[_Zone] = []
 
-    # Group walls by area type — use precise matching
-    corridor_walls = [w for w in story.walls
-                     if (w.name or "").lower().startswith("corridor")]
-    lobby_walls = [w for w in story.walls
-                  if (w.name or "").lower().startswith("lobby")]
-    elevator_walls = [w for w in story.walls
-                     if (w.name or "").lower().startswith("elevator")]
-    vestibule_walls = [w for w in story.walls
-                      if "vestibule" in (w.name or "").lower()]
+    # Group walls by area type in one pass — use precise matching
+    corridor_walls: list[Wall] = []
+    lobby_walls: list[Wall] = []
+    elevator_walls: list[Wall] = []
+    vestibule_walls: list[Wall] = []
+    divider_walls: list[Wall] = []
+    for w in story.walls:
+        lower = (w.name or "").lower()
+        if lower.startswith("corridor"):
+            corridor_walls.append(w)
+        if lower.startswith("lobby"):
+            lobby_walls.append(w)
+        if lower.startswith("elevator"):
+            elevator_walls.append(w)
+        if "vestibule" in lower:
+            vestibule_walls.append(w)
+        if lower.startswith("core divider"):
+            divider_walls.append(w)
 
     # Corridor zone
     if corridor_walls:
@@ -194,22 +369,18 @@ def _synthesize_common_zones(story: Story) -> list[_Zone]:
 
     # Lobby zone (ground floor)
     if lobby_walls:
-        all_xs = []
-        all_ys = []
-        for w in lobby_walls:
-            all_xs.extend([w.start.x, w.end.x])
-            all_ys.extend([w.start.y, w.end.y])
+        min_x, _, max_x, max_y = _walls_bbox(lobby_walls)
         min_y = 0.0  # Lobby starts at ground level
         zone = _Zone(
             name="Lobby",
             zone_type="lobby",
             vertices=[
-                (min(all_xs), min_y),
-                (max(all_xs), min_y),
-                (max(all_xs), max(all_ys)),
-                (min(all_xs), max(all_ys)),
+                (min_x, min_y),
+                (max_x, min_y),
+                (max_x, max_y),
+                (min_x, max_y),
             ],
-            area=(max(all_xs) - min(all_xs)) * (max(all_ys) - min_y),
+            area=(max_x - min_x) * (max_y - min_y),
         )
         zones.append(zone)
 
@@ -222,10 +393,9 @@ def _synthesize_common_zones(story: Story) -> list[_Zone]:
 
     # Elevator zone
     if elevator_walls:
-        divider_walls = [w for w in story.walls
-                        if (w.name or "").lower().startswith("core divider")]
+        elevator_ids = {id(w) for w in elevator_walls}
         combined = elevator_walls + [w for w in divider_walls
-                                     if w not in elevator_walls]
+                                     if id(w) not in elevator_ids]
         zone = _zone_from_walls(combined, "Elevator", "elevator")
         if zone:
             zones.append(zone)
@@ -243,17 +413,21 @@ def _synthesize_common_zones(story: Story) -> list[_Zone]:
     return zones
 
 
+def _walls_bbox(walls: list[Wall]) -> tuple[float, float, float, float]:
+    """Bounding box (min_x, min_y, max_x, max_y) over all wall endpoints."""
+    coords = np.empty((len(walls), 4))
+    for i, w in enumerate(walls):
+        coords[i] = (w.start.x, w.start.y, w.end.x, w.end.y)
+    xs = coords[:, 0::2]
+    ys = coords[:, 1::2]
+    return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+
 def _zone_from_walls(walls: list[Wall], name: str, zone_type: str) -> Optional[_Zone]:
     """Create a rectangular zone from the bounding box of a set of walls."""
     if not walls:
         return None
-    all_xs = []
-    all_ys = []
-    for w in walls:
-        all_xs.extend([w.start.x, w.end.x])
-        all_ys.extend([w.start.y, w.end.y])
-    min_x, max_x = min(all_xs), max(all_xs)
-    min_y, max_y = min(all_ys), max(all_ys)
+    min_x, min_y, max_x, max_y = _walls_bbox(walls)
     width = max_x - min_x
     height = max_y - min_y
     if width < 0.01 or height < 0.01:
@@ -274,38 +448,62 @@ def _zone_from_walls(walls: list[Wall], name: str, zone_type: str) -> Optional[_
 # ── Door-to-zone matching ───────────────────────────────────────────
 
 
-def _door_center_2d(door: Door, wall: Wall) -> tuple[float, float]:
-    """Compute the 2D position of a door's center on its host wall."""
-    dx = wall.end.x - wall.start.x
-    dy = wall.end.y - wall.start.y
-    length = math.sqrt(dx * dx + dy * dy)
-    if length < 1e-9:
-        return (wall.start.x, wall.start.y)
-    # Door center is at (position + width/2) along the wall
-    t = (door.position + door.width / 2) / length
-    return (
-        wall.start.x + dx * t,
-        wall.start.y + dy * t,
-    )
+# Wall-name keywords marking walls that bound common areas
+_COMMON_WALL_KEYWORDS = ("core", "corridor", "staircase", "elevator", "vestibule", "lobby")
+
+
+@dataclass
+class _WallGeometry:
+    """Direction, length and normal of a wall, shared by all its doors."""
+
+    start_x: float
+    start_y: float
+    dx: float
+    dy: float
+    length: float
+    nx: float  # unit normal (perpendicular, left-hand side)
+    ny: float
+    is_common: bool  # wall name marks it as a common-area wall
+    is_external: bool
+
+    def door_center(self, door: Door) -> tuple[float, float]:
+        """Compute the 2D position of a door's center on this wall."""
+        if self.length < 1e-9:
+            return (self.start_x, self.start_y)
+        # Door center is at (position + width/2) along the wall
+        t = (door.position + door.width / 2) / self.length
+        return (
+            self.start_x + self.dx * t,
+            self.start_y + self.dy * t,
+        )
 
 
-def _wall_normal(wall: Wall) -> tuple[float, float]:
-    """Compute the unit normal of a wall (perpendicular, left-hand side)."""
+def _wall_geometry(wall: Wall, is_external: bool) -> _WallGeometry:
+    """Compute a wall's direction vector, length and unit normal once."""
     dx = wall.end.x - wall.start.x
     dy = wall.end.y - wall.start.y
     length = math.sqrt(dx * dx + dy * dy)
     if length < 1e-9:
-        return (0.0, 1.0)
-    # Normal is perpendicular: (-dy, dx) normalized
-    return (-dy / length, dx / length)
+        nx, ny = 0.0, 1.0
+    else:
+        # Normal is perpendicular: (-dy, dx) normalized
+        nx, ny = -dy / length, dx / length
+    name_lower = (wall.name or "").lower()
+    return _WallGeometry(
+        start_x=wall.start.x, start_y=wall.start.y,
+        dx=dx, dy=dy, length=length, nx=nx, ny=ny,
+        is_common=any(kw in name_lower for kw in _COMMON_WALL_KEYWORDS),
+        is_external=is_external,
+    )
 
 
 def _find_zone_at_point(
     px: float,
     py: float,
-    zones: list[_Zone],
+    zones: list[_Zone] | _ZoneIndex,
     tolerance: float = 0.15,
     prefer_common: bool = False,
+    exact_matches: Optional[list[_Zone]] = None,
 ) -> Optional[str]:
     """Find which zone contains a given point.
 
@@ -315,22 +513,35 @@ def _find_zone_at_point(
 
     Args:
         px, py: Point to check.
-        zones: List of zones to search.
+        zones: Zones to search, or a spatial index over them.
         tolerance: Edge tolerance.
         prefer_common: When True, prefer common-area zones over apartment spaces.
                        Use this for doors on common-area walls.
+        exact_matches: Zones already known to contain the point (e.g. from
+                       a batched _ZoneBuffer test); skips the exact pass.
+                       Must be in the index's area order.
     """
     _COMMON_TYPES = {"corridor", "vestibule", "lobby", "elevator", "staircase"}
 
+    # Index candidates are already smallest-first; plain lists get sorted
+    presorted = isinstance(zones, _ZoneIndex)
+    if isinstance(zones, _ZoneIndex):
+        # Margin covers the tolerance pass below
+        zones = zones.candidates(px, py, tolerance)
+
     # Collect all matching zones
-    matches: list[_Zone] = []
-    for zone in zones:
-        if _point_in_polygon(px, py, zone.vertices):
-            matches.append(zone)
+    if exact_matches is not None:
+        matches = list(exact_matches)
+    else:
+        matches = []
+        for zone in zones:
+            if zone.bbox_contains(px, py) and _point_in_polygon(px, py, zone.vertices):
+                matches.append(zone)
 
     if not matches:
         for zone in zones:
-            if _point_in_polygon_with_tolerance(px, py, zone.vertices, tolerance):
+            if (zone.bbox_contains(px, py, tolerance)
+                    and _point_in_polygon_with_tolerance(px, py, zone.vertices, tolerance)):
                 matches.append(zone)
 
     if not matches:
@@ -344,11 +555,13 @@ def _find_zone_at_point(
         # Prefer common-area zones for doors on common-area walls
         common = [z for z in matches if z.zone_type in _COMMON_TYPES]
         if common:
-            common.sort(key=lambda z: z.area)
+            if not presorted:
+                common.sort(key=lambda z: z.area)
             return common[0].name
 
     # Default: prefer smallest zone (most specific)
-    matches.sort(key=lambda z: z.area)
+    if not presorted:
+        matches.sort(key=lambda z: z.area)
     return matches[0].name
 
 
@@ -422,41 +635,65 @@ def build_connectivity_graph(
         storey=storey_name,
     )
 
-    # 3. Build wall ID -> Wall lookup
-    wall_map = {w.global_id: w for w in story.walls}
-
-    # 4. For each door, find which two zones it connects
-    _COMMON_WALL_KEYWORDS = {"core", "corridor", "staircase", "elevator", "vestibule", "lobby"}
-
+    # 3. Build per-wall geometry (shared by all doors on the same wall)
+    #    and a spatial index over zones
+    external_ids = story.external_wall_ids()
+    wall_geom = {
+        w.global_id: _wall_geometry(w, w.global_id in external_ids) for w in story.walls
+    }
+    zone_index = _ZoneIndex(zones)
+    footprint = _Footprint.from_story(story, external_ids)
+
+    # 4. Step to both sides of each door's wall
+    probes: list[tuple[Door, _WallGeometry, tuple[float, float], tuple[float, float]]] = []
     for door in story.doors:
-        wall = wall_map.get(door.wall_id)
-        if wall is None:
+        geom = wall_geom.get(door.wall_id)
+        if geom is None:
             continue
 
         # Compute door center and wall normal
-        cx, cy = _door_center_2d(door, wall)
-        nx, ny = _wall_normal(wall)
+        cx, cy = geom.door_center(door)
+        nx, ny = geom.nx, geom.ny
 
-        # Step to both sides of the wall
         side_a = (cx + nx * step_distance, cy + ny * step_distance)
         side_b = (cx - nx * step_distance, cy - ny * step_distance)
-
+        probes.append((door, geom, side_a, side_b))
+
+    # 5. Test every probe point against every zone in one pass
+    points = np.array(
+        [side for _, _, a, b in probes for side in (a, b)], dtype=np.float64
+    ).reshape(-1, 2)
+    # (buffer follows the index's area order so hits come out smallest-first)
+    buffer = _ZoneBuffer.from_zones(zone_index.zones)
+    inside = buffer.contains(points[:, 0], points[:, 1])
+    hits: list[list[_Zone]] = [[] for _ in range(len(points))]
+    rows, cols = np.nonzero(inside)
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        hits[row].append(zone_index.zones[col])
+
+    # 6. For each door, find which two zones it connects
+    for k, (door, geom, side_a, side_b) in enumerate(probes):
         # For doors on common-area walls, prefer common-area zones
         # when resolving overlap ambiguities
-        wall_name_lower = (wall.name or "").lower()
-        is_common_wall = any(kw in wall_name_lower for kw in _COMMON_WALL_KEYWORDS)
-
-        zone_a = _find_zone_at_point(side_a[0], side_a[1], zones, prefer_common=is_common_wall)
-        zone_b = _find_zone_at_point(side_b[0], side_b[1], zones, prefer_common=is_common_wall)
-
-        # If a side has no zone, check if it's exterior
-        # (the point is outside the building footprint)
-        if zone_a is None:
-            if _is_outside_building(side_a[0], side_a[1], story):
-                zone_a = "Exterior"
-        if zone_b is None:
-            if _is_outside_building(side_b[0], side_b[1], story):
-                zone_b = "Exterior"
+        is_common_wall = geom.is_common
+
+        found: list[Optional[str]] = []
+        for (px, py), exact in ((side_a, hits[2 * k]), (side_b, hits[2 * k + 1])):
+            # Facade doors: a probe that no zone contains and that lies
+            # outside the footprint is Exterior — skip the zone search
+            if geom.is_external and not exact and footprint.is_outside(px, py):
+                found.append("Exterior")
+                continue
+            zone_name = _find_zone_at_point(
+                px, py, zone_index, prefer_common=is_common_wall,
+                exact_matches=exact,
+            )
+            # If a side has no zone, check if it's exterior
+            # (the point is outside the building footprint)
+            if zone_name is None and footprint.is_outside(px, py):
+                zone_name = "Exterior"
+            found.append(zone_name)
+        zone_a, zone_b = found
 
         # Create edge if we found two different zones
         from_node = zone_a or "Unknown"
@@ -477,7 +714,7 @@ def build_connectivity_graph(
             )
 
         if from_node != "Unknown" and to_node != "Unknown":
-            graph.edges.append(GraphEdge(
+            graph.add_edge(GraphEdge(
                 door_name=door.name or "unnamed",
                 door_width=door.width,
                 from_node=from_node,
@@ -487,31 +724,59 @@ def build_connectivity_graph(
     return graph
 
 
-def _is_outside_building(px: float, py: float, story: Story) -> bool:
-    """Check if a point is outside the building footprint.
+@dataclass
+class _Footprint:
+    """Building outline used to classify probe points as exterior.
 
-    Uses the exterior walls to determine the building outline.
-    Falls back to checking against all slab outlines.
+    Built once per storey so each door probe costs a few comparisons
+    instead of re-deriving the outline from the walls.
     """
-    # Try using exterior walls bounding box
-    ext_walls = [w for w in story.walls if w.is_external]
-    if ext_walls:
-        all_xs = []
-        all_ys = []
-        for w in ext_walls:
-            all_xs.extend([w.start.x, w.end.x])
-            all_ys.extend([w.start.y, w.end.y])
-        min_x, max_x = min(all_xs), max(all_xs)
-        min_y, max_y = min(all_ys), max(all_ys)
-        # Point is outside if beyond the exterior wall bounding box
-        margin = 0.01
-        return (px < min_x - margin or px > max_x + margin or
-                py < min_y - margin or py > max_y + margin)
-
-    # Fallback: use floor slab outlines
-    for slab in story.slabs:
-        if slab.is_floor:
-            verts = [(v.x, v.y) for v in slab.outline.vertices]
+
+    ext_bbox: Optional[tuple[float, float, float, float]]  # exterior walls (min_x, min_y, max_x, max_y)
+    floor_outlines: list[list[tuple[float, float]]]  # fallback when no exterior walls
+
+    @classmethod
+    def from_story(
+        cls, story: Story, external_ids: Optional[frozenset[str]] = None
+    ) -> _Footprint:
+        """Derive the footprint from exterior walls, else floor slabs."""
+        if external_ids is None:
+            external_ids = story.external_wall_ids()
+        ext_walls = [w for w in story.walls if w.global_id in external_ids]
+        if ext_walls:
+            ends = np.array(
+                [(w.start.x, w.start.y, w.end.x, w.end.y) for w in ext_walls],
+                dtype=np.float64,
+            ).reshape(-1, 2, 2)
+            lo = ends.min(axis=(0, 1))
+            hi = ends.max(axis=(0, 1))
+            return cls(
+                ext_bbox=(float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])),
+                floor_outlines=[],
+            )
+        return cls(
+            ext_bbox=None,
+            floor_outlines=[
+                [(v.x, v.y) for v in slab.outline.vertices]
+                for slab in story.slabs if slab.is_floor
+            ],
+        )
+
+    def is_outside(self, px: float, py: float) -> bool:
+        """Check if a point is outside the building footprint.
+
+        Uses the exterior walls to determine the building outline.
+        Falls back to checking against all slab outlines.
+        """
+        if self.ext_bbox is not None:
+            min_x, min_y, max_x, max_y = self.ext_bbox
+            # Point is outside if beyond the exterior wall bounding box
+            margin = 0.01
+            return (px < min_x - margin or px > max_x + margin or
+                    py < min_y - margin or py > max_y + margin)
+
+        # Fallback: use floor slab outlines
+        for verts in self.floor_outlines:
             if _point_in_polygon(px, py, verts):
                 return False
-    return True
+        return True
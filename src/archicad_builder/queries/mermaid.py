@@ -27,9 +27,20 @@ _NODE_SHAPES = {
 _DEFAULT_SHAPE = ("[", "]")  # rectangle for living, bedroom, etc.
 
 
+_ID_TABLE = str.maketrans({" ": "_", "-": "_", ".": "_"})
+
+
 def _sanitize_id(name: str) -> str:
     """Convert a space name to a valid Mermaid node ID."""
-    return name.replace(" ", "_").replace("-", "_").replace(".", "_")
+    return name.translate(_ID_TABLE)
+
+
+def _node_id(cache: dict[str, str], name: str) -> str:
+    """Sanitized node ID for a name, memoized in ``cache``."""
+    node_id = cache.get(name)
+    if node_id is None:
+        node_id = cache[name] = _sanitize_id(name)
+    return node_id
 
 
 def graph_to_mermaid(
@@ -48,10 +59,11 @@ def graph_to_mermaid(
         Mermaid flowchart string.
     """
     lines = [f"flowchart {direction}"]
+    node_ids: dict[str, str] = {}
 
     # Define nodes with appropriate shapes
     for name, node in sorted(graph.nodes.items()):
-        node_id = _sanitize_id(name)
+        node_id = node_ids[name] = _sanitize_id(name)
         label = name
         if show_area and node.area > 0:
             label += f"\\n{node.area:.1f}m²"
@@ -59,22 +71,16 @@ def graph_to_mermaid(
         left, right = _NODE_SHAPES.get(node.node_type, _DEFAULT_SHAPE)
         lines.append(f"    {node_id}{left}\"{label}\"{right}")
 
-    # Define edges with door labels
+    # Define edges with door labels — one line per connected pair,
+    # parallel doors between the same two rooms share the line
     lines.append("")
-    seen_edges: set[tuple[str, str]] = set()
-    for edge in graph.edges:
-        from_id = _sanitize_id(edge.from_node)
-        to_id = _sanitize_id(edge.to_node)
-
-        # Avoid duplicate edges
-        edge_key = tuple(sorted((from_id, to_id)))
-        if edge_key in seen_edges:
-            # Still add if it's a different door
-            pass
-        seen_edges.add(edge_key)
-
-        door_label = edge.door_name or "door"
-        door_label += f" {edge.door_width:.1f}m"
+    for edges in graph.edges_by_pair.values():
+        first = edges[0]
+        from_id = _node_id(node_ids, first.from_node)
+        to_id = _node_id(node_ids, first.to_node)
+        door_label = ", ".join(
+            f"{edge.door_name or 'door'} {edge.door_width:.1f}m" for edge in edges
+        )
         lines.append(f"    {from_id} -->|\"{door_label}\"| {to_id}")
 
     return "\n".join(lines)
@@ -89,9 +95,10 @@ def graph_to_mermaid_simple(graph: ConnectivityGraph) -> str:
     lines = [f"%% {graph.storey} — Room Connectivity"]
     lines.append("flowchart LR")
 
+    node_ids: dict[str, str] = {}
     for edge in graph.edges:
-        from_id = _sanitize_id(edge.from_node)
-        to_id = _sanitize_id(edge.to_node)
+        from_id = _node_id(node_ids, edge.from_node)
+        to_id = _node_id(node_ids, edge.to_node)
         door_label = f"{edge.door_name} {edge.door_width:.1f}m"
         lines.append(f"    {from_id} -->|\"{door_label}\"| {to_id}")
 
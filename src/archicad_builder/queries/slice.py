@@ -11,10 +11,12 @@ import math
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+import numpy as np
+
 from archicad_builder.models.building import Building, Story
 from archicad_builder.models.elements import Door, Wall, Window
 from archicad_builder.models.geometry import Point2D
-from archicad_builder.models.spaces import Apartment, Space
+from archicad_builder.models.spaces import Space
 
 
 @dataclass
@@ -105,29 +107,47 @@ def extract_apartment(
     min_y = min(v.y for v in verts) - tolerance
     max_y = max(v.y for v in verts) + tolerance
 
-    # Find walls within or touching the apartment boundary
-    apt_walls: list[Wall] = []
-    for wall in story.walls:
-        if _wall_in_bbox(wall, min_x, max_x, min_y, max_y):
-            # Check if this wall is interior to the apartment
-            # or a boundary wall (shared with neighbors/exterior)
-            is_apt_wall = _is_apartment_wall(wall, apt, tolerance)
-            is_boundary = wall.is_external or _is_corridor_wall(wall)
+    # Find walls within or touching the apartment boundary — evaluated for
+    # all walls at once as boolean masks
+    starts, ends = _wall_endpoints(story.walls)
+    mids = (starts + ends) / 2
+    in_bbox = (
+        _in_bbox(starts, min_x, max_x, min_y, max_y)
+        | _in_bbox(ends, min_x, max_x, min_y, max_y)
+        | _in_bbox(mids, min_x, max_x, min_y, max_y)
+    )
 
-            if is_apt_wall or (include_shared_walls and is_boundary):
-                apt_walls.append(wall)
+    # A wall belongs to the apartment if its name matches the apartment
+    # name, or its midpoint lies inside the apartment boundary
+    apt_name_lower = apt.name.lower()
+    name_match = np.array(
+        [apt_name_lower in (w.name or "").lower() for w in story.walls], dtype=bool
+    )
+    is_apt_wall = name_match | _points_in_polygon(
+        mids[:, 0], mids[:, 1], [(v.x, v.y) for v in verts]
+    )
+    keep = in_bbox & is_apt_wall
+    if include_shared_walls:
+        # Boundary walls are shared with neighbors/exterior
+        external_ids = story.external_wall_ids()
+        is_boundary = np.array(
+            [w.global_id in external_ids or _is_corridor_wall(w) for w in story.walls],
+            dtype=bool,
+        )
+        keep |= in_bbox & is_boundary
+    apt_walls: list[Wall] = [story.walls[i] for i in np.flatnonzero(keep)]
 
     # Find doors on the apartment's walls
-    wall_ids = {w.global_id for w in apt_walls}
+    wall_by_id = {w.global_id: w for w in apt_walls}
     apt_doors: list[Door] = []
     for door in story.doors:
-        if door.wall_id in wall_ids:
+        if door.wall_id in wall_by_id:
             apt_doors.append(door)
 
     # Find windows on the apartment's walls
     apt_windows: list[Window] = []
     for window in story.windows:
-        if window.wall_id in wall_ids:
+        if window.wall_id in wall_by_id:
             apt_windows.append(window)
 
     # Build rooms list
@@ -156,12 +176,9 @@ def extract_apartment(
     # Build doors list
     doors = []
     for door in apt_doors:
-        wall_name = next(
-            (w.name for w in apt_walls if w.global_id == door.wall_id), "?"
-        )
         doors.append({
             "name": door.name,
-            "wall": wall_name,
+            "wall": wall_by_id[door.wall_id].name,
             "position": door.position,
             "width": door.width,
             "height": door.height,
@@ -170,12 +187,9 @@ def extract_apartment(
     # Build windows list
     windows = []
     for window in apt_windows:
-        wall_name = next(
-            (w.name for w in apt_walls if w.global_id == window.wall_id), "?"
-        )
         windows.append({
             "name": window.name,
-            "wall": wall_name,
+            "wall": wall_by_id[window.wall_id].name,
             "position": window.position,
             "width": window.width,
             "height": window.height,
@@ -197,43 +211,20 @@ def extract_apartment(
 # ── Helpers ──────────────────────────────────────────────────────────
 
 
-def _wall_in_bbox(
-    wall: Wall, min_x: float, max_x: float, min_y: float, max_y: float
-) -> bool:
-    """Check if any part of a wall is within a bounding box."""
-    # Wall is in bbox if either endpoint is inside, or the wall crosses the bbox
-    def point_in_bbox(x: float, y: float) -> bool:
-        return min_x <= x <= max_x and min_y <= y <= max_y
-
-    if point_in_bbox(wall.start.x, wall.start.y):
-        return True
-    if point_in_bbox(wall.end.x, wall.end.y):
-        return True
-    # Check midpoint too
-    mid_x = (wall.start.x + wall.end.x) / 2
-    mid_y = (wall.start.y + wall.end.y) / 2
-    return point_in_bbox(mid_x, mid_y)
-
-
-def _is_apartment_wall(wall: Wall, apt: Apartment, tolerance: float) -> bool:
-    """Check if a wall belongs to a specific apartment.
-
-    A wall belongs to the apartment if it's an interior partition wall
-    whose name matches the apartment name, or if it's geometrically
-    contained within the apartment boundary.
-    """
-    apt_name_lower = apt.name.lower()
-    wall_name_lower = (wall.name or "").lower()
+def _wall_endpoints(walls: list[Wall]) -> tuple[np.ndarray, np.ndarray]:
+    """Wall start and end points as two (W, 2) arrays."""
+    starts = np.array([(w.start.x, w.start.y) for w in walls], dtype=np.float64)
+    ends = np.array([(w.end.x, w.end.y) for w in walls], dtype=np.float64)
+    return starts.reshape(-1, 2), ends.reshape(-1, 2)
 
-    # Name-based match
-    if apt_name_lower in wall_name_lower:
-        return True
 
-    # Geometric containment: wall midpoint inside apartment boundary
-    mid_x = (wall.start.x + wall.end.x) / 2
-    mid_y = (wall.start.y + wall.end.y) / 2
-    verts = [(v.x, v.y) for v in apt.boundary.vertices]
-    return _point_in_polygon(mid_x, mid_y, verts)
+def _in_bbox(
+    points: np.ndarray, min_x: float, max_x: float, min_y: float, max_y: float
+) -> np.ndarray:
+    """Mask of (N, 2) points inside a bounding box (inclusive)."""
+    xs = points[:, 0]
+    ys = points[:, 1]
+    return (min_x <= xs) & (xs <= max_x) & (min_y <= ys) & (ys <= max_y)
 
 
 def _is_corridor_wall(wall: Wall) -> bool:
@@ -241,15 +232,15 @@ def _is_corridor_wall(wall: Wall) -> bool:
     return "corridor" in (wall.name or "").lower()
 
 
-def _point_in_polygon(px: float, py: float, vertices: list[tuple[float, float]]) -> bool:
-    """Ray-casting point-in-polygon test."""
-    n = len(vertices)
-    inside = False
-    j = n - 1
-    for i in range(n):
-        xi, yi = vertices[i]
-        xj, yj = vertices[j]
-        if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
-            inside = not inside
-        j = i
+def _points_in_polygon(
+    px: np.ndarray, py: np.ndarray, vertices: list[tuple[float, float]]
+) -> np.ndarray:
+    """Ray-casting point-in-polygon test for many points at once."""
+    inside = np.zeros(len(px), dtype=bool)
+    xj, yj = vertices[-1]
+    for xi, yi in vertices:
+        if yi != yj:
+            straddles = (yi > py) != (yj > py)
+            inside ^= straddles & (px < (xj - xi) * (py - yi) / (yj - yi) + xi)
+        xj, yj = xi, yi
     return inside
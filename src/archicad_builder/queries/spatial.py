@@ -7,15 +7,18 @@ needed to understand and fix the issue.
 from __future__ import annotations
 
 import math
+from collections import defaultdict
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from archicad_builder.models.building import Building, Story
 from archicad_builder.models.elements import Wall, Door, Window, Slab, Staircase
 from archicad_builder.models.geometry import Point2D
 from archicad_builder.models.spaces import Apartment, Space
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Neighbor:
     """A neighboring element."""
     element_type: str  # "wall", "door", "window", "staircase", "space", "apartment"
@@ -25,7 +28,7 @@ class Neighbor:
     relationship: str  # "connected", "adjacent", "overlapping", "nearby"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerticalMatch:
     """An element aligned vertically across floors."""
     story_name: str
@@ -77,40 +80,67 @@ def find_neighbors(
     neighbors: list[Neighbor] = []
 
     # Find the target element and its reference point
-    target_center = _find_element_center(story, element_id)
-    if target_center is None:
+    target = story.get_element(element_id)
+    if target is None:
         return []
+    target_center = target.center
 
     # Search walls — use minimum distance from any reference point
     # (target could be a center or endpoint of a long wall)
-    target_ref_points = _get_element_ref_points(story, element_id)
-
-    for wall in story.walls:
+    if isinstance(target, Wall):
+        target_ref_points = [target.start, target.end, target.center]
+    else:
+        target_ref_points = [target_center]
+
+    # Bucket wall points into a grid so only walls with a point in the
+    # cells around a ref point get the exact distance check
+    wall_index = _SpatialIndex(max_distance)
+    for i, wall in enumerate(story.walls):
+        wall_index.insert(i, wall.start.x, wall.start.y)
+        wall_index.insert(i, wall.end.x, wall.end.y)
+        wall_index.insert(i, wall.center.x, wall.center.y)
+    wall_candidates: set[int] = set()
+    for tp in target_ref_points:
+        wall_candidates |= wall_index.query(tp.x, tp.y, max_distance)
+
+    # One (K, C, 3) distance matrix — K ref points × C candidate walls ×
+    # (start, end, center) — serves both the nearest-point and the
+    # endpoint reduction
+    # A wall whose center is farther from the target center than
+    # max_distance plus both half-lengths cannot have a point in range
+    # (triangle inequality); this drops the grid's outer-ring hits cheaply
+    reach = max_distance + 0.05
+    if isinstance(target, Wall):
+        reach += target.length / 2
+    candidates = []
+    for i in sorted(wall_candidates):
+        wall = story.walls[i]
         if wall.global_id == element_id:
             continue
-
-        # Check minimum distance from any target ref point to any wall point
-        wall_points = [wall.start, wall.end, Point2D(
-            x=(wall.start.x + wall.end.x) / 2,
-            y=(wall.start.y + wall.end.y) / 2,
-        )]
-
-        min_d = float("inf")
-        for tp in target_ref_points:
-            for wp in wall_points:
-                d = _distance(tp, wp)
-                if d < min_d:
-                    min_d = d
-
-        if min_d <= max_distance:
-            # Check for endpoint connections (shared corners)
-            endpoint_dist = float("inf")
-            for tp in target_ref_points:
-                for wp in [wall.start, wall.end]:
-                    d = _distance(tp, wp)
-                    if d < endpoint_dist:
-                        endpoint_dist = d
-
+        center = wall.center
+        if math.hypot(center.x - target_center.x, center.y - target_center.y) > (
+            reach + wall.length / 2
+        ):
+            continue
+        candidates.append(wall)
+    if candidates:
+        refs = np.array([(tp.x, tp.y) for tp in target_ref_points])
+        wall_pts = np.array([
+            ((w.start.x, w.start.y), (w.end.x, w.end.y), (w.center.x, w.center.y))
+            for w in candidates
+        ])
+        # Reduce on squared distances; sqrt is monotonic, so taking it
+        # after the min gives the same values with 2·C roots instead of 3·K·C
+        diff = refs[:, None, None, :] - wall_pts[None, :, :, :]
+        dist_sq = diff[..., 0] ** 2 + diff[..., 1] ** 2
+        min_ds = np.sqrt(dist_sq.min(axis=(0, 2))).tolist()
+        endpoint_ds = np.sqrt(dist_sq[:, :, :2].min(axis=(0, 2))).tolist()
+
+        for wall, min_d, endpoint_dist in zip(candidates, min_ds, endpoint_ds):
+            if min_d > max_distance:
+                continue
+
+            # Endpoint connections (shared corners) first
             rel = "nearby"
             if endpoint_dist < 0.05:
                 rel = "connected"
@@ -126,38 +156,35 @@ def find_neighbors(
             ))
 
     # Search spaces
-    all_spaces = list(story.spaces)
-    for apt in story.apartments:
-        all_spaces.extend(apt.spaces)
+    all_spaces = story.all_spaces
 
-    for space in all_spaces:
+    space_d = _distances_to([sp.center for sp in all_spaces], target_center)
+    for i in np.flatnonzero(space_d <= max_distance).tolist():
+        space = all_spaces[i]
         if space.global_id == element_id:
             continue
-        space_center = _polygon_center(space.boundary.vertices)
-        d = _distance(target_center, space_center)
-        if d <= max_distance:
-            neighbors.append(Neighbor(
-                element_type="space",
-                element_id=space.global_id,
-                element_name=space.name,
-                distance=d,
-                relationship="adjacent" if d < 1.0 else "nearby",
-            ))
+        d = float(space_d[i])
+        neighbors.append(Neighbor(
+            element_type="space",
+            element_id=space.global_id,
+            element_name=space.name,
+            distance=d,
+            relationship="adjacent" if d < 1.0 else "nearby",
+        ))
 
     # Search staircases
-    for staircase in story.staircases:
+    stair_d = _distances_to([st.center for st in story.staircases], target_center)
+    for i in np.flatnonzero(stair_d <= max_distance).tolist():
+        staircase = story.staircases[i]
         if staircase.global_id == element_id:
             continue
-        sc = _polygon_center(staircase.outline.vertices)
-        d = _distance(target_center, sc)
-        if d <= max_distance:
-            neighbors.append(Neighbor(
-                element_type="staircase",
-                element_id=staircase.global_id,
-                element_name=staircase.name,
-                distance=d,
-                relationship="nearby",
-            ))
+        neighbors.append(Neighbor(
+            element_type="staircase",
+            element_id=staircase.global_id,
+            element_name=staircase.name,
+            distance=float(stair_d[i]),
+            relationship="nearby",
+        ))
 
     neighbors.sort(key=lambda n: n.distance)
     return neighbors
@@ -184,46 +211,40 @@ def find_above_below(
         List of vertically aligned elements on other floors.
     """
     target_story = building._require_story(story_name)
-    target_center = _find_element_center(target_story, element_id)
-    if target_center is None:
+    target = target_story.get_element(element_id)
+    if target is None:
         return []
+    target_center = target.center
 
-    matches: list[VerticalMatch] = []
-
+    # Gather wall and staircase centers of every other story into one
+    # buffer (walls before staircases within each story, stories in order)
+    # so all distances come from a single vectorized pass
+    candidates: list[tuple[Story, Wall | Staircase]] = []
     for story in building.stories:
         if story.name == story_name:
             continue
+        candidates.extend((story, wall) for wall in story.walls)
+        candidates.extend((story, st) for st in story.staircases)
 
-        # Check walls
-        for wall in story.walls:
-            wall_center = Point2D(
-                x=(wall.start.x + wall.end.x) / 2,
-                y=(wall.start.y + wall.end.y) / 2,
-            )
-            d = _distance(target_center, wall_center)
-            if d <= tolerance:
-                quality = "exact" if d < 0.05 else ("close" if d < 0.2 else "offset")
-                matches.append(VerticalMatch(
-                    story_name=story.name,
-                    element_type="wall",
-                    element_id=wall.global_id,
-                    element_name=wall.name,
-                    alignment_quality=quality,
-                ))
-
-        # Check staircases
-        for staircase in story.staircases:
-            sc = _polygon_center(staircase.outline.vertices)
-            d = _distance(target_center, sc)
-            if d <= tolerance:
-                quality = "exact" if d < 0.05 else "close"
-                matches.append(VerticalMatch(
-                    story_name=story.name,
-                    element_type="staircase",
-                    element_id=staircase.global_id,
-                    element_name=staircase.name,
-                    alignment_quality=quality,
-                ))
+    dist = _distances_to([element.center for _, element in candidates], target_center)
+
+    matches: list[VerticalMatch] = []
+    for i in np.flatnonzero(dist <= tolerance).tolist():
+        story, element = candidates[i]
+        d = dist[i]
+        if isinstance(element, Wall):
+            element_type = "wall"
+            quality = "exact" if d < 0.05 else ("close" if d < 0.2 else "offset")
+        else:
+            element_type = "staircase"
+            quality = "exact" if d < 0.05 else "close"
+        matches.append(VerticalMatch(
+            story_name=story.name,
+            element_type=element_type,
+            element_id=element.global_id,
+            element_name=element.name,
+            alignment_quality=quality,
+        ))
 
     return matches
 
@@ -246,20 +267,26 @@ def extract_floor_context(
     """
     story = building._require_story(story_name)
 
-    external_walls = [w.name for w in story.walls if w.is_external and w.name]
-    bearing_walls = [w.name for w in story.walls if w.load_bearing and w.name]
-    floor_area = sum(s.area for s in story.slabs if s.is_floor)
-
+    # One pass over the walls for both name lists
+    external_walls: list[str] = []
+    bearing_walls: list[str] = []
+    for w in story.walls:
+        if w.name:
+            if w.is_external:
+                external_walls.append(w.name)
+            if w.load_bearing:
+                bearing_walls.append(w.name)
+    floor_area = story.floor_area
+
+    # One pass over the apartments for summaries and the room count
     apt_summaries = []
+    space_count = len(story.spaces)
     for apt in story.apartments:
         room_types = [s.room_type.value for s in apt.spaces]
         apt_summaries.append(
             f"{apt.name}: {apt.area:.1f}m², {len(apt.spaces)} rooms ({', '.join(room_types)})"
         )
-
-    all_spaces = list(story.spaces)
-    for apt in story.apartments:
-        all_spaces.extend(apt.spaces)
+        space_count += len(apt.spaces)
 
     return FloorContext(
         story_name=story.name,
@@ -270,7 +297,7 @@ def extract_floor_context(
         slab_count=len(story.slabs),
         staircase_count=len(story.staircases),
         apartment_count=len(story.apartments),
-        space_count=len(all_spaces),
+        space_count=space_count,
         total_floor_area=floor_area,
         external_wall_names=external_walls,
         bearing_wall_names=bearing_walls,
@@ -278,50 +305,44 @@ def extract_floor_context(
     )
 
 
-def _get_element_ref_points(story: Story, element_id: str) -> list[Point2D]:
-    """Get reference points for an element (endpoints + center for walls)."""
-    for wall in story.walls:
-        if wall.global_id == element_id:
-            return [
-                wall.start,
-                wall.end,
-                Point2D(x=(wall.start.x + wall.end.x) / 2,
-                        y=(wall.start.y + wall.end.y) / 2),
-            ]
-    center = _find_element_center(story, element_id)
-    return [center] if center else []
-
-
-def _find_element_center(story: Story, element_id: str) -> Point2D | None:
-    """Find the center point of an element by its GlobalId."""
-    for wall in story.walls:
-        if wall.global_id == element_id:
-            return Point2D(
-                x=(wall.start.x + wall.end.x) / 2,
-                y=(wall.start.y + wall.end.y) / 2,
-            )
-    for staircase in story.staircases:
-        if staircase.global_id == element_id:
-            return _polygon_center(staircase.outline.vertices)
-    for space in story.spaces:
-        if space.global_id == element_id:
-            return _polygon_center(space.boundary.vertices)
-    for apt in story.apartments:
-        if apt.global_id == element_id:
-            return _polygon_center(apt.boundary.vertices)
-        for space in apt.spaces:
-            if space.global_id == element_id:
-                return _polygon_center(space.boundary.vertices)
-    return None
-
-
-def _polygon_center(vertices: list[Point2D]) -> Point2D:
-    """Centroid of a polygon's vertices."""
-    cx = sum(v.x for v in vertices) / len(vertices)
-    cy = sum(v.y for v in vertices) / len(vertices)
-    return Point2D(x=cx, y=cy)
+class _SpatialIndex:
+    """Uniform grid bucketing item indices by the cells of their points.
 
+    A radius query returns every item with a point within ``radius`` of
+    the query point (plus some that are slightly farther), so callers
+    still run their exact distance check on the candidates.
+    """
 
-def _distance(p1: Point2D, p2: Point2D) -> float:
-    """Euclidean distance between two points."""
-    return math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2)
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size if cell_size > 0 else 1.0
+        self._cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+
+    def _key(self, x: float, y: float) -> tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, item: int, x: float, y: float) -> None:
+        """Register a point belonging to item."""
+        bucket = self._cells[self._key(x, y)]
+        if not bucket or bucket[-1] != item:
+            bucket.append(item)
+
+    def query(self, x: float, y: float, radius: float) -> set[int]:
+        """Items with a point in any cell within radius of (x, y)."""
+        # One extra ring of cells absorbs floor() rounding at cell borders
+        reach = int(max(radius, 0.0) / self.cell_size) + 1
+        cx, cy = self._key(x, y)
+        found: set[int] = set()
+        for i in range(cx - reach, cx + reach + 1):
+            for j in range(cy - reach, cy + reach + 1):
+                bucket = self._cells.get((i, j))
+                if bucket:
+                    found.update(bucket)
+        return found
+
+
+def _distances_to(points: list[Point2D], target: Point2D) -> np.ndarray:
+    """Distance from target to each point, as a (N,) array."""
+    if not points:
+        return np.empty(0)
+    xy = np.array([(p.x, p.y) for p in points])
+    return np.sqrt((xy[:, 0] - target.x) ** 2 + (xy[:, 1] - target.y) ** 2)
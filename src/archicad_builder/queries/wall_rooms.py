@@ -8,13 +8,15 @@ how to fix wall positions, add doors, etc.
 
 from __future__ import annotations
 
-import math
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
 from archicad_builder.models.building import Building, Story
 from archicad_builder.models.elements import Wall, Window
-from archicad_builder.models.geometry import Point2D
+from archicad_builder.models.geometry import Polygon2D
 from archicad_builder.models.spaces import Apartment, RoomType, Space
 
 
@@ -48,18 +50,10 @@ def get_room_walls(
         List of walls that form the room's boundary.
     """
     story = building._require_story(storey_name)
-    space = _find_space(story, room_name)
+    space = story.get_space_by_name(room_name)
     if space is None:
         return []
-
-    boundary_edges = _get_polygon_edges(space.boundary.vertices)
-    result: list[Wall] = []
-
-    for wall in story.walls:
-        if _wall_touches_boundary(wall, boundary_edges, tolerance):
-            result.append(wall)
-
-    return result
+    return _room_walls(story, space, tolerance)
 
 
 def get_wall_rooms(
@@ -88,28 +82,62 @@ def get_wall_rooms(
     if wall is None:
         return (None, None)
 
-    # Compute wall center and normal
-    cx = (wall.start.x + wall.end.x) / 2
-    cy = (wall.start.y + wall.end.y) / 2
-    dx = wall.end.x - wall.start.x
-    dy = wall.end.y - wall.start.y
-    length = math.sqrt(dx * dx + dy * dy)
-    if length < 1e-9:
+    sides = _wall_side_points(wall, step_distance)
+    if sides is None:
         return (None, None)
-    nx, ny = -dy / length, dx / length  # Normal (perpendicular)
-
-    # Step to both sides
-    side_a = (cx + nx * step_distance, cy + ny * step_distance)
-    side_b = (cx - nx * step_distance, cy - ny * step_distance)
 
-    # Check all spaces
-    all_spaces = _collect_all_spaces(story)
-    room_a = _find_containing_space(side_a[0], side_a[1], all_spaces)
-    room_b = _find_containing_space(side_b[0], side_b[1], all_spaces)
+    # Check all spaces, both side points at once
+    room_a, room_b = _find_containing_spaces(np.array(sides), story.all_spaces)
 
     return (room_a, room_b)
 
 
+def get_story_wall_rooms(
+    building: Building,
+    storey_name: str,
+    step_distance: float = 0.3,
+) -> list[WallRoomRelation]:
+    """Get the rooms on each side of every wall of a storey.
+
+    Same result as calling get_wall_rooms for each wall, but the side
+    points of all walls are resolved against the spaces in one batch,
+    so the per-space bounding boxes are built and tested once per floor.
+
+    Args:
+        building: The building model.
+        storey_name: Storey to search.
+        step_distance: How far to step from each wall.
+
+    Returns:
+        One WallRoomRelation per wall, in wall order.
+    """
+    story = building._require_story(storey_name)
+
+    points: list[tuple[float, float]] = []
+    point_walls: list[int] = []
+    for i, wall in enumerate(story.walls):
+        sides = _wall_side_points(wall, step_distance)
+        if sides is not None:
+            points.extend(sides)
+            point_walls.append(i)
+
+    rooms: dict[int, tuple[Optional[str], Optional[str]]] = {}
+    if points:
+        found = _find_containing_spaces(np.array(points), story.all_spaces)
+        for k, i in enumerate(point_walls):
+            rooms[i] = (found[2 * k], found[2 * k + 1])
+
+    return [
+        WallRoomRelation(
+            wall_name=wall.name,
+            wall_id=wall.global_id,
+            side_a=rooms.get(i, (None, None))[0],
+            side_b=rooms.get(i, (None, None))[1],
+        )
+        for i, wall in enumerate(story.walls)
+    ]
+
+
 def get_room_exterior_walls(
     building: Building,
     storey_name: str,
@@ -152,196 +180,212 @@ def get_room_windows(
         List of windows on the room's boundary walls.
     """
     story = building._require_story(storey_name)
-    space = _find_space(story, room_name)
+    space = story.get_space_by_name(room_name)
     if space is None:
         return []
 
-    walls = get_room_walls(building, storey_name, room_name, tolerance)
+    walls = _room_walls(story, space, tolerance)
     wall_map = {w.global_id: w for w in walls}
 
-    result: list[Window] = []
-    room_verts = [(v.x, v.y) for v in space.boundary.vertices]
-
+    # Centers of the windows hosted on the room's walls
+    candidates: list[Window] = []
+    centers: list[tuple[float, float]] = []
     for window in story.windows:
         wall = wall_map.get(window.wall_id)
         if wall is None:
             continue
-        # Check if the window's center position falls within the room
         win_center = _element_center_on_wall(
             wall, window.position, window.width
         )
-        if win_center and _point_in_polygon_with_tolerance(
-            win_center[0], win_center[1], room_verts, tolerance
-        ):
-            result.append(window)
+        if win_center:
+            candidates.append(window)
+            centers.append(win_center)
+    if not candidates:
+        return []
 
-    return result
+    # Check which window centers fall within the room, all at once
+    inside = _points_in_polygon_with_tolerance(
+        np.array(centers), space.boundary, tolerance
+    )
+    return [w for w, hit in zip(candidates, inside.tolist()) if hit]
 
 
 def _element_center_on_wall(
     wall: Wall, position: float, width: float
 ) -> tuple[float, float] | None:
     """Compute the 2D center of an element placed on a wall."""
-    dx = wall.end.x - wall.start.x
-    dy = wall.end.y - wall.start.y
-    length = math.sqrt(dx * dx + dy * dy)
+    length = wall.length
     if length < 1e-9:
         return None
     t = (position + width / 2) / length
+    dx = wall.end.x - wall.start.x
+    dy = wall.end.y - wall.start.y
     return (wall.start.x + dx * t, wall.start.y + dy * t)
 
 
-def _point_in_polygon_with_tolerance(
-    px: float, py: float, vertices: list[tuple[float, float]], tolerance: float
-) -> bool:
-    """Point-in-polygon with edge tolerance."""
-    if _point_in_polygon(px, py, vertices):
-        return True
-    # Check distance to edges
-    n = len(vertices)
-    for i in range(n):
-        x1, y1 = vertices[i]
-        x2, y2 = vertices[(i + 1) % n]
-        dist = _point_to_segment_dist(px, py, x1, y1, x2, y2)
-        if dist <= tolerance:
-            return True
-    return False
-
-
-def _point_to_segment_dist(
-    px: float, py: float, x1: float, y1: float, x2: float, y2: float
-) -> float:
-    """Distance from point to line segment."""
+def _points_in_polygon_with_tolerance(
+    points: np.ndarray, polygon: Polygon2D, tolerance: float
+) -> np.ndarray:
+    """Point-in-polygon with edge tolerance for (P, 2) points, as a (P,) bool array.
+
+    A point matches if the ray cast puts it inside, or if it lies within
+    tolerance of any edge.
+    """
+    verts = np.array(polygon.coords)
+    inside = _points_in_polygon(points, verts)
+    if inside.all():
+        return inside
+
+    # Squared distance from every point to every edge segment
+    edges = _get_polygon_edges(polygon)
+    x1, y1, x2, y2 = (edges[None, :, k] for k in range(4))
+    px, py = points[:, 0, None], points[:, 1, None]
     dx = x2 - x1
     dy = y2 - y1
     length_sq = dx * dx + dy * dy
-    if length_sq < 1e-12:
-        return math.sqrt((px - x1) ** 2 + (py - y1) ** 2)
-    t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
-    proj_x = x1 + t * dx
-    proj_y = y1 + t * dy
-    return math.sqrt((px - proj_x) ** 2 + (py - proj_y) ** 2)
+    degenerate = length_sq < 1e-12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.clip(((px - x1) * dx + (py - y1) * dy) / length_sq, 0.0, 1.0)
+    t = np.where(degenerate, 0.0, t)
+    dist_sq = (px - (x1 + t * dx)) ** 2 + (py - (y1 + t * dy)) ** 2
+    near_edge = (dist_sq <= tolerance * tolerance).any(axis=1)
+    return np.asarray(inside | near_edge)
 
 
 # ── Internal helpers ─────────────────────────────────────────────────
 
 
-def _find_space(story: Story, room_name: str) -> Optional[Space]:
-    """Find a space by name in a story (including inside apartments)."""
-    for space in story.spaces:
-        if space.name.lower() == room_name.lower():
-            return space
-    for apt in story.apartments:
-        for space in apt.spaces:
-            if space.name.lower() == room_name.lower():
-                return space
-    return None
-
-
-def _collect_all_spaces(story: Story) -> list[Space]:
-    """Collect all spaces from a story (top-level + apartment rooms)."""
-    spaces = list(story.spaces)
-    for apt in story.apartments:
-        spaces.extend(apt.spaces)
-    return spaces
-
-
-def _get_polygon_edges(
-    vertices: list[Point2D],
-) -> list[tuple[tuple[float, float], tuple[float, float]]]:
-    """Get edges of a polygon as list of ((x1,y1), (x2,y2)) tuples."""
-    n = len(vertices)
-    edges = []
-    for i in range(n):
-        j = (i + 1) % n
-        edges.append((
-            (vertices[i].x, vertices[i].y),
-            (vertices[j].x, vertices[j].y),
-        ))
-    return edges
-
-
-def _wall_touches_boundary(
-    wall: Wall,
-    boundary_edges: list[tuple[tuple[float, float], tuple[float, float]]],
+def _room_walls(story: Story, space: Space, tolerance: float) -> list[Wall]:
+    """Walls of a story that overlap the boundary of an already-resolved space."""
+    boundary_edges = _get_polygon_edges(space.boundary)
+    touches = _walls_touching_boundary(story.walls, boundary_edges, tolerance)
+    return [wall for wall, hit in zip(story.walls, touches.tolist()) if hit]
+
+
+def _wall_side_points(
+    wall: Wall, step_distance: float
+) -> Optional[tuple[tuple[float, float], tuple[float, float]]]:
+    """Points step_distance off the wall center along +normal and -normal."""
+    if wall.length < 1e-9:
+        return None
+    cx, cy = wall.center.x, wall.center.y
+    nx, ny = wall.unit_normal
+    return (
+        (cx + nx * step_distance, cy + ny * step_distance),
+        (cx - nx * step_distance, cy - ny * step_distance),
+    )
+
+
+def _get_polygon_edges(polygon: Polygon2D) -> np.ndarray:
+    """Edges of a closed polygon as an (E, 4) array of [x1, y1, x2, y2] rows."""
+    xy = np.array(polygon.coords)
+    return np.hstack([xy, np.roll(xy, -1, axis=0)])
+
+
+def _walls_touching_boundary(
+    walls: list[Wall],
+    boundary_edges: np.ndarray,
     tolerance: float,
-) -> bool:
-    """Check if a wall segment overlaps with any boundary edge.
+) -> np.ndarray:
+    """For each wall, whether it overlaps any boundary edge, as a (W,) bool array.
 
     A wall "touches" a boundary if:
     1. The wall is approximately parallel to a boundary edge
     2. The wall is within tolerance distance of the edge
     3. There is significant overlap in the parallel direction
+
+    Every wall is tested against every edge in one broadcast (W, E)
+    pass. Each pair is classified the same way a scalar check would:
+    both roughly horizontal first, then both roughly vertical, otherwise
+    the general midpoint-distance test.
     """
-    wall_seg = ((wall.start.x, wall.start.y), (wall.end.x, wall.end.y))
+    if not walls or len(boundary_edges) == 0:
+        return np.zeros(len(walls), dtype=bool)
+    segs = np.array([(w.start.x, w.start.y, w.end.x, w.end.y) for w in walls])
+    x1a, y1a, x1b, y1b = (segs[:, k, None] for k in range(4))
+    x2a, y2a, x2b, y2b = (boundary_edges[None, :, k] for k in range(4))
+
+    mid1x, mid1y = (x1a + x1b) / 2, (y1a + y1b) / 2
+    mid2x, mid2y = (x2a + x2b) / 2, (y2a + y2b) / 2
+
+    # Both horizontal — check y-distance and x-overlap
+    horizontal = (np.abs(y1a - y1b) < tolerance) & (np.abs(y2a - y2b) < tolerance)
+    x_overlap = (
+        np.minimum(np.maximum(x1a, x1b), np.maximum(x2a, x2b))
+        - np.maximum(np.minimum(x1a, x1b), np.minimum(x2a, x2b))
+    )
+    horizontal_hit = (np.abs(mid1y - mid2y) <= tolerance) & (x_overlap > tolerance * 0.5)
+
+    # Both vertical — check x-distance and y-overlap
+    vertical = (np.abs(x1a - x1b) < tolerance) & (np.abs(x2a - x2b) < tolerance)
+    y_overlap = (
+        np.minimum(np.maximum(y1a, y1b), np.maximum(y2a, y2b))
+        - np.maximum(np.minimum(y1a, y1b), np.minimum(y2a, y2b))
+    )
+    vertical_hit = (np.abs(mid1x - mid2x) <= tolerance) & (y_overlap > tolerance * 0.5)
+
+    # General case: check if midpoints are close
+    general_hit = (mid1x - mid2x) ** 2 + (mid1y - mid2y) ** 2 < tolerance * tolerance
 
-    for edge in boundary_edges:
-        if _segments_overlap(wall_seg, edge, tolerance):
-            return True
-    return False
+    hit = np.where(
+        horizontal, horizontal_hit, np.where(vertical, vertical_hit, general_hit)
+    )
+    return np.asarray(hit.any(axis=1))
 
 
-def _segments_overlap(
-    seg1: tuple[tuple[float, float], tuple[float, float]],
-    seg2: tuple[tuple[float, float], tuple[float, float]],
-    tolerance: float,
-) -> bool:
-    """Check if two line segments are roughly parallel, close, and overlapping.
+def _find_containing_spaces(
+    points: np.ndarray, spaces: Sequence[Space]
+) -> list[Optional[str]]:
+    """Name of the first space containing each of the (P, 2) points, or None.
 
-    Works for axis-aligned and general segments.
+    A (P, S) bounding-box mask rejects most point/space pairs before any
+    ray cast; only spaces whose box holds a still-unresolved point are
+    tested, in their original order.
     """
-    (x1a, y1a), (x1b, y1b) = seg1
-    (x2a, y2a), (x2b, y2b) = seg2
-
-    # Check if both segments are approximately horizontal
-    if abs(y1a - y1b) < tolerance and abs(y2a - y2b) < tolerance:
-        # Both horizontal — check y-distance and x-overlap
-        if abs((y1a + y1b) / 2 - (y2a + y2b) / 2) > tolerance:
-            return False
-        # Check x-overlap
-        min1, max1 = min(x1a, x1b), max(x1a, x1b)
-        min2, max2 = min(x2a, x2b), max(x2a, x2b)
-        overlap = min(max1, max2) - max(min1, min2)
-        return overlap > tolerance * 0.5
-
-    # Check if both segments are approximately vertical
-    if abs(x1a - x1b) < tolerance and abs(x2a - x2b) < tolerance:
-        # Both vertical — check x-distance and y-overlap
-        if abs((x1a + x1b) / 2 - (x2a + x2b) / 2) > tolerance:
-            return False
-        # Check y-overlap
-        min1, max1 = min(y1a, y1b), max(y1a, y1b)
-        min2, max2 = min(y2a, y2b), max(y2a, y2b)
-        overlap = min(max1, max2) - max(min1, min2)
-        return overlap > tolerance * 0.5
-
-    # General case: check if midpoints are close
-    mid1 = ((x1a + x1b) / 2, (y1a + y1b) / 2)
-    mid2 = ((x2a + x2b) / 2, (y2a + y2b) / 2)
-    dist = math.sqrt((mid1[0] - mid2[0]) ** 2 + (mid1[1] - mid2[1]) ** 2)
-    return dist < tolerance
-
-
-def _find_containing_space(
-    px: float, py: float, spaces: list[Space]
-) -> Optional[str]:
-    """Find which space contains a given point."""
-    for space in spaces:
-        verts = [(v.x, v.y) for v in space.boundary.vertices]
-        if _point_in_polygon(px, py, verts):
-            return space.name
-    return None
-
-
-def _point_in_polygon(px: float, py: float, vertices: list[tuple[float, float]]) -> bool:
-    """Ray-casting point-in-polygon test."""
-    n = len(vertices)
-    inside = False
-    j = n - 1
-    for i in range(n):
-        xi, yi = vertices[i]
-        xj, yj = vertices[j]
-        if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
-            inside = not inside
-        j = i
-    return inside
+    found: list[Optional[str]] = [None] * len(points)
+    if not spaces or len(points) == 0:
+        return found
+    boxes = np.array([space.boundary.bbox for space in spaces])
+    px, py = points[:, 0, None], points[:, 1, None]
+    in_box = (
+        (boxes[:, 0] <= px) & (px <= boxes[:, 2])
+        & (boxes[:, 1] <= py) & (py <= boxes[:, 3])
+    )
+    pending = np.ones(len(points), dtype=bool)
+    for s in np.flatnonzero(in_box.any(axis=0)).tolist():
+        candidates = np.flatnonzero(pending & in_box[:, s])
+        if len(candidates) == 0:
+            continue
+        space = spaces[s]
+        if space.boundary.is_axis_aligned_rect:
+            # The ray cast reduces to a half-open box test for these
+            inside = (
+                (boxes[s, 0] <= px[candidates, 0]) & (px[candidates, 0] < boxes[s, 2])
+                & (boxes[s, 1] <= py[candidates, 0]) & (py[candidates, 0] < boxes[s, 3])
+            )
+        else:
+            verts = np.array(space.boundary.coords)
+            inside = _points_in_polygon(points[candidates], verts)
+        hits = candidates[inside]
+        for i in hits.tolist():
+            found[i] = space.name
+        pending[hits] = False
+        if not pending.any():
+            break
+    return found
+
+
+def _points_in_polygon(points: np.ndarray, vertices: np.ndarray) -> np.ndarray:
+    """Ray-casting point-in-polygon test for (P, 2) points against (V, 2) vertices.
+
+    Even-odd crossing rule, evaluated for all point/edge pairs at once;
+    returns a (P,) bool array.
+    """
+    xi, yi = vertices[:, 0], vertices[:, 1]
+    xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+    px, py = points[:, 0, None], points[:, 1, None]
+    straddles = (yi > py) != (yj > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = (xj - xi) * (py - yi) / (yj - yi) + xi
+    crossings = np.count_nonzero(straddles & (px < x_cross), axis=1)
+    return np.asarray(crossings % 2 == 1)
@@ -4,6 +4,7 @@ Per-story validators:
 - structural: door/window fits in wall, element references valid
 - connectivity: wall endpoint connections, gap detection
 - snap: auto-fix small endpoint gaps
+- story_arrays: struct-of-arrays wall columns shared by the geometric checks
 
 Building-level validators:
 - building: bearing wall alignment, staircase presence, slab completeness, wall closure
@@ -7,16 +7,25 @@ Cross-story validation that checks the building as a whole:
 - Wall closure (exterior walls form a closed perimeter)
 
 These complement the per-story validators in structural.py and connectivity.py.
+validate_all runs all of them, plus the building code checks, in one pass
+over the stories; validate_all_parallel spreads that pass over processes.
 """
 
 from __future__ import annotations
 
 import math
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
 
 from archicad_builder.models.building import Building, Story
-from archicad_builder.models.geometry import Point2D
-from archicad_builder.validators.structural import ValidationError
+from archicad_builder.validators.codes import validate_story_codes
+from archicad_builder.validators.connectivity import find_connections
+from archicad_builder.validators.story_arrays import StoryArrays, story_arrays
+from archicad_builder.validators.structural import ValidationError, validate_story
 
 
 def validate_building(building: Building) -> list[ValidationError]:
@@ -29,6 +38,89 @@ def validate_building(building: Building) -> list[ValidationError]:
     return errors
 
 
+def validate_all(building: Building) -> list[ValidationError]:
+    """Run the structural, connectivity, building and code validators in one pass.
+
+    Reports the same issues as ``validate_story`` + ``validate_connectivity``
+    per story, ``validate_building`` and ``validate_building_codes``
+    (default tolerances), but walks each story once: its StoryArrays are
+    built a single time and shared by the wall checks, and reused by the
+    cross-story bearing alignment pass at the end. Errors are grouped by
+    story rather than by check.
+    """
+    errors: list[ValidationError] = []
+    multi_storey = len(building.stories) >= 2
+    arrays: dict[int, StoryArrays] = {}
+
+    for story in building.stories:
+        sa = arrays[id(story)] = story_arrays(story)
+        errors.extend(_story_pass(story, building.global_id, multi_storey, sa))
+
+    stories = sorted(building.stories, key=lambda s: s.elevation)
+    errors.extend(_bearing_alignment_errors(
+        stories, [arrays[id(s)] for s in stories], 0.1,
+    ))
+    return errors
+
+
+def validate_all_parallel(
+    building: Building,
+    workers: int | None = None,
+) -> list[ValidationError]:
+    """``validate_all`` with the per-story checks spread over worker processes.
+
+    Stories share no mutable state during validation, so each one is
+    validated in its own process (the per-story checks are pure Python and
+    would serialise on the GIL in threads). Results are concatenated in
+    story order, then bearing alignment runs in the calling process, so the
+    output matches ``validate_all`` exactly. Worth it for buildings with
+    many large stories; for small ones process start-up dominates.
+
+    Args:
+        building: Building to validate.
+        workers: Worker process count (defaults to the CPU count).
+    """
+    multi_storey = len(building.stories) >= 2
+    for story in building.stories:
+        story.ensure_tags()  # tags must stick on the caller's stories
+
+    errors: list[ValidationError] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            _story_pass,
+            building.stories,
+            repeat(building.global_id),
+            repeat(multi_storey),
+        )
+        for story_errors in results:
+            errors.extend(story_errors)
+
+    stories = sorted(building.stories, key=lambda s: s.elevation)
+    errors.extend(_bearing_alignment_errors(
+        stories, [story_arrays(s) for s in stories], 0.1,
+    ))
+    return errors
+
+
+def _story_pass(
+    story: Story,
+    building_id: str,
+    multi_storey: bool,
+    sa: StoryArrays | None = None,
+) -> list[ValidationError]:
+    """All single-story checks of ``validate_all`` for one story."""
+    sa = sa if sa is not None else story_arrays(story)
+    errors: list[ValidationError] = []
+    errors.extend(validate_story(story))
+    errors.extend(find_connections(story, arrays=sa)[1])
+    if multi_storey:
+        errors.extend(_staircase_errors(building_id, story))
+    errors.extend(_slab_errors(story))
+    errors.extend(_wall_closure_errors(story, sa, 0.05))
+    errors.extend(validate_story_codes(story))
+    return errors
+
+
 def validate_bearing_wall_alignment(
     building: Building,
     tolerance: float = 0.1,
@@ -46,18 +138,44 @@ def validate_bearing_wall_alignment(
     Returns:
         Validation errors for misaligned bearing walls.
     """
-    errors: list[ValidationError] = []
     stories = sorted(building.stories, key=lambda s: s.elevation)
+    arrays = [story_arrays(s) for s in stories]
+    return _bearing_alignment_errors(stories, arrays, tolerance)
 
-    for i in range(1, len(stories)):
-        upper = stories[i]
-        lower = stories[i - 1]
 
-        upper_bearing = [w for w in upper.walls if w.load_bearing]
-        lower_bearing = [w for w in lower.walls if w.load_bearing]
+def _bearing_alignment_errors(
+    stories: list[Story],
+    arrays: list[StoryArrays],
+    tolerance: float,
+) -> list[ValidationError]:
+    """Bearing alignment check over stories sorted by elevation.
+
+    ``arrays`` holds each story's StoryArrays, index-aligned with ``stories``.
+    """
+    errors: list[ValidationError] = []
 
-        for wall in upper_bearing:
-            if not _has_aligned_wall(wall, lower_bearing, tolerance):
+    for i in range(1, len(stories)):
+        upper, up = stories[i], arrays[i]
+        lower, lo = stories[i - 1], arrays[i - 1]
+
+        lower_starts = lo.starts[lo.load_bearing]
+        lower_ends = lo.ends[lo.load_bearing]
+        # Bucket lower endpoints so each upper wall only tests walls with an
+        # endpoint near its own start (required in either orientation).
+        n_lower = len(lower_starts)
+        grid = _grid_index(np.concatenate([lower_starts, lower_ends]), tolerance)
+
+        upper_starts, upper_ends = up.starts, up.ends
+        for k in np.flatnonzero(up.load_bearing):
+            start, end = upper_starts[k], upper_ends[k]
+            near = sorted({
+                j % n_lower
+                for j in _grid_neighbors(grid, start[0], start[1], tolerance)
+            })
+            if not _has_aligned_wall(
+                start, end, lower_starts[near], lower_ends[near], tolerance
+            ):
+                wall = up.walls[k]
                 errors.append(
                     ValidationError(
                         severity="error",
@@ -75,26 +193,62 @@ def validate_bearing_wall_alignment(
     return errors
 
 
+def _grid_cell(x: float, y: float, cell: float) -> tuple[int, int]:
+    """Hash-grid cell containing a point."""
+    return (math.floor(x / cell), math.floor(y / cell))
+
+
+def _grid_index(
+    points: np.ndarray, cell: float,
+) -> defaultdict[tuple[int, int], list[int]]:
+    """Bucket the indices of (N, 2) points into a hash grid of square cells.
+
+    With ``cell`` equal to the match tolerance, every point within tolerance
+    of a query point lies in the query's cell or one of its 8 neighbours.
+    """
+    cell = cell if cell > 0 else 1.0
+    grid: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    for i, (x, y) in enumerate(points.tolist()):
+        grid[_grid_cell(x, y, cell)].append(i)
+    return grid
+
+
+def _grid_neighbors(
+    grid: dict[tuple[int, int], list[int]], x: float, y: float, cell: float,
+) -> list[int]:
+    """Indices of all points bucketed in the 3×3 cells around (x, y)."""
+    cell = cell if cell > 0 else 1.0
+    cx, cy = _grid_cell(x, y, cell)
+    found: list[int] = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            found.extend(grid.get((cx + dx, cy + dy), ()))
+    return found
+
+
 def _has_aligned_wall(
-    wall,
-    candidates: list,
+    start: np.ndarray,
+    end: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
     tolerance: float,
 ) -> bool:
-    """Check if a wall has a vertically aligned counterpart in the candidate list."""
-    for other in candidates:
-        # Check both orientations (wall could be defined start↔end either way)
-        if (_points_close(wall.start, other.start, tolerance)
-                and _points_close(wall.end, other.end, tolerance)):
-            return True
-        if (_points_close(wall.start, other.end, tolerance)
-                and _points_close(wall.end, other.start, tolerance)):
-            return True
-    return False
-
+    """Check if a wall has a vertically aligned counterpart among the candidates.
 
-def _points_close(p1: Point2D, p2: Point2D, tolerance: float) -> bool:
-    """Check if two points are within tolerance distance."""
-    return math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2) <= tolerance
+    ``start``/``end`` are the wall's endpoints; ``starts``/``ends`` hold the
+    candidate walls' endpoints as (N, 2) arrays, all tested in one broadcast.
+    """
+    if len(starts) == 0:
+        return False
+    tol_sq = tolerance * tolerance
+    d_ss = ((starts - start) ** 2).sum(axis=1)
+    d_ee = ((ends - end) ** 2).sum(axis=1)
+    d_se = ((ends - start) ** 2).sum(axis=1)
+    d_es = ((starts - end) ** 2).sum(axis=1)
+    # Check both orientations (wall could be defined start↔end either way)
+    same = (d_ss <= tol_sq) & (d_ee <= tol_sq)
+    flipped = (d_se <= tol_sq) & (d_es <= tol_sq)
+    return bool(np.any(same | flipped))
 
 
 def validate_has_staircase(building: Building) -> list[ValidationError]:
@@ -112,22 +266,28 @@ def validate_has_staircase(building: Building) -> list[ValidationError]:
         return errors  # Single-storey doesn't need stairs
 
     for story in building.stories:
-        if len(story.staircases) == 0:
-            errors.append(
-                ValidationError(
-                    severity="error",
-                    element_type="Building",
-                    element_id=building.global_id,
-                    message=(
-                        f"Multi-storey building has no staircase on '{story.name}'. "
-                        f"Every floor needs vertical circulation."
-                    ),
-                )
-            )
+        errors.extend(_staircase_errors(building.global_id, story))
 
     return errors
 
 
+def _staircase_errors(building_id: str, story: Story) -> list[ValidationError]:
+    """Missing-staircase check for one story of a multi-storey building."""
+    if story.staircases:
+        return []
+    return [
+        ValidationError(
+            severity="error",
+            element_type="Building",
+            element_id=building_id,
+            message=(
+                f"Multi-storey building has no staircase on '{story.name}'. "
+                f"Every floor needs vertical circulation."
+            ),
+        )
+    ]
+
+
 def validate_slab_completeness(building: Building) -> list[ValidationError]:
     """Check that every story has at least one floor slab.
 
@@ -140,20 +300,25 @@ def validate_slab_completeness(building: Building) -> list[ValidationError]:
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        floor_slabs = [s for s in story.slabs if s.is_floor]
-        if len(floor_slabs) == 0:
-            errors.append(
-                ValidationError(
-                    severity="error",
-                    element_type="Story",
-                    element_id=story.global_id,
-                    message=f"Story '{story.name}' has no floor slab.",
-                )
-            )
+        errors.extend(_slab_errors(story))
 
     return errors
 
 
+def _slab_errors(story: Story) -> list[ValidationError]:
+    """Floor-slab check for one story."""
+    if any(s.is_floor for s in story.slabs):
+        return []
+    return [
+        ValidationError(
+            severity="error",
+            element_type="Story",
+            element_id=story.global_id,
+            message=f"Story '{story.name}' has no floor slab.",
+        )
+    ]
+
+
 def validate_wall_closure(
     building: Building,
     tolerance: float = 0.05,
@@ -174,49 +339,76 @@ def validate_wall_closure(
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        external_walls = [w for w in story.walls if w.is_external]
-        if len(external_walls) < 3:
-            if external_walls:  # Has some external walls but not enough for closure
-                errors.append(
-                    ValidationError(
-                        severity="warning",
-                        element_type="Story",
-                        element_id=story.global_id,
-                        message=(
-                            f"Story '{story.name}' has only {len(external_walls)} "
-                            f"external walls — not enough for a closed perimeter."
-                        ),
-                    )
+        errors.extend(_wall_closure_errors(story, story_arrays(story), tolerance))
+
+    return errors
+
+
+def _wall_closure_errors(
+    story: Story, sa: StoryArrays, tolerance: float,
+) -> list[ValidationError]:
+    """Exterior perimeter closure check for one story."""
+    errors: list[ValidationError] = []
+    tol_sq = tolerance * tolerance
+
+    external = np.flatnonzero(sa.is_external)
+    if len(external) < 3:
+        if len(external):  # Has some external walls but not enough for closure
+            errors.append(
+                ValidationError(
+                    severity="warning",
+                    element_type="Story",
+                    element_id=story.global_id,
+                    message=(
+                        f"Story '{story.name}' has only {len(external)} "
+                        f"external walls — not enough for a closed perimeter."
+                    ),
                 )
-            continue
-
-        # Collect all endpoints of external walls
-        endpoints: list[tuple[Point2D, str, str]] = []  # (point, wall_name, "start"/"end")
-        for wall in external_walls:
-            endpoints.append((wall.start, wall.name or wall.global_id, "start"))
-            endpoints.append((wall.end, wall.name or wall.global_id, "end"))
-
-        # Each endpoint should be close to exactly one other endpoint
-        for point, wall_name, end_type in endpoints:
-            matches = 0
-            for other_point, other_name, other_end in endpoints:
-                if wall_name == other_name and end_type == other_end:
+            )
+        return errors
+
+    # All endpoints of external walls: start, end per wall
+    points = np.stack(
+        [sa.starts[external], sa.ends[external]], axis=1,
+    ).reshape(-1, 2)
+    # Unboxed float64 columns for the scalar neighbour scan below
+    xs = array("d", points[:, 0].tobytes())
+    ys = array("d", points[:, 1].tobytes())
+    labels = [
+        (sa.names[k], end_type)
+        for k in external.tolist()
+        for end_type in ("start", "end")
+    ]
+    grid = _grid_index(points, tolerance)
+    # Histogram of exact positions: most endpoints coincide exactly with
+    # another wall's, which needs no distance test at all.
+    at_point = Counter(zip(xs, ys))
+    at_point_self = Counter(zip(zip(xs, ys), labels))
+
+    # Each endpoint should be close to exactly one other endpoint
+    for x, y, label in zip(xs, ys, labels):
+        connected = at_point[x, y] > at_point_self[(x, y), label]
+        if not connected:
+            for j in _grid_neighbors(grid, x, y, tolerance):
+                if labels[j] == label:
                     continue  # Skip self
-                if _points_close(point, other_point, tolerance):
-                    matches += 1
+                if (x - xs[j]) ** 2 + (y - ys[j]) ** 2 <= tol_sq:
+                    connected = True
+                    break
 
-            if matches == 0:
-                errors.append(
-                    ValidationError(
-                        severity="error",
-                        element_type="Wall",
-                        element_id=wall_name,
-                        message=(
-                            f"External wall '{wall_name}' {end_type} endpoint "
-                            f"({point.x:.2f}, {point.y:.2f}) is not connected to "
-                            f"any other external wall on '{story.name}'."
-                        ),
-                    )
+        if not connected:
+            wall_name, end_type = label
+            errors.append(
+                ValidationError(
+                    severity="error",
+                    element_type="Wall",
+                    element_id=wall_name,
+                    message=(
+                        f"External wall '{wall_name}' {end_type} endpoint "
+                        f"({x:.2f}, {y:.2f}) is not connected to "
+                        f"any other external wall on '{story.name}'."
+                    ),
                 )
+            )
 
     return errors
@@ -16,11 +16,19 @@ Sources:
 from __future__ import annotations
 
 import math
+import re
+
+import numpy as np
 
 from archicad_builder.models.building import Building, Story
-from archicad_builder.models.geometry import Point2D
+from archicad_builder.models.elements import Wall
 from archicad_builder.validators.structural import ValidationError
 
+# Door classification by name, in one scan. Group 1 is set when "building" or
+# "main entry" appears anywhere (the lookahead is anchored, so it wins over an
+# earlier "entry"); a bare match on "entry" means an apartment entry door.
+_DOOR_TYPE_RE = re.compile(r"^(?=.*?(building|main entry))|entry", re.IGNORECASE | re.DOTALL)
+
 
 def validate_building_codes(building: Building) -> list[ValidationError]:
     """Run all building code validators."""
@@ -33,6 +41,21 @@ def validate_building_codes(building: Building) -> list[ValidationError]:
     return errors
 
 
+def validate_story_codes(story: Story) -> list[ValidationError]:
+    """Run all building code checks for a single story (default limits).
+
+    Same checks as ``validate_building_codes``, grouped by story instead of
+    by check, for single-pass validation (see ``validate_all``).
+    """
+    errors: list[ValidationError] = []
+    errors.extend(_corridor_width_errors(story, 1.20))
+    errors.extend(_fire_escape_errors(story, 35.0))
+    errors.extend(_staircase_dimension_errors(story))
+    errors.extend(_door_width_errors(story))
+    errors.extend(_ceiling_height_errors(story, 2.50))
+    return errors
+
+
 def validate_corridor_width(
     building: Building,
     min_width: float = 1.20,
@@ -45,33 +68,50 @@ def validate_corridor_width(
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        south_walls = [w for w in story.walls if "Corridor South" in (w.name or "")]
-        north_walls = [w for w in story.walls if "Corridor North" in (w.name or "")]
-
-        for sw in south_walls:
-            for nw in north_walls:
-                # Check if they're parallel and compute distance
-                # Assuming horizontal corridors: distance is |y_north - y_south|
-                sy = (sw.start.y + sw.end.y) / 2
-                ny = (nw.start.y + nw.end.y) / 2
-                corridor_width = abs(ny - sy)
-
-                # Subtract wall thicknesses (clear width)
-                clear_width = corridor_width - sw.thickness / 2 - nw.thickness / 2
-
-                if clear_width < min_width - 0.01:  # 1cm tolerance
-                    errors.append(
-                        ValidationError(
-                            severity="error",
-                            element_type="Corridor",
-                            element_id=sw.global_id,
-                            message=(
-                                f"Corridor on '{story.name}' has clear width "
-                                f"{clear_width:.2f}m — minimum is {min_width:.2f}m "
-                                f"(OIB RL 4)."
-                            ),
-                        )
-                    )
+        errors.extend(_corridor_width_errors(story, min_width))
+
+    return errors
+
+
+def _corridor_width_errors(story: Story, min_width: float) -> list[ValidationError]:
+    """Corridor width check for one story."""
+    errors: list[ValidationError] = []
+
+    south_walls: list[Wall] = []
+    north_walls: list[Wall] = []
+    for w in story.walls:
+        name = w.name or ""
+        if "Corridor South" in name:
+            south_walls.append(w)
+        if "Corridor North" in name:
+            north_walls.append(w)
+    if not south_walls or not north_walls:
+        return errors
+
+    # Assuming horizontal corridors: distance is |y_north - y_south|,
+    # evaluated for every south/north pair at once
+    sy = np.array([(w.start.y + w.end.y) / 2 for w in south_walls])
+    ny = np.array([(w.start.y + w.end.y) / 2 for w in north_walls])
+    s_half = np.array([w.thickness / 2 for w in south_walls])
+    n_half = np.array([w.thickness / 2 for w in north_walls])
+    corridor_width = np.abs(ny[None, :] - sy[:, None])
+
+    # Subtract wall thicknesses (clear width)
+    clear_width = corridor_width - s_half[:, None] - n_half[None, :]
+
+    for i, j in np.argwhere(clear_width < min_width - 0.01):  # 1cm tolerance
+        errors.append(
+            ValidationError(
+                severity="error",
+                element_type="Corridor",
+                element_id=south_walls[i].global_id,
+                message=(
+                    f"Corridor on '{story.name}' has clear width "
+                    f"{clear_width[i, j]:.2f}m — minimum is {min_width:.2f}m "
+                    f"(OIB RL 4)."
+                ),
+            )
+        )
 
     return errors
 
@@ -89,40 +129,44 @@ def validate_fire_escape_distance(
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        if not story.staircases:
-            continue  # has_staircase validator handles this
-
-        # Find staircase centers
-        stair_centers = []
-        for st in story.staircases:
-            cx = sum(v.x for v in st.outline.vertices) / len(st.outline.vertices)
-            cy = sum(v.y for v in st.outline.vertices) / len(st.outline.vertices)
-            stair_centers.append(Point2D(x=cx, y=cy))
-
-        # Check each apartment entry door
-        for apt in story.apartments:
-            apt_center = Point2D(
-                x=sum(v.x for v in apt.boundary.vertices) / len(apt.boundary.vertices),
-                y=sum(v.y for v in apt.boundary.vertices) / len(apt.boundary.vertices),
-            )
+        errors.extend(_fire_escape_errors(story, max_distance))
 
-            min_dist = min(
-                _distance(apt_center, sc) for sc in stair_centers
-            )
+    return errors
 
-            if min_dist > max_distance:
-                errors.append(
-                    ValidationError(
-                        severity="error",
-                        element_type="Apartment",
-                        element_id=apt.global_id,
-                        message=(
-                            f"'{apt.name}' on '{story.name}' is {min_dist:.1f}m "
-                            f"from nearest staircase — max allowed is {max_distance:.1f}m "
-                            f"(OIB RL 2 fire escape)."
-                        ),
-                    )
-                )
+
+def _fire_escape_errors(story: Story, max_distance: float) -> list[ValidationError]:
+    """Fire escape distance check for one story."""
+    errors: list[ValidationError] = []
+    max_dist_sq = max_distance * max_distance
+
+    if not story.staircases:
+        return errors  # has_staircase validator handles this
+
+    if not story.apartments:
+        return errors
+
+    # All apartment-to-staircase squared distances in one broadcast;
+    # centers are cached on their polygons
+    stairs = np.array([(st.center.x, st.center.y) for st in story.staircases])
+    apts = np.array([(apt.center.x, apt.center.y) for apt in story.apartments])
+    diff = apts[:, None, :] - stairs[None, :, :]
+    min_dist_sq = (diff * diff).sum(axis=-1).min(axis=1)
+
+    for k in np.flatnonzero(min_dist_sq > max_dist_sq):
+        apt = story.apartments[k]
+        min_dist = math.sqrt(min_dist_sq[k])
+        errors.append(
+            ValidationError(
+                severity="error",
+                element_type="Apartment",
+                element_id=apt.global_id,
+                message=(
+                    f"'{apt.name}' on '{story.name}' is {min_dist:.1f}m "
+                    f"from nearest staircase — max allowed is {max_distance:.1f}m "
+                    f"(OIB RL 2 fire escape)."
+                ),
+            )
+        )
 
     return errors
 
@@ -138,64 +182,73 @@ def validate_staircase_dimensions(building: Building) -> list[ValidationError]:
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        for st in story.staircases:
-            # Width check
-            if st.width < 1.20:
-                errors.append(
-                    ValidationError(
-                        severity="error",
-                        element_type="Staircase",
-                        element_id=st.global_id,
-                        message=(
-                            f"Staircase '{st.name}' on '{story.name}' has width "
-                            f"{st.width:.2f}m — minimum is 1.20m (OIB RL 4)."
-                        ),
-                    )
+        errors.extend(_staircase_dimension_errors(story))
+
+    return errors
+
+
+def _staircase_dimension_errors(story: Story) -> list[ValidationError]:
+    """Staircase dimension checks for one story."""
+    errors: list[ValidationError] = []
+
+    for st in story.staircases:
+        # Width check
+        if st.width < 1.20:
+            errors.append(
+                ValidationError(
+                    severity="error",
+                    element_type="Staircase",
+                    element_id=st.global_id,
+                    message=(
+                        f"Staircase '{st.name}' on '{story.name}' has width "
+                        f"{st.width:.2f}m — minimum is 1.20m (OIB RL 4)."
+                    ),
                 )
+            )
 
-            # Riser height check
-            if st.riser_height > 0.20:
-                errors.append(
-                    ValidationError(
-                        severity="error",
-                        element_type="Staircase",
-                        element_id=st.global_id,
-                        message=(
-                            f"Staircase '{st.name}' riser height {st.riser_height:.3f}m "
-                            f"exceeds maximum 0.200m (OIB RL 4)."
-                        ),
-                    )
+        # Riser height check
+        if st.riser_height > 0.20:
+            errors.append(
+                ValidationError(
+                    severity="error",
+                    element_type="Staircase",
+                    element_id=st.global_id,
+                    message=(
+                        f"Staircase '{st.name}' riser height {st.riser_height:.3f}m "
+                        f"exceeds maximum 0.200m (OIB RL 4)."
+                    ),
                 )
+            )
 
-            # Tread depth check
-            if st.tread_length < 0.23:
-                errors.append(
-                    ValidationError(
-                        severity="error",
-                        element_type="Staircase",
-                        element_id=st.global_id,
-                        message=(
-                            f"Staircase '{st.name}' tread depth {st.tread_length:.3f}m "
-                            f"is below minimum 0.230m (OIB RL 4)."
-                        ),
-                    )
+        # Tread depth check
+        if st.tread_length < 0.23:
+            errors.append(
+                ValidationError(
+                    severity="error",
+                    element_type="Staircase",
+                    element_id=st.global_id,
+                    message=(
+                        f"Staircase '{st.name}' tread depth {st.tread_length:.3f}m "
+                        f"is below minimum 0.230m (OIB RL 4)."
+                    ),
                 )
+            )
 
-            # Step formula: 2h + g should be 0.59-0.65m
-            step_sum = 2 * st.riser_height + st.tread_length
-            if step_sum < 0.59 or step_sum > 0.65:
-                errors.append(
-                    ValidationError(
-                        severity="warning",
-                        element_type="Staircase",
-                        element_id=st.global_id,
-                        message=(
-                            f"Staircase '{st.name}' step formula: "
-                            f"2×{st.riser_height:.3f} + {st.tread_length:.3f} = "
-                            f"{step_sum:.3f}m — should be 0.59-0.65m (comfort range)."
-                        ),
-                    )
+        # Step formula: 2h + g should be 0.59-0.65m
+        step_sum = 2 * st.riser_height + st.tread_length
+        if step_sum < 0.59 or step_sum > 0.65:
+            errors.append(
+                ValidationError(
+                    severity="warning",
+                    element_type="Staircase",
+                    element_id=st.global_id,
+                    message=(
+                        f"Staircase '{st.name}' step formula: "
+                        f"2×{st.riser_height:.3f} + {st.tread_length:.3f} = "
+                        f"{step_sum:.3f}m — should be 0.59-0.65m (comfort range)."
+                    ),
                 )
+            )
 
     return errors
 
@@ -210,32 +263,41 @@ def validate_door_widths(building: Building) -> list[ValidationError]:
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        for door in story.doors:
-            name = (door.name or "").lower()
-
-            if "building" in name or "main entry" in name:
-                min_width = 1.00
-                door_type = "building entry"
-            elif "entry" in name:
-                min_width = 0.90
-                door_type = "apartment entry"
-            else:
-                min_width = 0.80
-                door_type = "room"
-
-            if door.width < min_width - 0.01:
-                errors.append(
-                    ValidationError(
-                        severity="error",
-                        element_type="Door",
-                        element_id=door.global_id,
-                        message=(
-                            f"Door '{door.name}' on '{story.name}' is "
-                            f"{door.width:.2f}m wide — minimum for {door_type} "
-                            f"door is {min_width:.2f}m (OIB RL 4)."
-                        ),
-                    )
+        errors.extend(_door_width_errors(story))
+
+    return errors
+
+
+def _door_width_errors(story: Story) -> list[ValidationError]:
+    """Door width check for one story."""
+    errors: list[ValidationError] = []
+
+    for door in story.doors:
+        m = _DOOR_TYPE_RE.search(door.name or "")
+
+        if m and m.group(1):
+            min_width = 1.00
+            door_type = "building entry"
+        elif m:
+            min_width = 0.90
+            door_type = "apartment entry"
+        else:
+            min_width = 0.80
+            door_type = "room"
+
+        if door.width < min_width - 0.01:
+            errors.append(
+                ValidationError(
+                    severity="error",
+                    element_type="Door",
+                    element_id=door.global_id,
+                    message=(
+                        f"Door '{door.name}' on '{story.name}' is "
+                        f"{door.width:.2f}m wide — minimum for {door_type} "
+                        f"door is {min_width:.2f}m (OIB RL 4)."
+                    ),
                 )
+            )
 
     return errors
 
@@ -251,30 +313,31 @@ def validate_ceiling_height(
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        slab_thickness = max(
-            (s.thickness for s in story.slabs if s.is_floor),
-            default=0.0,
-        )
-        clear_height = story.height - slab_thickness
-
-        if clear_height < min_height - 0.01:
-            errors.append(
-                ValidationError(
-                    severity="error",
-                    element_type="Story",
-                    element_id=story.global_id,
-                    message=(
-                        f"Story '{story.name}' has clear height "
-                        f"{clear_height:.2f}m (floor height {story.height}m "
-                        f"minus slab {slab_thickness:.2f}m) — minimum is "
-                        f"{min_height:.2f}m for habitable rooms (OIB RL 3)."
-                    ),
-                )
-            )
+        errors.extend(_ceiling_height_errors(story, min_height))
 
     return errors
 
 
-def _distance(p1: Point2D, p2: Point2D) -> float:
-    """Euclidean distance between two points."""
-    return math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2)
+def _ceiling_height_errors(story: Story, min_height: float) -> list[ValidationError]:
+    """Ceiling height check for one story."""
+    errors: list[ValidationError] = []
+
+    slab_thickness = story.floor_slab_thickness
+    clear_height = story.height - slab_thickness
+
+    if clear_height < min_height - 0.01:
+        errors.append(
+            ValidationError(
+                severity="error",
+                element_type="Story",
+                element_id=story.global_id,
+                message=(
+                    f"Story '{story.name}' has clear height "
+                    f"{clear_height:.2f}m (floor height {story.height}m "
+                    f"minus slab {slab_thickness:.2f}m) — minimum is "
+                    f"{min_height:.2f}m for habitable rooms (OIB RL 3)."
+                ),
+            )
+        )
+
+    return errors
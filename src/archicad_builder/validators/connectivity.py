@@ -10,45 +10,46 @@ Follows IFC conventions: wall connections map to IfcRelConnectsPathElements.
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
 
+import numpy as np
+import shapely
+from shapely import STRtree
+
 from archicad_builder.models.building import Story
-from archicad_builder.models.geometry import Point2D
+from archicad_builder.validators.story_arrays import StoryArrays, story_arrays
 from archicad_builder.validators.structural import ValidationError
 
 
-def _distance(p1: Point2D, p2: Point2D) -> float:
-    """Euclidean distance between two points."""
-    return math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2)
-
+def _point_to_segments_distance_sq(
+    points: np.ndarray,
+    seg_start: np.ndarray,
+    seg_end: np.ndarray,
+) -> np.ndarray:
+    """Squared distance from each of N points to its paired segment (wall body).
 
-def _point_to_segment_distance(
-    point: Point2D,
-    seg_start: Point2D,
-    seg_end: Point2D,
-) -> float:
-    """Distance from a point to a line segment (wall body).
-
-    Returns the perpendicular distance if the projection falls on the segment,
-    otherwise the distance to the nearest endpoint.
+    All arguments are (N, 2) arrays, paired row by row. Returns the
+    perpendicular distance where the projection falls on the segment,
+    otherwise the distance to its nearest endpoint.
     """
-    dx = seg_end.x - seg_start.x
-    dy = seg_end.y - seg_start.y
+    px, py = points[:, 0], points[:, 1]
+    sx, sy = seg_start[:, 0], seg_start[:, 1]
+    dx = seg_end[:, 0] - sx
+    dy = seg_end[:, 1] - sy
     length_sq = dx * dx + dy * dy
-
-    if length_sq < 1e-12:
-        return _distance(point, seg_start)
+    degenerate = length_sq < 1e-12
 
     # Project point onto the line, clamped to [0, 1]
-    t = ((point.x - seg_start.x) * dx + (point.y - seg_start.y) * dy) / length_sq
-    t = max(0.0, min(1.0, t))
+    t = ((px - sx) * dx + (py - sy) * dy) / np.where(degenerate, 1.0, length_sq)
+    t = np.clip(t, 0.0, 1.0)
+    t[degenerate] = 0.0
+
+    proj_x = sx + t * dx
+    proj_y = sy + t * dy
+    return np.asarray((px - proj_x) ** 2 + (py - proj_y) ** 2)
 
-    proj = Point2D(
-        x=seg_start.x + t * dx,
-        y=seg_start.y + t * dy,
-    )
-    return _distance(point, proj)
+
+_END_NAMES = ("start", "end", "body")
 
 
 @dataclass
@@ -65,6 +66,7 @@ class WallConnection:
 def find_connections(
     story: Story,
     tolerance: float = 0.02,
+    arrays: StoryArrays | None = None,
 ) -> tuple[list[WallConnection], list[ValidationError]]:
     """Find wall-to-wall connections and detect gaps.
 
@@ -75,6 +77,7 @@ def find_connections(
     Args:
         story: Story to analyze.
         tolerance: Maximum distance to consider connected (meters).
+        arrays: Prebuilt StoryArrays for the story, if the caller has one.
 
     Returns:
         Tuple of (connections found, validation errors for gaps).
@@ -83,63 +86,131 @@ def find_connections(
     walls = story.walls
     connections: list[WallConnection] = []
     errors: list[ValidationError] = []
-
-    for i, wall in enumerate(walls):
-        for end_name, endpoint in [("start", wall.start), ("end", wall.end)]:
-            best_dist = float("inf")
-            best_connection: WallConnection | None = None
-
-            for j, other in enumerate(walls):
-                if i == j:
-                    continue
-
-                # Check endpoint-to-endpoint
-                for other_end_name, other_endpoint in [
-                    ("start", other.start),
-                    ("end", other.end),
-                ]:
-                    d = _distance(endpoint, other_endpoint)
-                    if d < best_dist:
-                        best_dist = d
-                        best_connection = WallConnection(
-                            wall1_tag=wall.tag,
-                            wall1_end=end_name,
-                            wall2_tag=other.tag,
-                            wall2_end=other_end_name,
-                            distance=d,
-                        )
-
-                # Check endpoint-to-body (T-junction)
-                d_body = _point_to_segment_distance(endpoint, other.start, other.end)
-                if d_body < best_dist:
-                    best_dist = d_body
-                    best_connection = WallConnection(
-                        wall1_tag=wall.tag,
-                        wall1_end=end_name,
-                        wall2_tag=other.tag,
-                        wall2_end="body",
-                        distance=d_body,
-                    )
-
-            if best_connection and best_dist <= tolerance:
-                connections.append(best_connection)
-            elif best_connection and best_dist > tolerance:
-                errors.append(
-                    ValidationError(
-                        severity="warning",
-                        element_type="Wall",
-                        element_id=wall.global_id,
-                        message=(
-                            f"{wall.tag} {end_name} ({endpoint.x:.2f}, {endpoint.y:.2f}) "
-                            f"has no connection — nearest is {best_connection.wall2_tag} "
-                            f"{best_connection.wall2_end} at {best_dist:.3f}m"
-                        ),
-                    )
+    sa = arrays if arrays is not None else story_arrays(story)
+    starts, ends = sa.starts, sa.ends
+    # Endpoint p = 2 * wall_index + (0 for start, 1 for end)
+    points = np.stack([starts, ends], axis=1).reshape(-1, 2)
+
+    # Any wall within tolerance is among the index candidates, so the best
+    # candidate is the overall best whenever it connects.
+    src, dst = _candidate_pairs(starts, ends, points, tolerance)
+    best_sq, best_j, best_kind = _scan_walls(points, starts, ends, src, dst)
+
+    # Unconnected endpoints: scan every wall to report the true nearest one.
+    open_points = np.flatnonzero(np.sqrt(best_sq) > tolerance)
+    if len(open_points) and len(walls) > 1:
+        n = len(walls)
+        src = np.repeat(open_points, n)
+        dst = np.tile(np.arange(n), len(open_points))
+        dist_sq, nearest_j, kind = _scan_walls(points, starts, ends, src, dst)
+        best_sq[open_points] = dist_sq[open_points]
+        best_j[open_points] = nearest_j[open_points]
+        best_kind[open_points] = kind[open_points]
+
+    # The only square roots: one per endpoint, for its best match
+    best_dist = np.sqrt(best_sq)
+    for p in range(len(points)):
+        j = int(best_j[p])
+        if j < 0:
+            continue  # no other walls on the story
+        i, k = divmod(p, 2)
+        wall, end_name = walls[i], _END_NAMES[k]
+        other_tag, other_end = walls[j].tag, _END_NAMES[best_kind[p]]
+        dist = float(best_dist[p])
+
+        if dist <= tolerance:
+            connections.append(WallConnection(
+                wall1_tag=wall.tag,
+                wall1_end=end_name,
+                wall2_tag=other_tag,
+                wall2_end=other_end,
+                distance=dist,
+            ))
+        else:
+            # Only gaps pay for the coordinate lookup and message formatting
+            endpoint = wall.start if k == 0 else wall.end
+            errors.append(
+                ValidationError(
+                    severity="warning",
+                    element_type="Wall",
+                    element_id=wall.global_id,
+                    message=(
+                        f"{wall.tag} {end_name} ({endpoint.x:.2f}, {endpoint.y:.2f}) "
+                        f"has no connection — nearest is {other_tag} "
+                        f"{other_end} at {dist:.3f}m"
+                    ),
                 )
+            )
 
     return connections, errors
 
 
+def _candidate_pairs(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    points: np.ndarray,
+    tolerance: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """(endpoint, wall) index pairs whose wall bounding box is within tolerance.
+
+    Wall segments (from (N, 2) start/end arrays) are bulk-loaded into an STR
+    tree once, and all endpoint boxes are queried in a single call.
+    """
+    if len(starts) == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    tree = STRtree(shapely.linestrings(np.stack([starts, ends], axis=1)))
+    boxes = shapely.box(
+        points[:, 0] - tolerance, points[:, 1] - tolerance,
+        points[:, 0] + tolerance, points[:, 1] + tolerance,
+    )
+    src, dst = tree.query(boxes)
+    return src, dst
+
+
+def _scan_walls(
+    points: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    src: np.ndarray,
+    dst: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Nearest connection for every endpoint over (endpoint, wall) pairs.
+
+    Evaluates the squared start, end and body distances of all pairs in one
+    batch, skipping each endpoint's own wall. Returns per-endpoint arrays
+    ``(best_dist_sq, best_wall, best_kind)`` with kind 0/1/2 for
+    start/end/body; endpoints without pairs get ``(inf, -1, 0)``. Ties go
+    to the lowest wall index, then start before end before body.
+    """
+    best_dist = np.full(len(points), np.inf)
+    best_j = np.full(len(points), -1, dtype=np.intp)
+    best_kind = np.zeros(len(points), dtype=np.intp)
+
+    keep = (src // 2) != dst
+    src, dst = src[keep], dst[keep]
+    if len(src) == 0:
+        return best_dist, best_j, best_kind
+
+    p = points[src]
+    s, e = starts[dst], ends[dst]
+    dists = np.concatenate([
+        ((s - p) ** 2).sum(axis=1),
+        ((e - p) ** 2).sum(axis=1),
+        _point_to_segments_distance_sq(p, s, e),
+    ])
+    kinds = np.repeat(np.arange(3), len(src))
+    srcs, dsts = np.tile(src, 3), np.tile(dst, 3)
+
+    # Per endpoint: smallest distance, then lowest wall, then kind order
+    order = np.lexsort((kinds, dsts, dists, srcs))
+    first = order[np.r_[True, srcs[order][1:] != srcs[order][:-1]]]
+    best_dist[srcs[first]] = dists[first]
+    best_j[srcs[first]] = dsts[first]
+    best_kind[srcs[first]] = kinds[first]
+    return best_dist, best_j, best_kind
+
+
 def validate_connectivity(
     story: Story,
     tolerance: float = 0.02,
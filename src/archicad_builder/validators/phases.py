@@ -21,10 +21,22 @@ v3 additions:
 from __future__ import annotations
 
 import math
+import re
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+
+import numpy as np
+import shapely
 
 from archicad_builder.models.building import Building, Story
-from archicad_builder.models.geometry import Point2D
-from archicad_builder.models.spaces import Apartment, RoomType, Space
+from archicad_builder.models.elements import Door, Slab, Wall
+from archicad_builder.models.geometry import Point2D, Polygon2D
+from archicad_builder.models.spaces import RoomType, Space
+from archicad_builder.validators.story_arrays import StoryArrays, story_arrays
 from archicad_builder.validators.structural import ValidationError
 
 # Construction constants
@@ -46,31 +58,206 @@ MAX_CORE_OPENING = 1.20       # Maximum opening width in core walls (fire-rated)
 MAX_SUSPICIOUS_DOOR = 1.20    # Doors wider than this get a warning
 MIN_BATHROOM_AREA = 5.0       # OIB adaptable housing requirement
 CORE_WALL_KEYWORDS = ["core", "elevator", "staircase", "divider"]  # Wall names indicating core
+# One pass over a lowercased name finds any keyword
+_CORE_WALL_RE = re.compile("|".join(map(re.escape, CORE_WALL_KEYWORDS)))
+
+# Phase 5 room-type groups
+_HABITABLE = frozenset({RoomType.LIVING, RoomType.BEDROOM, RoomType.KITCHEN})
+_E044_SKIP = frozenset({  # Dark rooms allowed
+    RoomType.BATHROOM, RoomType.TOILET, RoomType.HALLWAY,
+    RoomType.CORRIDOR, RoomType.STORAGE,
+})
+_W042_SKIP = frozenset({  # Service rooms are naturally narrow
+    RoomType.HALLWAY, RoomType.CORRIDOR, RoomType.STORAGE,
+    RoomType.TOILET, RoomType.BATHROOM, RoomType.KITCHEN,
+})
+
+
+@dataclass
+class _StoryDerived:
+    """Story quantities several phase validators derive from the same walls.
+
+    Built once per story by ``validate_all_phases`` and shared by the
+    phases; a phase called on its own builds it per story on the fly.
+    """
+
+    width: float  # Extent of external walls along x
+    depth: float  # Extent of external walls along y
+    corridor_walls: list[Wall]
+    south_corridor: list[Wall]
+    north_corridor: list[Wall]
+    floor_slabs: list[Slab]
+    floor_area: float
+    walls_by_id: dict[str, Wall]  # First wall with each global_id
+    wall_names: dict[str, str]  # Wall global_id → lowercased name
+    door_names: dict[str, str]  # Door global_id → lowercased name
+    arrays: StoryArrays
+    lobby: np.ndarray  # Mask over arrays: lobby walls
+    core: np.ndarray  # Mask over arrays: core walls (CORE_WALL_KEYWORDS)
+    entry_doors: list[Door]  # Doors with "entry" in their name
+    _entries_by_apt: dict[str, list[Door]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(cls, story: Story) -> _StoryDerived:
+        sa = story_arrays(story)
+        wall_names = {w.global_id: (w.name or "").lower() for w in sa.walls}
+        door_names = {d.global_id: (d.name or "").lower() for d in story.doors}
+
+        # One pass over the names sorts walls into every keyword group
+        walls_by_id: dict[str, Wall] = {}
+        corridor_walls, south, north = [], [], []
+        lobby = np.zeros(len(sa.walls), dtype=bool)
+        core = np.zeros(len(sa.walls), dtype=bool)
+        for i, w in enumerate(sa.walls):
+            walls_by_id.setdefault(w.global_id, w)
+            name = wall_names[w.global_id]
+            if "corridor" in name:
+                corridor_walls.append(w)
+                if "south" in name:
+                    south.append(w)
+                if "north" in name:
+                    north.append(w)
+            lobby[i] = "lobby" in name
+            core[i] = _CORE_WALL_RE.search(name) is not None
+
+        floor_slabs = story.floor_slabs
+        ext = sa.is_external
+        width: float = 0
+        depth: float = 0
+        if ext.any():
+            width = float(np.maximum(sa.sx[ext], sa.ex[ext]).max())
+            depth = float(np.maximum(sa.sy[ext], sa.ey[ext]).max())
+        return cls(
+            width=width,
+            depth=depth,
+            corridor_walls=corridor_walls,
+            south_corridor=south,
+            north_corridor=north,
+            floor_slabs=floor_slabs,
+            floor_area=sum(s.area for s in floor_slabs),
+            walls_by_id=walls_by_id,
+            wall_names=wall_names,
+            door_names=door_names,
+            arrays=sa,
+            lobby=lobby,
+            core=core,
+            entry_doors=[
+                d for d in story.doors if "entry" in door_names[d.global_id]
+            ],
+        )
+
+    def entries_for(self, apt_name: str) -> list[Door]:
+        """Entry doors whose name mentions the (lowercased) apartment name."""
+        doors = self._entries_by_apt.get(apt_name)
+        if doors is None:
+            doors = self._entries_by_apt[apt_name] = [
+                d for d in self.entry_doors
+                if apt_name in self.door_names[d.global_id]
+            ]
+        return doors
+
+    def wall_mask(self, matches: Callable[[str], object]) -> np.ndarray:
+        """Boolean mask over ``arrays`` of walls whose lowercased name matches."""
+        walls = self.arrays.walls
+        return np.fromiter(
+            (bool(matches(self.wall_names[w.global_id])) for w in walls),
+            dtype=bool, count=len(walls),
+        )
+
+    def extent(self, mask: np.ndarray) -> tuple[float, float, float, float]:
+        """(xmin, ymin, xmax, ymax) over both endpoints of the masked walls."""
+        sa = self.arrays
+        xs = np.concatenate((sa.sx[mask], sa.ex[mask]))
+        ys = np.concatenate((sa.sy[mask], sa.ey[mask]))
+        return float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max())
+
+
+def _derive(
+    story: Story, derived: dict[int, _StoryDerived] | None,
+) -> _StoryDerived:
+    """Look up a story's derived quantities, building them if not shared."""
+    if derived is not None and id(story) in derived:
+        return derived[id(story)]
+    return _StoryDerived.build(story)
 
 
 def validate_all_phases(building: Building) -> list[ValidationError]:
-    """Run all phase validators (v2 + v3)."""
+    """Run all phase validators (v2 + v3).
+
+    Validators that can only report on apartments are skipped while no
+    storey has any, and the inter-storey ones on single-storey buildings.
+    """
     errors: list[ValidationError] = []
-    errors.extend(validate_phase1_shell(building))
-    errors.extend(validate_phase2_core(building))
-    errors.extend(validate_phase3_corridor(building))
-    errors.extend(validate_phase4_facade(building))
-    errors.extend(validate_phase5_rooms(building))
-    errors.extend(validate_apartment_connectivity(building))
-    errors.extend(validate_phase6_vertical(building))
+    for validator in _phase_plan(building):
+        errors.extend(validator())
+    return errors
+
+
+def validate_all_phases_parallel(
+    building: Building,
+    workers: int | None = None,
+) -> list[ValidationError]:
+    """``validate_all_phases`` with the validators run on a thread pool.
+
+    The validators only read the building, and the per-storey derived data
+    is built before any of them start, so threads share it without locking.
+    Results are concatenated in the serial order, so the output matches
+    ``validate_all_phases`` exactly. Threads overlap only where a validator
+    drops the GIL (NumPy/shapely work such as E032 coverage); the derived
+    map is keyed by ``id(story)`` and can't cross a process boundary.
+
+    Args:
+        building: Building to validate.
+        workers: Worker thread count (defaults to one per validator).
+    """
+    plan = _phase_plan(building)
+    if not plan:
+        return []
+    errors: list[ValidationError] = []
+    with ThreadPoolExecutor(max_workers=workers or len(plan)) as pool:
+        for result in [pool.submit(validator) for validator in plan]:
+            errors.extend(result.result())
+    return errors
+
+
+def _phase_plan(
+    building: Building,
+) -> list[Callable[[], list[ValidationError]]]:
+    """The phase validators worth running on ``building``, in report order."""
+    if not building.stories:
+        return []
+    derived = {id(s): _StoryDerived.build(s) for s in building.stories}
+    has_apartments = any(s.apartments for s in building.stories)
+    multi_storey = len(building.stories) >= 2
+
+    plan: list[Callable[[], list[ValidationError]]] = [
+        partial(validate_phase1_shell, building, derived),
+    ]
+    if multi_storey:
+        plan.append(partial(validate_phase2_core, building, derived))
+    plan.append(partial(validate_phase3_corridor, building, derived))
+    if has_apartments:
+        plan.append(partial(validate_phase4_facade, building, derived))
+        plan.append(partial(validate_phase5_rooms, building, derived))
+        plan.append(partial(validate_apartment_connectivity, building))
+    if multi_storey:
+        plan.append(partial(validate_phase6_vertical, building))
     # v3 additions
-    errors.extend(validate_core_integrity(building))
-    errors.extend(validate_interior_enclosure(building))
+    plan.append(partial(validate_core_integrity, building))
+    if has_apartments:
+        plan.append(partial(validate_interior_enclosure, building))
     # Optimization validators
-    errors.extend(validate_optimizations(building))
-    return errors
+    plan.append(partial(validate_optimizations, building, derived))
+    return plan
 
 
 # ══════════════════════════════════════════════════════════════════════
 # PHASE 1: Shell Validators
 # ══════════════════════════════════════════════════════════════════════
 
-def validate_phase1_shell(building: Building) -> list[ValidationError]:
+def validate_phase1_shell(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """Phase 1 validators: E001, W001, E002."""
     errors: list[ValidationError] = []
 
@@ -107,8 +294,7 @@ def validate_phase1_shell(building: Building) -> list[ValidationError]:
             ))
 
         # E002: Missing floor slab → ERROR
-        floor_slabs = [s for s in story.slabs if s.is_floor]
-        if not floor_slabs:
+        if not _derive(story, derived).floor_slabs:
             errors.append(ValidationError(
                 severity="error",
                 element_type="Story",
@@ -123,43 +309,52 @@ def validate_phase1_shell(building: Building) -> list[ValidationError]:
 # PHASE 2: Core Validators
 # ══════════════════════════════════════════════════════════════════════
 
-def validate_phase2_core(building: Building) -> list[ValidationError]:
+def validate_phase2_core(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """Phase 2 validators: E010-E013, W010-W011."""
     errors: list[ValidationError] = []
 
     if len(building.stories) < 2:
         return errors  # Single-storey doesn't need core validation
 
-    # E010: No staircase in multi-storey building
-    for story in building.stories:
-        if not story.staircases:
-            errors.append(ValidationError(
-                severity="error",
-                element_type="Building",
-                element_id=building.global_id,
-                message=(
-                    f"E010: Multi-storey building has no staircase on "
-                    f"'{story.name}'."
-                ),
-            ))
+    # E010: No staircase in multi-storey building — one error naming
+    # every affected storey, not one per storey
+    missing = [s.name for s in building.stories if not s.staircases]
+    if missing:
+        errors.append(ValidationError(
+            severity="error",
+            element_type="Building",
+            element_id=building.global_id,
+            message=(
+                f"E010: Multi-storey building has no staircase on "
+                f"{_quoted_names(missing)}."
+            ),
+        ))
 
     # E011: Core not accessible from every storey
     # Check that each floor has a door to the core area (named "Core Entry" or similar)
+    no_core_door = []
     for story in building.stories:
-        core_doors = [d for d in story.doors
-                      if "core" in (d.name or "").lower()
-                      or "lobby" in (d.name or "").lower()
-                      or "staircase door" in (d.name or "").lower()]
-        if not core_doors:
-            errors.append(ValidationError(
-                severity="error",
-                element_type="Story",
-                element_id=story.global_id,
-                message=(
-                    f"E011: Story '{story.name}' has no door to the vertical core. "
-                    f"Core must be accessible from every floor."
-                ),
-            ))
+        door_names = _derive(story, derived).door_names
+        has_core_door = any(
+            "core" in name or "lobby" in name or "staircase door" in name
+            for name in (door_names[d.global_id] for d in story.doors)
+        )
+        if not has_core_door:
+            no_core_door.append(story.name)
+    if no_core_door:
+        errors.append(ValidationError(
+            severity="error",
+            element_type="Building",
+            element_id=building.global_id,
+            message=(
+                f"E011: {'Story' if len(no_core_door) == 1 else 'Stories'} "
+                f"{_quoted_names(no_core_door)} "
+                f"{'has' if len(no_core_door) == 1 else 'have'} no door to "
+                f"the vertical core. Core must be accessible from every floor."
+            ),
+        ))
 
     # E012: Staircase flight width < 1.20m
     for story in building.stories:
@@ -179,9 +374,10 @@ def validate_phase2_core(building: Building) -> list[ValidationError]:
     # E013: No building entrance / ground floor lobby
     ground = building.stories[0] if building.stories else None
     if ground:
+        door_names = _derive(ground, derived).door_names
         building_entries = [d for d in ground.doors
-                           if "building" in (d.name or "").lower()
-                           or "main entry" in (d.name or "").lower()]
+                           if "building" in door_names[d.global_id]
+                           or "main entry" in door_names[d.global_id]]
         if not building_entries:
             errors.append(ValidationError(
                 severity="error",
@@ -201,21 +397,15 @@ def validate_phase2_core(building: Building) -> list[ValidationError]:
     # W011: Core > 15% BGF
     if building.stories:
         first_story = building.stories[0]
-        building_area = sum(s.area for s in first_story.slabs if s.is_floor)
+        info = _derive(first_story, derived)
+        building_area = info.floor_area
         if building_area > 0:
             core_area = sum(st.area for st in first_story.staircases)
             # Add elevator area (estimate from walls)
-            elev_walls = [w for w in first_story.walls
-                          if "elevator" in (w.name or "").lower()]
-            if elev_walls:
-                elev_xs = []
-                elev_ys = []
-                for w in elev_walls:
-                    elev_xs.extend([w.start.x, w.end.x])
-                    elev_ys.extend([w.start.y, w.end.y])
-                if elev_xs and elev_ys:
-                    core_area += ((max(elev_xs) - min(elev_xs)) *
-                                  (max(elev_ys) - min(elev_ys)))
+            elev = info.wall_mask(lambda name: "elevator" in name)
+            if elev.any():
+                x0, y0, x1, y1 = info.extent(elev)
+                core_area += (x1 - x0) * (y1 - y0)
 
             ratio = core_area / building_area
             if ratio > 0.15:
@@ -237,14 +427,16 @@ def validate_phase2_core(building: Building) -> list[ValidationError]:
 # PHASE 3: Corridor Validators
 # ══════════════════════════════════════════════════════════════════════
 
-def validate_phase3_corridor(building: Building) -> list[ValidationError]:
+def validate_phase3_corridor(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """Phase 3 validators: E020-E023, W020."""
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        # Find corridor walls
-        corridor_walls = [w for w in story.walls
-                          if "corridor" in (w.name or "").lower()]
+        info = _derive(story, derived)
+        corridor_walls = info.corridor_walls
+        wall_names = info.wall_names
 
         if not corridor_walls and story.apartments:
             # E022 (partial): apartments exist but no corridor
@@ -260,17 +452,18 @@ def validate_phase3_corridor(building: Building) -> list[ValidationError]:
             continue
 
         # E021: Corridor width < 1.20m
-        south_walls = [w for w in corridor_walls if "south" in (w.name or "").lower()]
-        north_walls = [w for w in corridor_walls if "north" in (w.name or "").lower()]
+        south_walls = info.south_corridor
+        north_walls = info.north_corridor
 
-        for sw in south_walls:
-            for nw in north_walls:
-                # Check matching segments (same east/west designation)
-                sw_suffix = (sw.name or "").split()[-1].lower()
-                nw_suffix = (nw.name or "").split()[-1].lower()
-                if sw_suffix != nw_suffix:
-                    continue
+        # Pair matching segments (same east/west designation) by suffix
+        north_by_suffix: dict[str, list[Wall]] = {}
+        for nw in north_walls:
+            suffix = wall_names[nw.global_id].split()[-1]
+            north_by_suffix.setdefault(suffix, []).append(nw)
 
+        for sw in south_walls:
+            sw_suffix = wall_names[sw.global_id].split()[-1]
+            for nw in north_by_suffix.get(sw_suffix, ()):
                 sy = (sw.start.y + sw.end.y) / 2
                 ny = (nw.start.y + nw.end.y) / 2
                 clear_width = abs(ny - sy) - sw.thickness / 2 - nw.thickness / 2
@@ -289,9 +482,7 @@ def validate_phase3_corridor(building: Building) -> list[ValidationError]:
 
         # E022: Apartment has no corridor access
         for apt in story.apartments:
-            entry_doors = [d for d in story.doors
-                           if apt.name.lower() in (d.name or "").lower()
-                           and "entry" in (d.name or "").lower()]
+            entry_doors = info.entries_for(apt.name.lower())
             if not entry_doors:
                 errors.append(ValidationError(
                     severity="error",
@@ -350,43 +541,37 @@ def validate_phase3_corridor(building: Building) -> list[ValidationError]:
                 # Find core x-position from staircase
                 core_x: float | None = None
                 if story.staircases:
-                    sc = story.staircases[0]
-                    verts = sc.outline.vertices
-                    core_x = sum(v.x for v in verts) / len(verts)
+                    core_x = story.staircases[0].outline.center.x
 
                 # Determine which merged interval the core is on
+                # (core may be slightly outside corridor, i.e. adjacent)
                 core_interval_idx: int | None = None
                 if core_x is not None:
-                    for idx, (lo, hi) in enumerate(merged):
-                        # Core may be slightly outside corridor (adjacent)
-                        if lo - 1.0 <= core_x <= hi + 1.0:
-                            core_interval_idx = idx
-                            break
+                    core_interval_idx = _find_interval(
+                        [lo - 1.0 for lo, _ in merged],
+                        [hi + 1.0 for _, hi in merged],
+                        core_x,
+                    )
+                door_starts = [lo - 0.1 for lo, _ in merged]
+                door_ends = [hi + 0.1 for _, hi in merged]
 
                 # Check each apartment entry door
                 corridor_wall_ids = {w.global_id for w in corridor_walls}
                 for apt in story.apartments:
                     # Find entry doors for this apartment on corridor walls
                     entry_doors = [
-                        d for d in story.doors
+                        d for d in info.entries_for(apt.name.lower())
                         if d.wall_id in corridor_wall_ids
-                        and apt.name.lower() in (d.name or "").lower()
-                        and "entry" in (d.name or "").lower()
                     ]
 
                     for door in entry_doors:
-                        host = next(
-                            (w for w in story.walls
-                             if w.global_id == door.wall_id),
-                            None,
-                        )
+                        host = info.walls_by_id.get(door.wall_id)
                         if host is None:
                             continue
 
                         # Door world x-position
                         dx = host.end.x - host.start.x
-                        dy = host.end.y - host.start.y
-                        length = (dx ** 2 + dy ** 2) ** 0.5
+                        length = host.length
                         door_x = (
                             host.start.x + dx * door.position / length
                             if length > 0
@@ -394,11 +579,9 @@ def validate_phase3_corridor(building: Building) -> list[ValidationError]:
                         )
 
                         # Which corridor interval is this door on?
-                        door_interval_idx: int | None = None
-                        for idx, (lo, hi) in enumerate(merged):
-                            if lo - 0.1 <= door_x <= hi + 0.1:
-                                door_interval_idx = idx
-                                break
+                        door_interval_idx = _find_interval(
+                            door_starts, door_ends, door_x,
+                        )
 
                         if door_interval_idx is None:
                             errors.append(ValidationError(
@@ -437,29 +620,20 @@ def validate_phase3_corridor(building: Building) -> list[ValidationError]:
 # PHASE 4: Façade Subdivision Validators
 # ══════════════════════════════════════════════════════════════════════
 
-def validate_phase4_facade(building: Building) -> list[ValidationError]:
+def validate_phase4_facade(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """Phase 4 validators: E030-E032, W030-W031."""
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        building_width = max(
-            (max(w.start.x, w.end.x) for w in story.walls if w.is_external),
-            default=0,
-        )
-        building_depth = max(
-            (max(w.start.y, w.end.y) for w in story.walls if w.is_external),
-            default=0,
-        )
+        info = _derive(story, derived)
+        building_width = info.width
+        building_depth = info.depth
         building_area = building_width * building_depth
 
         for apt in story.apartments:
-            verts = apt.boundary.vertices
-            min_x = min(v.x for v in verts)
-            max_x = max(v.x for v in verts)
-            min_y = min(v.y for v in verts)
-            max_y = max(v.y for v in verts)
-            apt_width = max_x - min_x
-            apt_depth = max_y - min_y
+            apt_width, apt_depth = _extent(apt.boundary)
 
             # E030: Apartment < 6.50m façade (only for 2+ room apartments)
             # Studios (no separate bedroom) don't need 6.5m minimum
@@ -479,9 +653,7 @@ def validate_phase4_facade(building: Building) -> list[ValidationError]:
                 ))
 
             # E031: Apartment unreachable from corridor/core
-            entry_doors = [d for d in story.doors
-                           if apt.name.lower() in (d.name or "").lower()
-                           and "entry" in (d.name or "").lower()]
+            entry_doors = info.entries_for(apt.name.lower())
             if not entry_doors:
                 errors.append(ValidationError(
                     severity="error",
@@ -533,31 +705,24 @@ def validate_phase4_facade(building: Building) -> list[ValidationError]:
         # apartment boundaries, corridor zone, and core outlines. Cluster
         # uncovered points into contiguous regions. Flag regions > 1m².
         if building_area > 0 and story.apartments:
-            grid_step = 0.5  # 0.5m resolution
-            # Build zones to check against
-            zones: list[tuple[float, float, float, float]] = []  # (xmin, ymin, xmax, ymax)
+            grid_step = _e032_grid_step(building_width, building_depth)
+            # Build zones to check against: rectangles as rows of one
+            # (xmin, ymin, xmax, ymax) array, sized for the most boxes this
+            # story can yield (apartments, staircases, corridor, lobby,
+            # core); other outlines (e.g. L-shaped apartments) as polygons
+            zones = np.empty(
+                (len(story.apartments) + len(story.staircases) + 3, 4),
+            )
+            n_zones = 0
+            zone_polygons: list[Polygon2D] = []
 
             # Apartment boundaries
             for apt in story.apartments:
-                av = apt.boundary.vertices
-                zones.append((
-                    min(v.x for v in av), min(v.y for v in av),
-                    max(v.x for v in av), max(v.y for v in av),
-                ))
+                n_zones = _add_zone(apt.boundary, zones, n_zones, zone_polygons)
 
             # Corridor zone: between south and north corridor walls
-            corridor_walls = [
-                w for w in story.walls
-                if "corridor" in (w.name or "").lower()
-            ]
-            south_cw = [
-                w for w in corridor_walls
-                if "south" in (w.name or "").lower()
-            ]
-            north_cw = [
-                w for w in corridor_walls
-                if "north" in (w.name or "").lower()
-            ]
+            south_cw = info.south_corridor
+            north_cw = info.north_corridor
             if south_cw and north_cw:
                 cw_y_south = min(
                     min(w.start.y, w.end.y) for w in south_cw
@@ -573,121 +738,48 @@ def validate_phase4_facade(building: Building) -> list[ValidationError]:
                     max(w.start.x, w.end.x)
                     for w in south_cw + north_cw
                 )
-                zones.append((cw_x_min, cw_y_south, cw_x_max, cw_y_north))
+                zones[n_zones] = (cw_x_min, cw_y_south, cw_x_max, cw_y_north)
+                n_zones += 1
 
             # Core zone: staircase + elevator outlines
             for sc in story.staircases:
-                sv = sc.outline.vertices
-                zones.append((
-                    min(v.x for v in sv), min(v.y for v in sv),
-                    max(v.x for v in sv), max(v.y for v in sv),
-                ))
+                n_zones = _add_zone(sc.outline, zones, n_zones, zone_polygons)
 
             # Lobby zone (ground floor entrance area)
             # Lobby is between building exterior and lobby walls.
             # Include the area from exterior to the lobby wall boundary,
             # extended up to the corridor/core (vestibule connection).
-            lobby_walls = [
-                w for w in story.walls
-                if "lobby" in (w.name or "").lower()
-            ]
-            if lobby_walls:
-                lx = [c for w in lobby_walls for c in (w.start.x, w.end.x)]
-                ly = [c for w in lobby_walls for c in (w.start.y, w.end.y)]
+            if info.lobby.any():
+                _, _, lobby_x_max, lobby_y_max = info.extent(info.lobby)
                 # Extend to building origin and up to corridor north edge
-                lobby_y_max = max(ly)
                 if north_cw:
                     lobby_y_max = max(
                         lobby_y_max,
                         max(max(w.start.y, w.end.y) for w in north_cw),
                     )
-                zones.append((0, 0, max(lx), lobby_y_max))
+                zones[n_zones] = (0, 0, lobby_x_max, lobby_y_max)
+                n_zones += 1
 
             # Also include core walls area (vestibule, divider walls)
-            core_walls = [
-                w for w in story.walls
-                if any(kw in (w.name or "").lower()
-                       for kw in CORE_WALL_KEYWORDS)
-            ]
-            if core_walls:
-                core_x = [
-                    c for w in core_walls
-                    for c in (w.start.x, w.end.x)
-                ]
-                core_y = [
-                    c for w in core_walls
-                    for c in (w.start.y, w.end.y)
-                ]
-                zones.append((
-                    min(core_x), min(core_y),
-                    max(core_x), max(core_y),
-                ))
+            if info.core.any():
+                zones[n_zones] = info.extent(info.core)
+                n_zones += 1
 
-            # Sample grid and find uncovered points
-            uncovered: list[tuple[float, float]] = []
-            nx = int(building_width / grid_step)
-            ny = int(building_depth / grid_step)
-            for ix in range(nx):
-                px = ix * grid_step + grid_step / 2
-                for iy in range(ny):
-                    py = iy * grid_step + grid_step / 2
-                    covered = False
-                    for zx0, zy0, zx1, zy1 in zones:
-                        if zx0 - 0.05 <= px <= zx1 + 0.05 and \
-                           zy0 - 0.05 <= py <= zy1 + 0.05:
-                            covered = True
-                            break
-                    if not covered:
-                        uncovered.append((px, py))
-
-            # Cluster uncovered points into contiguous regions (simple grid flood-fill)
-            if uncovered:
-                uncov_set = set(uncovered)
-                visited: set[tuple[float, float]] = set()
-                regions: list[list[tuple[float, float]]] = []
-
-                for pt in uncovered:
-                    if pt in visited:
-                        continue
-                    # BFS flood fill
-                    region: list[tuple[float, float]] = []
-                    queue = [pt]
-                    while queue:
-                        curr = queue.pop()
-                        if curr in visited:
-                            continue
-                        visited.add(curr)
-                        region.append(curr)
-                        cx, cy = curr
-                        for dx, dy in [
-                            (grid_step, 0), (-grid_step, 0),
-                            (0, grid_step), (0, -grid_step),
-                        ]:
-                            nb = (round(cx + dx, 2), round(cy + dy, 2))
-                            if nb in uncov_set and nb not in visited:
-                                queue.append(nb)
-                    if region:
-                        regions.append(region)
-
-                # Report regions > 1m² (each grid cell = grid_step² = 0.25m²)
-                min_region_area = 1.0  # m²
-                for region in regions:
-                    region_area = len(region) * grid_step * grid_step
-                    if region_area >= min_region_area:
-                        xs = [p[0] for p in region]
-                        ys = [p[1] for p in region]
-                        errors.append(ValidationError(
-                            severity="error",
-                            element_type="Story",
-                            element_id=story.global_id,
-                            message=(
-                                f"E032: Unassigned floor area (šupak) on "
-                                f"'{story.name}': ~{region_area:.1f}m² at "
-                                f"x={min(xs):.1f}–{max(xs):.1f}, "
-                                f"y={min(ys):.1f}–{max(ys):.1f} belongs to "
-                                f"no apartment, corridor, or core."
-                            ),
-                        ))
+            for region_area, x0, x1, y0, y1 in _find_unassigned_regions(
+                zones[:n_zones], zone_polygons, building_width, building_depth, grid_step,
+            ):
+                errors.append(ValidationError(
+                    severity="error",
+                    element_type="Story",
+                    element_id=story.global_id,
+                    message=(
+                        f"E032: Unassigned floor area (šupak) on "
+                        f"'{story.name}': ~{region_area:.1f}m² at "
+                        f"x={x0:.1f}–{x1:.1f}, "
+                        f"y={y0:.1f}–{y1:.1f} belongs to "
+                        f"no apartment, corridor, or core."
+                    ),
+                ))
 
     return errors
 
@@ -696,19 +788,23 @@ def validate_phase4_facade(building: Building) -> list[ValidationError]:
 # PHASE 5: Room Subdivision Validators
 # ══════════════════════════════════════════════════════════════════════
 
-def validate_phase5_rooms(building: Building) -> list[ValidationError]:
+def validate_phase5_rooms(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """Phase 5 validators: E040-E045, W040-W042."""
     errors: list[ValidationError] = []
 
     for story in building.stories:
-        building_depth = max(
-            (max(w.start.y, w.end.y) for w in story.walls if w.is_external),
-            default=0,
-        )
+        building_depth = _derive(story, derived).depth
 
         for apt in story.apartments:
+            # One pass over the rooms, shared by the per-type rules below
+            by_type: defaultdict[RoomType, list[Space]] = defaultdict(list)
+            for sp in apt.spaces:
+                by_type[sp.room_type].append(sp)
+
             # E040: No kitchen
-            kitchens = apt.get_space_by_type(RoomType.KITCHEN)
+            kitchens = by_type[RoomType.KITCHEN]
             if not kitchens:
                 errors.append(ValidationError(
                     severity="error",
@@ -718,8 +814,8 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
                 ))
 
             # E041: No bathroom
-            bathrooms = apt.get_space_by_type(RoomType.BATHROOM)
-            toilets = apt.get_space_by_type(RoomType.TOILET)
+            bathrooms = by_type[RoomType.BATHROOM]
+            toilets = by_type[RoomType.TOILET]
             if not bathrooms and not toilets:
                 errors.append(ValidationError(
                     severity="error",
@@ -731,7 +827,7 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
             # E046: No living room — apartment must have at least one
             # habitable main room (living room). An apartment with only
             # service rooms (vorraum, bathroom, storage) is not a dwelling.
-            livings = apt.get_space_by_type(RoomType.LIVING)
+            livings = by_type[RoomType.LIVING]
             if not livings:
                 errors.append(ValidationError(
                     severity="error",
@@ -745,11 +841,7 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
 
             # E047: Apartment has no habitable rooms at all — only service
             # rooms (hallway, bathroom, storage, toilet). Not a dwelling!
-            habitable_types = {RoomType.LIVING, RoomType.BEDROOM, RoomType.KITCHEN}
-            habitable_rooms = [
-                sp for sp in apt.spaces if sp.room_type in habitable_types
-            ]
-            if not habitable_rooms:
+            if not any(by_type[rt] for rt in _HABITABLE):
                 errors.append(ValidationError(
                     severity="error",
                     element_type="Apartment",
@@ -764,45 +856,53 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
             # E048: Room outside apartment boundary — space claims to
             # belong to apartment but is physically disconnected (e.g.,
             # storage room across the corridor from the apartment).
-            apt_verts_e048 = apt.boundary.vertices
-            apt_min_x = min(v.x for v in apt_verts_e048)
-            apt_max_x = max(v.x for v in apt_verts_e048)
-            apt_min_y = min(v.y for v in apt_verts_e048)
-            apt_max_y = max(v.y for v in apt_verts_e048)
-
-            for space in apt.spaces:
-                s_verts = space.boundary.vertices
-                s_cx = sum(v.x for v in s_verts) / len(s_verts)
-                s_cy = sum(v.y for v in s_verts) / len(s_verts)
-                # Check if room center is inside apartment bounding box
-                # (with tolerance for wall thickness)
-                margin = 0.3  # allow for wall thickness
-                if (s_cx < apt_min_x - margin or s_cx > apt_max_x + margin or
-                        s_cy < apt_min_y - margin or s_cy > apt_max_y + margin):
-                    errors.append(ValidationError(
-                        severity="error",
-                        element_type="Space",
-                        element_id=space.global_id,
-                        message=(
-                            f"E048: Room '{space.name}' ({space.room_type.value}) "
-                            f"center at ({s_cx:.1f},{s_cy:.1f}) is outside "
-                            f"apartment '{apt.name}' boundary "
-                            f"(x={apt_min_x:.1f}→{apt_max_x:.1f}, "
-                            f"y={apt_min_y:.1f}→{apt_max_y:.1f}). "
-                            f"Room is physically disconnected from apartment."
-                        ),
-                    ))
+            apt_min_x, apt_min_y, apt_max_x, apt_max_y = apt.boundary.bbox
+
+            # Room bounding boxes and centers as (S, 4) / (S, 2) arrays,
+            # shared by the per-room geometry checks below
+            boxes = np.array(
+                [sp.boundary.bbox for sp in apt.spaces], dtype=float,
+            ).reshape(-1, 4)
+            centers = np.array(
+                [(sp.center.x, sp.center.y) for sp in apt.spaces], dtype=float,
+            ).reshape(-1, 2)
+
+            # Check if room center is inside apartment bounding box
+            # (with tolerance for wall thickness)
+            margin = 0.3  # allow for wall thickness
+            cx, cy = centers[:, 0], centers[:, 1]
+            outside = (
+                (cx < apt_min_x - margin) | (cx > apt_max_x + margin)
+                | (cy < apt_min_y - margin) | (cy > apt_max_y + margin)
+            )
+            if not apt.boundary.is_axis_aligned_rect:
+                # L-shaped or rotated apartment: the bbox over-covers, so
+                # test the centers against the outline itself
+                outside |= ~shapely.dwithin(
+                    shapely.polygons(apt.boundary.coords),
+                    shapely.points(centers), margin,
+                )
+            for i in np.flatnonzero(outside).tolist():
+                space = apt.spaces[i]
+                s_cx, s_cy = cx[i], cy[i]
+                errors.append(ValidationError(
+                    severity="error",
+                    element_type="Space",
+                    element_id=space.global_id,
+                    message=(
+                        f"E048: Room '{space.name}' ({space.room_type.value}) "
+                        f"center at ({s_cx:.1f},{s_cy:.1f}) is outside "
+                        f"apartment '{apt.name}' boundary "
+                        f"(x={apt_min_x:.1f}→{apt_max_x:.1f}, "
+                        f"y={apt_min_y:.1f}→{apt_max_y:.1f}). "
+                        f"Room is physically disconnected from apartment."
+                    ),
+                ))
 
             # E042/E043: Bedroom dimensions
-            bedrooms = apt.get_space_by_type(RoomType.BEDROOM)
+            bedrooms = by_type[RoomType.BEDROOM]
             for i, br in enumerate(bedrooms):
-                verts = br.boundary.vertices
-                br_min_x = min(v.x for v in verts)
-                br_max_x = max(v.x for v in verts)
-                br_min_y = min(v.y for v in verts)
-                br_max_y = max(v.y for v in verts)
-                br_width = br_max_x - br_min_x
-                br_depth = br_max_y - br_min_y
+                br_width, _ = _extent(br.boundary)
                 br_area = br.area
 
                 is_master = i == 0 or "master" in (br.name or "").lower()
@@ -810,7 +910,6 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
                 min_area = MASTER_BEDROOM_MIN_AREA if is_master else CHILD_BEDROOM_MIN_AREA
 
                 # E042: Bedroom width check
-                actual_width = min(br_width, br_depth)  # Shorter dimension
                 facade_width = br_width  # Along façade (X axis)
                 if facade_width < min_width - 0.01:
                     errors.append(ValidationError(
@@ -839,35 +938,27 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
 
             # E044: Habitable room without window
             # Check if habitable rooms are on exterior wall (have façade access)
-            apt_verts = apt.boundary.vertices
-            apt_min_y = min(v.y for v in apt_verts)
-            apt_max_y = max(v.y for v in apt_verts)
+            dark = np.fromiter(
+                (sp.room_type in _E044_SKIP for sp in apt.spaces),
+                dtype=bool, count=len(apt.spaces),
+            )
 
-            for space in apt.spaces:
-                if space.room_type in (RoomType.BATHROOM, RoomType.TOILET,
-                                       RoomType.HALLWAY, RoomType.CORRIDOR,
-                                       RoomType.STORAGE):
-                    continue  # Dark rooms allowed
-
-                # Check if room touches an exterior wall
-                s_verts = space.boundary.vertices
-                s_min_y = min(v.y for v in s_verts)
-                s_max_y = max(v.y for v in s_verts)
-
-                touches_facade = (
-                    abs(s_min_y) < 0.01 or
-                    abs(s_max_y - building_depth) < 0.01
-                )
-                if not touches_facade:
-                    errors.append(ValidationError(
-                        severity="error",
-                        element_type="Space",
-                        element_id=space.global_id,
-                        message=(
-                            f"E044: Room '{space.name}' ({space.room_type.value}) "
-                            f"has no façade access — habitable rooms need windows."
-                        ),
-                    ))
+            # Check if room touches an exterior wall
+            touches_facade = (
+                (np.abs(boxes[:, 1]) < 0.01)
+                | (np.abs(boxes[:, 3] - building_depth) < 0.01)
+            )
+            for i in np.flatnonzero(~dark & ~touches_facade).tolist():
+                space = apt.spaces[i]
+                errors.append(ValidationError(
+                    severity="error",
+                    element_type="Space",
+                    element_id=space.global_id,
+                    message=(
+                        f"E044: Room '{space.name}' ({space.room_type.value}) "
+                        f"has no façade access — habitable rooms need windows."
+                    ),
+                ))
 
             # E045: 2+ bedrooms but no separate WC
             if len(bedrooms) >= 2:
@@ -884,7 +975,7 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
                     ))
 
             # W040: Vorraum > 10% of apartment area
-            hallways = apt.get_space_by_type(RoomType.HALLWAY)
+            hallways = by_type[RoomType.HALLWAY]
             vorraum_area = sum(h.area for h in hallways)
             if apt.area > 0 and vorraum_area > apt.area * MAX_VORRAUM_AREA_PCT + 0.01:
                 errors.append(ValidationError(
@@ -903,26 +994,21 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
             if kitchens and bathrooms:
                 kitchen = kitchens[0]
                 bathroom = bathrooms[0]
-                k_verts = kitchen.boundary.vertices
-                b_verts = bathroom.boundary.vertices
-
-                k_xs = [v.x for v in k_verts]
-                b_xs = [v.x for v in b_verts]
-                k_ys = [v.y for v in k_verts]
-                b_ys = [v.y for v in b_verts]
+                k_x0, k_y0, k_x1, k_y1 = kitchen.boundary.bbox
+                b_x0, b_y0, b_x1, b_y1 = bathroom.boundary.bbox
 
                 # Check if they share an edge (adjacent)
                 shared_x = (
-                    abs(max(k_xs) - max(b_xs)) < 0.1 or
-                    abs(min(k_xs) - min(b_xs)) < 0.1 or
-                    abs(max(k_xs) - min(b_xs)) < 0.1 or
-                    abs(min(k_xs) - max(b_xs)) < 0.1
+                    abs(k_x1 - b_x1) < 0.1 or
+                    abs(k_x0 - b_x0) < 0.1 or
+                    abs(k_x1 - b_x0) < 0.1 or
+                    abs(k_x0 - b_x1) < 0.1
                 )
                 shared_y = (
-                    abs(max(k_ys) - max(b_ys)) < 0.1 or
-                    abs(min(k_ys) - min(b_ys)) < 0.1 or
-                    abs(max(k_ys) - min(b_ys)) < 0.1 or
-                    abs(min(k_ys) - max(b_ys)) < 0.1
+                    abs(k_y1 - b_y1) < 0.1 or
+                    abs(k_y0 - b_y0) < 0.1 or
+                    abs(k_y1 - b_y0) < 0.1 or
+                    abs(k_y0 - b_y1) < 0.1
                 )
 
                 if not (shared_x or shared_y):
@@ -941,46 +1027,44 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
             # Only applies to habitable rooms (bedrooms, living rooms).
             # Service rooms (bathrooms, toilets, hallways, etc.) are naturally
             # narrow and excluded from this check.
-            for space in apt.spaces:
-                if space.room_type in (RoomType.HALLWAY, RoomType.CORRIDOR,
-                                       RoomType.STORAGE, RoomType.TOILET,
-                                       RoomType.BATHROOM, RoomType.KITCHEN):
-                    continue
-                s_verts = space.boundary.vertices
-                s_w = max(v.x for v in s_verts) - min(v.x for v in s_verts)
-                s_h = max(v.y for v in s_verts) - min(v.y for v in s_verts)
-                if s_w > 0 and s_h > 0:
-                    ratio = max(s_w, s_h) / min(s_w, s_h)
-                    narrow_dim = min(s_w, s_h)
-                    # Skip tunnel check if narrow dimension ≥ 3.0m —
-                    # rooms this wide are usable regardless of ratio
-                    # (e.g. 5.7×3.15m studio living room is fine)
-                    if ratio > MAX_ROOM_RATIO and narrow_dim < 3.0:
-                        errors.append(ValidationError(
-                            severity="warning",
-                            element_type="Space",
-                            element_id=space.global_id,
-                            message=(
-                                f"W042: Room '{space.name}' aspect ratio is "
-                                f"{ratio:.2f} (max {MAX_ROOM_RATIO}) — "
-                                f"tunnel-shaped room."
-                            ),
-                        ))
+            s_w = boxes[:, 2] - boxes[:, 0]
+            s_h = boxes[:, 3] - boxes[:, 1]
+            narrow_dim = np.minimum(s_w, s_h)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.maximum(s_w, s_h) / narrow_dim
+            service = np.fromiter(
+                (sp.room_type in _W042_SKIP for sp in apt.spaces),
+                dtype=bool, count=len(apt.spaces),
+            )
+            # Skip tunnel check if narrow dimension ≥ 3.0m —
+            # rooms this wide are usable regardless of ratio
+            # (e.g. 5.7×3.15m studio living room is fine)
+            tunnels = (
+                ~service & (s_w > 0) & (s_h > 0)
+                & (ratio > MAX_ROOM_RATIO) & (narrow_dim < 3.0)
+            )
+            for i in np.flatnonzero(tunnels).tolist():
+                space = apt.spaces[i]
+                errors.append(ValidationError(
+                    severity="warning",
+                    element_type="Space",
+                    element_id=space.global_id,
+                    message=(
+                        f"W042: Room '{space.name}' aspect ratio is "
+                        f"{ratio[i]:.2f} (max {MAX_ROOM_RATIO}) — "
+                        f"tunnel-shaped room."
+                    ),
+                ))
 
             # W043: Living room minimum façade width
             # Professional rule: living room needs ≥3.60m façade width for
             # 2-room apartments, ≥4.00m for 3+ room apartments.
             # "Façade width" approximated as the wider dimension of the room
             # (assumes room is oriented with one side along exterior wall).
-            living_rooms = [s for s in apt.spaces
-                           if s.room_type == RoomType.LIVING and s.boundary]
-            bedroom_count = sum(
-                1 for s in apt.spaces if s.room_type == RoomType.BEDROOM
-            )
+            living_rooms = [s for s in livings if s.boundary]
+            bedroom_count = len(bedrooms)
             for lr in living_rooms:
-                lr_verts = lr.boundary.vertices
-                lr_w = max(v.x for v in lr_verts) - min(v.x for v in lr_verts)
-                lr_h = max(v.y for v in lr_verts) - min(v.y for v in lr_verts)
+                lr_w, lr_h = _extent(lr.boundary)
                 facade_width = max(lr_w, lr_h)
                 min_width = 4.00 if bedroom_count >= 2 else 3.60
                 label = "3+ room" if bedroom_count >= 2 else "2-room"
@@ -1000,12 +1084,9 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
             # Professional rule: kitchen needs ≥2.20m width for functional
             # two-counter layout (60cm + 100cm passage + 60cm).
             # Better practice: ≥2.40m.
-            kitchens = [s for s in apt.spaces
-                        if s.room_type == RoomType.KITCHEN and s.boundary]
+            kitchens = [s for s in kitchens if s.boundary]
             for k in kitchens:
-                k_verts = k.boundary.vertices
-                k_w = max(v.x for v in k_verts) - min(v.x for v in k_verts)
-                k_h = max(v.y for v in k_verts) - min(v.y for v in k_verts)
+                k_w, k_h = _extent(k.boundary)
                 kitchen_width = min(k_w, k_h)  # narrower dimension
                 if kitchen_width < 2.20 - 0.01:  # 1cm tolerance for FP
                     errors.append(ValidationError(
@@ -1023,12 +1104,9 @@ def validate_phase5_rooms(building: Building) -> list[ValidationError]:
             # W045: WC (separate toilet) minimum width
             # Professional rule: WC minimum width 90cm.
             # If door is at the front (stirnseitig): minimum 100cm.
-            wcs = [s for s in apt.spaces
-                   if s.room_type == RoomType.TOILET and s.boundary]
+            wcs = [s for s in toilets if s.boundary]
             for wc in wcs:
-                wc_verts = wc.boundary.vertices
-                wc_w = max(v.x for v in wc_verts) - min(v.x for v in wc_verts)
-                wc_h = max(v.y for v in wc_verts) - min(v.y for v in wc_verts)
+                wc_w, wc_h = _extent(wc.boundary)
                 wc_width = min(wc_w, wc_h)  # narrower dimension
                 if wc_width < 0.90 - 0.01:  # 1cm tolerance for FP
                     errors.append(ValidationError(
@@ -1077,8 +1155,10 @@ def validate_apartment_connectivity(building: Building) -> list[ValidationError]
             if not apt.spaces:
                 continue
 
-            # Get the set of room names belonging to this apartment
-            apt_room_names = {space.name for space in apt.spaces}
+            # Rooms by name (first room wins on duplicate names) and the
+            # set of room names belonging to this apartment
+            by_name = {s.name: s for s in reversed(apt.spaces)}
+            apt_room_names = set(by_name)
 
             # Build spatial adjacency: rooms with overlapping boundaries
             # are considered connected (handles open-plan Wohnküche, etc.)
@@ -1088,11 +1168,13 @@ def validate_apartment_connectivity(building: Building) -> list[ValidationError]
             spaces_with_bounds = [
                 s for s in apt.spaces if s.boundary and s.boundary.vertices
             ]
-            for i, s1 in enumerate(spaces_with_bounds):
-                for s2 in spaces_with_bounds[i + 1:]:
-                    if _boundaries_overlap(s1, s2):
-                        spatial_neighbors[s1.name].add(s2.name)
-                        spatial_neighbors[s2.name].add(s1.name)
+            boxes = np.array(
+                [s.boundary.bbox for s in spaces_with_bounds], dtype=float
+            ).reshape(-1, 4)
+            for i, j in zip(*_overlapping_pairs(boxes)):
+                s1, s2 = spaces_with_bounds[i], spaces_with_bounds[j]
+                spatial_neighbors[s1.name].add(s2.name)
+                spatial_neighbors[s2.name].add(s1.name)
 
             # Find the entry point (Vorraum/hallway)
             entry_rooms = [
@@ -1123,11 +1205,11 @@ def validate_apartment_connectivity(building: Building) -> list[ValidationError]
             # Connectivity via: (a) doors, (b) spatial overlap.
             # Do NOT traverse through corridor, exterior, or other apartments.
             reachable: set[str] = set()
-            queue = list(entry_rooms)
+            queue = deque(entry_rooms)
             visited = set(entry_rooms)
 
             while queue:
-                current = queue.pop(0)
+                current = queue.popleft()
                 reachable.add(current)
 
                 # Door-connected neighbors (from connectivity graph)
@@ -1148,9 +1230,7 @@ def validate_apartment_connectivity(building: Building) -> list[ValidationError]
             # Check which apartment rooms are NOT reachable internally
             unreachable = apt_room_names - reachable
             for room_name in sorted(unreachable):
-                space = next(
-                    (s for s in apt.spaces if s.name == room_name), None
-                )
+                space = by_name.get(room_name)
                 room_type_str = space.room_type.value if space else "unknown"
                 errors.append(ValidationError(
                     severity="error",
@@ -1168,33 +1248,40 @@ def validate_apartment_connectivity(building: Building) -> list[ValidationError]
     return errors
 
 
-def _boundaries_overlap(s1: Space, s2: Space) -> bool:
-    """Check if two spaces have overlapping or touching boundaries.
+def _overlapping_pairs(
+    boxes: np.ndarray, eps: float = 0.01,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find index pairs ``i < j`` whose bounding boxes overlap or touch.
 
-    Two rectangular spaces overlap if their bounding boxes overlap
+    ``boxes`` is an (N, 4) array of (xmin, ymin, xmax, ymax) rows. Two
+    rectangular spaces are connected if their bounding boxes overlap
     (share area) or share an edge (touching boundaries count as
-    connected for open-plan layouts).
-    """
-    v1 = s1.boundary.vertices
-    v2 = s2.boundary.vertices
-
-    x1_min = min(v.x for v in v1)
-    x1_max = max(v.x for v in v1)
-    y1_min = min(v.y for v in v1)
-    y1_max = max(v.y for v in v1)
+    connected for open-plan layouts). ``eps`` is the tolerance for
+    floating point comparison.
 
-    x2_min = min(v.x for v in v2)
-    x2_max = max(v.x for v in v2)
-    y2_min = min(v.y for v in v2)
-    y2_max = max(v.y for v in v2)
-
-    # Check for overlap or touching (shared edge).
-    # Use a small tolerance for floating point comparison.
-    eps = 0.01
-    overlap_x = x1_min < x2_max + eps and x2_min < x1_max + eps
-    overlap_y = y1_min < y2_max + eps and y2_min < y1_max + eps
-
-    return overlap_x and overlap_y
+    Sweeps along x: with the boxes sorted by ``xmin``, a box can only meet
+    the ones that start before it ends, so only those candidates get the
+    full test. Pairs come back sorted by ``(i, j)``.
+    """
+    x0, y0, x1, y1 = boxes.T
+    n = len(boxes)
+    order = np.argsort(x0, kind="stable")
+    # Sorted positions past a are candidates up to the first box
+    # starting at or beyond a's end
+    stop = np.searchsorted(x0[order], x1[order] + eps, side="left")
+    counts = np.maximum(stop - np.arange(n) - 1, 0)
+    a = np.repeat(np.arange(n), counts)
+    starts = np.cumsum(counts) - counts
+    b = a + 1 + np.arange(len(a)) - np.repeat(starts, counts)
+    p, q = order[a], order[b]
+    hit = (
+        (x0[p] < x1[q] + eps) & (x0[q] < x1[p] + eps)
+        & (y0[p] < y1[q] + eps) & (y0[q] < y1[p] + eps)
+    )
+    i = np.minimum(p, q)[hit]
+    j = np.maximum(p, q)[hit]
+    keep = np.lexsort((j, i))
+    return i[keep], j[keep]
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -1215,10 +1302,18 @@ def validate_phase6_vertical(building: Building) -> list[ValidationError]:
 
         # E050: Load-bearing walls not vertically aligned
         upper_bearing = [w for w in upper.walls if w.load_bearing]
-        lower_bearing = [w for w in lower.walls if w.load_bearing]
+        lower_bearing = sorted(
+            (w for w in lower.walls if w.load_bearing), key=_min_x,
+        )
+        lower_xs = [_min_x(w) for w in lower_bearing]
 
         for wall in upper_bearing:
-            if not _has_aligned_wall(wall, lower_bearing, tolerance=0.1):
+            # Aligned walls (either orientation) share their min x within
+            # tolerance, so only that slice of the sorted list is scanned
+            x = _min_x(wall)
+            lo = bisect_left(lower_xs, x - 0.1)
+            hi = bisect_right(lower_xs, x + 0.1)
+            if not _has_aligned_wall(wall, lower_bearing[lo:hi], tolerance=0.1):
                 errors.append(ValidationError(
                     severity="error",
                     element_type="Wall",
@@ -1253,35 +1348,196 @@ def validate_phase6_vertical(building: Building) -> list[ValidationError]:
 
     # W050: Installation shafts not vertically aligned
     # Detect via wet room positions across floors
+    wet = [_get_wet_room_positions(story) for story in stories]
     for i in range(1, len(stories)):
         upper = stories[i]
         lower = stories[i - 1]
 
-        upper_wet = _get_wet_room_positions(upper)
-        lower_wet = _get_wet_room_positions(lower)
+        upper_wet = wet[i]
+        lower_wet = wet[i - 1]
+        if not len(lower_wet):
+            continue
 
-        for pos_u in upper_wet:
-            has_match = any(
-                abs(pos_u[0] - pos_l[0]) < 1.0 and abs(pos_u[1] - pos_l[1]) < 1.0
-                for pos_l in lower_wet
-            )
-            if not has_match and lower_wet:
-                errors.append(ValidationError(
-                    severity="warning",
-                    element_type="Story",
-                    element_id=upper.global_id,
-                    message=(
-                        f"W050: Wet room at ({pos_u[0]:.1f}, {pos_u[1]:.1f}) "
-                        f"on '{upper.name}' has no aligned wet room below on "
-                        f"'{lower.name}' — installation shaft misalignment."
-                    ),
-                ))
+        # (U, L) pairs within 1m on both axes
+        near = (
+            (np.abs(upper_wet[:, None, 0] - lower_wet[None, :, 0]) < 1.0)
+            & (np.abs(upper_wet[:, None, 1] - lower_wet[None, :, 1]) < 1.0)
+        )
+        for k in np.flatnonzero(~near.any(axis=1)):
+            pos_u = upper_wet[k]
+            errors.append(ValidationError(
+                severity="warning",
+                element_type="Story",
+                element_id=upper.global_id,
+                message=(
+                    f"W050: Wet room at ({pos_u[0]:.1f}, {pos_u[1]:.1f}) "
+                    f"on '{upper.name}' has no aligned wet room below on "
+                    f"'{lower.name}' — installation shaft misalignment."
+                ),
+            ))
 
     return errors
 
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
+def _e032_grid_step(
+    building_width: float,
+    building_depth: float,
+    min_region_area: float = 1.0,
+    target_cells: int = 2500,
+) -> float:
+    """E032 sample spacing: 0.5m, coarser on floors past ``target_cells``.
+
+    Large floors get a spacing that keeps roughly ``target_cells`` samples,
+    capped so that at least two cells still fit in ``min_region_area``.
+    """
+    step = max(0.5, math.sqrt(building_width * building_depth / target_cells))
+    return min(step, math.sqrt(min_region_area / 2))
+
+
+def _find_unassigned_regions(
+    zones: np.ndarray | list[tuple[float, float, float, float]],
+    zone_polygons: list[Polygon2D],
+    building_width: float,
+    building_depth: float,
+    grid_step: float,
+    tolerance: float = 0.05,
+    min_region_area: float = 1.0,
+) -> list[tuple[float, float, float, float, float]]:
+    """E032 pipeline: sample, test coverage, cluster, and size the gaps.
+
+    Samples the floor at cell centres on a ``grid_step`` grid, marks points
+    within ``tolerance`` of a box zone (a ``(Z, 4)`` array or list of
+    ``(xmin, ymin, xmax, ymax)``) or a polygon zone as covered, and clusters the rest into 4-connected regions.
+    Returns ``(area, x_min, x_max, y_min, y_max)`` of every region of at
+    least ``min_region_area`` m², in row-major order of first cell.
+    """
+    nx = int(building_width / grid_step)
+    ny = int(building_depth / grid_step)
+    gx = np.arange(nx) * grid_step + grid_step / 2
+    gy = np.arange(ny) * grid_step + grid_step / 2
+
+    # Test every grid column/row against every box zone, then combine
+    z = np.asarray(zones, dtype=float).reshape(-1, 4)
+    in_x = (gx[:, None] >= z[:, 0] - tolerance) & (gx[:, None] <= z[:, 2] + tolerance)
+    in_y = (gy[:, None] >= z[:, 1] - tolerance) & (gy[:, None] <= z[:, 3] + tolerance)
+    covered = np.any(in_x[:, None, :] & in_y[None, :, :], axis=2)
+    if zone_polygons:
+        covered |= _polygons_cover(zone_polygons, gx, gy, tolerance)
+
+    # Each grid cell = grid_step² (0.25m² at 0.5m resolution)
+    found = []
+    for cells_x, cells_y in _label_regions(~covered):
+        region_area = len(cells_x) * grid_step * grid_step
+        if region_area >= min_region_area:
+            found.append((
+                region_area,
+                float(gx[min(cells_x)]), float(gx[max(cells_x)]),
+                float(gy[min(cells_y)]), float(gy[max(cells_y)]),
+            ))
+    return found
+
+
+def _quoted_names(names: list[str]) -> str:
+    """Join names for a message: 'A', 'B', 'C'."""
+    return ", ".join(f"'{name}'" for name in names)
+
+
+def _find_interval(
+    starts: list[float], ends: list[float], x: float,
+) -> int | None:
+    """Index of the first window ``starts[i] <= x <= ends[i]``, or None.
+
+    Windows come from merged (sorted, disjoint) intervals widened by a
+    tolerance, so both ``starts`` and ``ends`` ascend: the windows holding
+    ``x`` are a contiguous run beginning at the first end ≥ ``x``.
+    """
+    idx = bisect_left(ends, x)
+    if idx < len(starts) and starts[idx] <= x:
+        return idx
+    return None
+
+
+def _add_zone(
+    polygon: Polygon2D,
+    boxes: np.ndarray,
+    n_boxes: int,
+    polygons: list[Polygon2D],
+) -> int:
+    """Add an E032 coverage zone: a box for rectangles, else the polygon.
+
+    Boxes are written as row ``n_boxes`` of ``boxes``; returns the new
+    box count.
+    """
+    if polygon.is_axis_aligned_rect:
+        boxes[n_boxes] = polygon.bbox
+        return n_boxes + 1
+    polygons.append(polygon)
+    return n_boxes
+
+
+def _polygons_cover(
+    polygons: list[Polygon2D],
+    gx: np.ndarray,
+    gy: np.ndarray,
+    tolerance: float,
+) -> np.ndarray:
+    """(len(gx), len(gy)) mask of grid points within tolerance of any polygon.
+
+    Polygons are grown by ``tolerance`` (mitred, so straight edges move
+    outwards exactly like the box zones) and bulk-loaded into an STR tree;
+    all grid points are queried in one call.
+    """
+    tree = shapely.STRtree(shapely.buffer(
+        [shapely.Polygon(p.coords) for p in polygons],
+        tolerance, join_style="mitre",
+    ))
+    px, py = np.meshgrid(gx, gy, indexing="ij")
+    hits, _ = tree.query(shapely.points(px.ravel(), py.ravel()), predicate="intersects")
+    covered = np.zeros(px.size, dtype=bool)
+    covered[hits] = True
+    return covered.reshape(px.shape)
+
+
+def _label_regions(mask: np.ndarray) -> list[tuple[list[int], list[int]]]:
+    """4-connected regions of True cells in a 2-D bitmap.
+
+    Returns one ``(ix list, iy list)`` pair per region, ordered by each
+    region's first cell in row-major order.
+    """
+    nx, ny = mask.shape
+    open_cells = mask.tolist()
+    regions: list[tuple[list[int], list[int]]] = []
+    for ix0, iy0 in np.argwhere(mask).tolist():
+        if not open_cells[ix0][iy0]:
+            continue  # already part of an earlier region
+        open_cells[ix0][iy0] = False
+        cells_x, cells_y = [], []
+        stack = [(ix0, iy0)]
+        while stack:
+            ix, iy = stack.pop()
+            cells_x.append(ix)
+            cells_y.append(iy)
+            for jx, jy in ((ix + 1, iy), (ix - 1, iy), (ix, iy + 1), (ix, iy - 1)):
+                if 0 <= jx < nx and 0 <= jy < ny and open_cells[jx][jy]:
+                    open_cells[jx][jy] = False
+                    stack.append((jx, jy))
+        regions.append((cells_x, cells_y))
+    return regions
+
+
+def _extent(polygon: Polygon2D) -> tuple[float, float]:
+    """(width, height) of a polygon's cached bounding box."""
+    x0, y0, x1, y1 = polygon.bbox
+    return x1 - x0, y1 - y0
+
+
+def _min_x(wall: Wall) -> float:
+    """Smaller x of a wall's two endpoints (sort key for alignment lookups)."""
+    return min(wall.start.x, wall.end.x)
+
+
 def _has_aligned_wall(wall, candidates: list, tolerance: float) -> bool:
     """Check if a wall has a vertically aligned counterpart."""
     for other in candidates:
@@ -1296,32 +1552,25 @@ def _has_aligned_wall(wall, candidates: list, tolerance: float) -> bool:
 
 def _points_close(p1: Point2D, p2: Point2D, tolerance: float) -> bool:
     """Check if two points are within tolerance."""
-    return math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2) <= tolerance
+    return p1.distance_to(p2) <= tolerance
 
 
 def _staircases_aligned(st1, st2, tolerance: float) -> bool:
     """Check if two staircases are at the same XY position."""
-    c1 = _polygon_center(st1.outline)
-    c2 = _polygon_center(st2.outline)
+    c1 = st1.outline.center
+    c2 = st2.outline.center
     return _points_close(c1, c2, tolerance)
 
 
-def _polygon_center(poly) -> Point2D:
-    """Calculate center of a polygon."""
-    xs = [v.x for v in poly.vertices]
-    ys = [v.y for v in poly.vertices]
-    return Point2D(x=sum(xs) / len(xs), y=sum(ys) / len(ys))
-
-
-def _get_wet_room_positions(story: Story) -> list[tuple[float, float]]:
-    """Get center positions of wet rooms on a storey."""
+def _get_wet_room_positions(story: Story) -> np.ndarray:
+    """Get center positions of wet rooms on a storey as a (K, 2) array."""
     positions = []
     for apt in story.apartments:
         for space in apt.spaces:
             if space.room_type in (RoomType.BATHROOM, RoomType.TOILET, RoomType.KITCHEN):
-                c = _polygon_center(space.boundary)
+                c = space.center
                 positions.append((c.x, c.y))
-    return positions
+    return np.array(positions, dtype=float).reshape(-1, 2)
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -1330,8 +1579,7 @@ def _get_wet_room_positions(story: Story) -> list[tuple[float, float]]:
 
 def _is_core_wall(wall) -> bool:
     """Check if a wall is part of the core (elevator, staircase, vestibule)."""
-    name = (wall.name or "").lower()
-    return any(kw in name for kw in CORE_WALL_KEYWORDS)
+    return _CORE_WALL_RE.search((wall.name or "").lower()) is not None
 
 
 def validate_core_integrity(building: Building) -> list[ValidationError]:
@@ -1420,13 +1668,6 @@ def validate_interior_enclosure(building: Building) -> list[ValidationError]:
 
     for story in building.stories:
         for apt in story.apartments:
-            # Collect all doors in this apartment's area
-            apt_verts = apt.boundary.vertices
-            apt_min_x = min(v.x for v in apt_verts)
-            apt_max_x = max(v.x for v in apt_verts)
-            apt_min_y = min(v.y for v in apt_verts)
-            apt_max_y = max(v.y for v in apt_verts)
-
             # Find doors whose names match this apartment
             apt_doors = [
                 d for d in story.doors
@@ -1460,11 +1701,7 @@ def validate_interior_enclosure(building: Building) -> list[ValidationError]:
             # E071: Bathroom must be enclosed by walls
             bathrooms = apt.get_space_by_type(RoomType.BATHROOM)
             for bath in bathrooms:
-                b_verts = bath.boundary.vertices
-                b_min_x = min(v.x for v in b_verts)
-                b_max_x = max(v.x for v in b_verts)
-                b_min_y = min(v.y for v in b_verts)
-                b_max_y = max(v.y for v in b_verts)
+                b_min_x, b_min_y, b_max_x, b_max_y = bath.boundary.bbox
 
                 # Check each edge of the bathroom for a wall
                 edges = [
@@ -1560,15 +1797,19 @@ def _edge_has_wall(
 # OPTIMIZATION VALIDATORS
 # ══════════════════════════════════════════════════════════════════════
 
-def validate_optimizations(building: Building) -> list[ValidationError]:
+def validate_optimizations(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """Optimization-level validators: layout improvements, not code violations."""
     errors: list[ValidationError] = []
-    errors.extend(_validate_dead_end_corridors(building))
+    errors.extend(_validate_dead_end_corridors(building, derived))
     errors.extend(_validate_windowless_alcoves(building))
     return errors
 
 
-def _validate_dead_end_corridors(building: Building) -> list[ValidationError]:
+def _validate_dead_end_corridors(
+    building: Building, derived: dict[int, _StoryDerived] | None = None,
+) -> list[ValidationError]:
     """O001: Flag corridor sections that extend past the last door (dead-ends).
 
     Dead-end corridors waste floor area that could be annexed to apartments.
@@ -1577,36 +1818,36 @@ def _validate_dead_end_corridors(building: Building) -> list[ValidationError]:
 
     for story in building.stories:
         # Find corridor walls (come in pairs: south + north)
-        corridor_walls = [w for w in story.walls if "corridor" in w.name.lower()]
+        info = _derive(story, derived)
+        corridor_walls = info.corridor_walls
         if not corridor_walls:
             continue
 
         # Group corridor wall pairs by segment (west/east/core)
         for cw in corridor_walls:
             # Skip core corridor segment — it connects to the core, not apartments
-            if "core" in cw.name.lower():
+            if "core" in info.wall_names[cw.global_id]:
                 continue
 
             cw_start_x = min(cw.start.x, cw.end.x)
             cw_end_x = max(cw.start.x, cw.end.x)
-            cw_y = cw.start.y  # corridor wall y coord
 
             # Find entry doors on this corridor wall
             door_positions = []
             for door in story.doors:
-                if door.wall_id == cw.global_id and "entry" in door.name.lower():
+                if (door.wall_id == cw.global_id
+                        and "entry" in info.door_names[door.global_id]):
                     door_positions.append(door.position)
 
             if not door_positions:
                 continue
 
-            cw_length = ((cw.end.x - cw.start.x)**2 + (cw.end.y - cw.start.y)**2)**0.5
+            cw_length = cw.length
             if cw_length < 0.01:
                 continue
 
-            # Direction vector
+            # Direction vector (x component; corridors run along x)
             dx = (cw.end.x - cw.start.x) / cw_length
-            dy = (cw.end.y - cw.start.y) / cw_length
 
             # Convert door positions to world x coordinates
             door_world_xs = []
@@ -1685,10 +1926,7 @@ def _validate_windowless_alcoves(building: Building) -> list[ValidationError]:
 
                 # L-shaped room detected (>4 vertices)
                 # Find the bounding box
-                xs = [v.x for v in verts]
-                ys = [v.y for v in verts]
-                min_x, max_x = min(xs), max(xs)
-                min_y, max_y = min(ys), max(ys)
+                min_x, min_y, max_x, max_y = space.boundary.bbox
                 bbox_area = (max_x - min_x) * (max_y - min_y)
                 actual_area = space.boundary.area
 
@@ -1704,8 +1942,7 @@ def _validate_windowless_alcoves(building: Building) -> list[ValidationError]:
                             if win.wall_id != wall.global_id:
                                 continue
                             # Check if window is within room's x/y range
-                            w_len = ((wall.end.x - wall.start.x)**2 +
-                                     (wall.end.y - wall.start.y)**2)**0.5
+                            w_len = wall.length
                             if w_len < 0.01:
                                 continue
                             ratio = win.position / w_len
@@ -16,10 +16,6 @@ from archicad_builder.models.building import Story
 from archicad_builder.models.geometry import Point2D
 
 
-def _distance(p1: Point2D, p2: Point2D) -> float:
-    return math.sqrt((p1.x - p2.x) ** 2 + (p1.y - p2.y) ** 2)
-
-
 @dataclass
 class SnapResult:
     """Result of snapping an endpoint."""
@@ -65,6 +61,7 @@ def snap_endpoints(
     for i, wall in enumerate(walls):
         for end_name in ["start", "end"]:
             endpoint = wall.start if end_name == "start" else wall.end
+            px, py = endpoint.x, endpoint.y
 
             best_dist = float("inf")
             best_target: tuple[Point2D, str, str] | None = None
@@ -73,9 +70,8 @@ def snap_endpoints(
             for j, other in enumerate(walls):
                 if i == j:
                     continue
-                for other_end in ["start", "end"]:
-                    other_point = other.start if other_end == "start" else other.end
-                    d = _distance(endpoint, other_point)
+                for other_end, other_point in (("start", other.start), ("end", other.end)):
+                    d = math.sqrt((px - other_point.x) ** 2 + (py - other_point.y) ** 2)
                     if 1e-10 < d < best_dist:  # Skip exact matches (already connected)
                         best_dist = d
                         best_target = (other_point, other.tag, other_end)
@@ -86,7 +82,7 @@ def snap_endpoints(
                     continue
                 proj = _project_onto_segment(endpoint, other.start, other.end)
                 if proj is not None:
-                    d = _distance(endpoint, proj)
+                    d = math.sqrt((px - proj.x) ** 2 + (py - proj.y) ** 2)
                     if 1e-10 < d < best_dist:
                         best_dist = d
                         best_target = (proj, other.tag, "body")
@@ -124,20 +120,18 @@ def _project_onto_segment(
     (not at endpoints — those are handled by endpoint-to-endpoint snapping).
     Returns None if projection falls outside the segment.
     """
-    dx = seg_end.x - seg_start.x
-    dy = seg_end.y - seg_start.y
+    sx, sy = seg_start.x, seg_start.y
+    dx = seg_end.x - sx
+    dy = seg_end.y - sy
     length_sq = dx * dx + dy * dy
 
     if length_sq < 1e-12:
         return None
 
-    t = ((point.x - seg_start.x) * dx + (point.y - seg_start.y) * dy) / length_sq
+    t = ((point.x - sx) * dx + (point.y - sy) * dy) / length_sq
 
     # Only T-junctions (strictly inside, not at endpoints)
     if t <= 0.01 or t >= 0.99:
         return None
 
-    return Point2D(
-        x=seg_start.x + t * dx,
-        y=seg_start.y + t * dy,
-    )
+    return Point2D(x=sx + t * dx, y=sy + t * dy)
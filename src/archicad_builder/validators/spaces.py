@@ -30,11 +30,7 @@ def validate_room_sizes(story: Story) -> list[ValidationError]:
     """
     errors: list[ValidationError] = []
 
-    all_spaces = list(story.spaces)
-    for apt in story.apartments:
-        all_spaces.extend(apt.spaces)
-
-    for space in all_spaces:
+    for space in story.all_spaces:
         min_area = MIN_ROOM_AREAS.get(space.room_type)
         if min_area is not None and space.area < min_area:
             errors.append(
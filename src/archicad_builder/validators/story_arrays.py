@@ -0,0 +1,66 @@
+"""Struct-of-arrays view of a story's walls.
+
+Validators that do geometric work over every wall (bearing alignment,
+wall closure, connectivity) read the same per-wall columns. StoryArrays
+gathers them in one attribute-access pass so the checks can work on
+contiguous NumPy arrays instead of re-walking ``story.walls``.
+
+The view is a snapshot: build it at the start of a validation pass, after
+any edits to the story.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from archicad_builder.models.building import Story
+from archicad_builder.models.elements import Wall
+
+
+@dataclass
+class StoryArrays:
+    """Per-wall columns for one story, index-aligned with ``walls``."""
+
+    walls: list[Wall]
+    sx: np.ndarray
+    sy: np.ndarray
+    ex: np.ndarray
+    ey: np.ndarray
+    thickness: np.ndarray
+    load_bearing: np.ndarray  # bool
+    is_external: np.ndarray  # bool
+    names: list[str]  # wall name, falling back to global_id
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Wall start points as an (N, 2) array."""
+        return np.column_stack((self.sx, self.sy))
+
+    @property
+    def ends(self) -> np.ndarray:
+        """Wall end points as an (N, 2) array."""
+        return np.column_stack((self.ex, self.ey))
+
+
+def story_arrays(story: Story) -> StoryArrays:
+    """Build the struct-of-arrays view of a story's walls."""
+    walls = list(story.walls)
+    rows = [
+        (w.start.x, w.start.y, w.end.x, w.end.y, w.thickness,
+         w.load_bearing, w.is_external)
+        for w in walls
+    ]
+    cols = np.array(rows, dtype=float).reshape(-1, 7).T
+    return StoryArrays(
+        walls=walls,
+        sx=cols[0],
+        sy=cols[1],
+        ex=cols[2],
+        ey=cols[3],
+        thickness=cols[4],
+        load_bearing=cols[5].astype(bool),
+        is_external=cols[6].astype(bool),
+        names=[w.name or w.global_id for w in walls],
+    )
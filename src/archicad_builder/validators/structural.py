@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from archicad_builder.models.building import Story, Wall
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """A single validation issue."""
 
@@ -5,6 +5,7 @@ Tests the complete generation pipeline and all phase validators.
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from archicad_builder.generators.building_4apt import (
@@ -23,14 +24,28 @@ from archicad_builder.generators.building_4apt import (
 )
 from archicad_builder.validators.phases import (
     validate_all_phases,
+    validate_all_phases_parallel,
+    validate_apartment_connectivity,
+    validate_core_integrity,
+    validate_interior_enclosure,
+    validate_optimizations,
     validate_phase1_shell,
     validate_phase2_core,
     validate_phase3_corridor,
     validate_phase4_facade,
     validate_phase5_rooms,
     validate_phase6_vertical,
+    _StoryDerived,
+    _e032_grid_step,
+    _find_interval,
+    _find_unassigned_regions,
+    _label_regions,
+    _overlapping_pairs,
+    _polygons_cover,
 )
-from archicad_builder.models.spaces import RoomType
+from archicad_builder.models.building import Building
+from archicad_builder.models.geometry import Point2D, Polygon2D
+from archicad_builder.models.spaces import Apartment, RoomType, Space
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -167,7 +182,20 @@ class TestPhase2Core:
         # Don't place core — no staircases
         errors = validate_phase2_core(b)
         e010 = [e for e in errors if "E010" in e.message]
-        assert len(e010) == 4  # One per floor
+        assert len(e010) == 1  # One error naming every floor
+        for story in b.stories:
+            assert f"'{story.name}'" in e010[0].message
+
+    def test_e011_aggregates_stories_without_core_door(self):
+        """E011: one error listing every floor with no door to the core."""
+        b = generate_shell_v2()
+        errors = validate_phase2_core(b)
+        e011 = [e for e in errors if "E011" in e.message]
+        assert len(e011) == 1
+        assert e011[0].element_type == "Building"
+        assert e011[0].message.startswith("E011: Stories ")
+        for story in b.stories:
+            assert f"'{story.name}'" in e011[0].message
 
     def test_e013_no_entrance(self):
         """E013: no building entrance → ERROR."""
@@ -232,6 +260,86 @@ class TestPhase3Corridor:
         carve_corridor_v2(b, ci)
         assert ci["corridor_width"] >= 1.20
 
+    def test_story_derived_splits_corridor_sides(self):
+        b = generate_shell_v2()
+        ci = place_core_v2(b)
+        carve_corridor_v2(b, ci)
+        story = b.stories[0]
+        d = _StoryDerived.build(story)
+        assert d.width > 0 and d.depth > 0
+        assert d.south_corridor and d.north_corridor
+        assert all("south" in w.name.lower() for w in d.south_corridor)
+        assert all("north" in w.name.lower() for w in d.north_corridor)
+        assert set(map(id, d.south_corridor + d.north_corridor)) <= set(
+            map(id, d.corridor_walls)
+        )
+        assert len(d.floor_slabs) == 1
+        for w in story.walls:
+            assert d.wall_names[w.global_id] == w.name.lower()
+
+    def test_e021_pairs_corridor_sides_by_segment(self):
+        """E021 compares each south wall only with its same-suffix north wall."""
+        b = Building(name="E021")
+        b.add_story("GF", height=2.89)
+        b.add_wall("GF", (0, 2), (5, 2), 2.5, 0.1, name="Corridor South West")
+        b.add_wall("GF", (0, 3), (5, 3), 2.5, 0.1, name="Corridor North West")
+        b.add_wall("GF", (5, 2), (10, 2), 2.5, 0.1, name="Corridor South East")
+        b.add_wall("GF", (5, 4), (10, 4), 2.5, 0.1, name="Corridor North East")
+        e021 = [e for e in validate_phase3_corridor(b) if "E021" in e.message]
+        assert len(e021) == 1
+        assert "(west)" in e021[0].message
+
+    def test_find_interval_matches_first_containing_window(self):
+        # Widened by 1.0, the first two windows overlap around x=3.5
+        merged = [(0.0, 3.0), (3.8, 6.0), (9.0, 10.0)]
+        starts = [lo - 1.0 for lo, _ in merged]
+        ends = [hi + 1.0 for _, hi in merged]
+        for x in [-2.0, -0.5, 2.0, 3.5, 4.5, 7.5, 8.5, 11.0, 12.0]:
+            linear = next(
+                (i for i, (lo, hi) in enumerate(zip(starts, ends))
+                 if lo <= x <= hi),
+                None,
+            )
+            assert _find_interval(starts, ends, x) == linear
+        assert _find_interval(starts, ends, 3.5) == 0
+        assert _find_interval(starts, ends, 7.5) is None
+
+    def test_overlapping_pairs_counts_touching_boxes(self):
+        boxes = np.array([
+            [0.0, 0.0, 2.0, 2.0],
+            [2.0, 0.0, 4.0, 2.0],    # shares an edge with box 0
+            [1.0, 1.0, 3.0, 3.0],    # overlaps boxes 0 and 1
+            [5.0, 5.0, 6.0, 6.0],    # isolated
+        ])
+        i, j = _overlapping_pairs(boxes)
+        assert list(zip(i.tolist(), j.tolist())) == [(0, 1), (0, 2), (1, 2)]
+
+    def test_overlapping_pairs_sweep_matches_all_pairs(self):
+        rng = np.random.default_rng(7)
+        lo = np.round(rng.uniform(0, 30, (40, 2)), 1)
+        boxes = np.hstack([lo, lo + np.round(rng.uniform(0, 4, (40, 2)))])
+        x0, y0, x1, y1 = boxes.T
+        eps = 0.01
+        every = (
+            (x0[:, None] < x1[None, :] + eps) & (x0[None, :] < x1[:, None] + eps)
+            & (y0[:, None] < y1[None, :] + eps) & (y0[None, :] < y1[:, None] + eps)
+        )
+        expected = np.nonzero(np.triu(every, k=1))
+        i, j = _overlapping_pairs(boxes)
+        assert (i.tolist(), j.tolist()) == (expected[0].tolist(), expected[1].tolist())
+
+    def test_story_derived_extent_of_named_walls(self):
+        b = generate_shell_v2()
+        ci = place_core_v2(b)
+        carve_corridor_v2(b, ci)
+        story = b.stories[0]
+        d = _StoryDerived.build(story)
+        south = d.wall_mask(lambda name: "south" in name and "corridor" in name)
+        xs = [c for w in d.south_corridor for c in (w.start.x, w.end.x)]
+        ys = [c for w in d.south_corridor for c in (w.start.y, w.end.y)]
+        assert south.sum() == len(d.south_corridor)
+        assert d.extent(south) == (min(xs), min(ys), max(xs), max(ys))
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Phase 4: Façade Subdivision Tests
@@ -286,6 +394,76 @@ class TestPhase4Facade:
                                and "entry" in (d.name or "").lower()]
                 assert len(entry_doors) >= 1, f"{apt.name} has no entry door"
 
+    def test_story_derived_entry_doors_per_apartment(self):
+        b = generate_shell_v2()
+        ci = place_core_v2(b)
+        carve_corridor_v2(b, ci)
+        subdivide_apartments_v2(b, ci)
+
+        story = b.stories[1]
+        d = _StoryDerived.build(story)
+        for apt in story.apartments:
+            expected = [door for door in story.doors
+                        if apt.name.lower() in door.name.lower()
+                        and "entry" in door.name.lower()]
+            assert d.entries_for(apt.name.lower()) == expected
+            # Repeat lookups reuse the same list
+            assert d.entries_for(apt.name.lower()) is d.entries_for(apt.name.lower())
+
+    def test_label_regions_groups_4_connected_cells(self):
+        mask = np.array([
+            [1, 1, 0, 0],
+            [0, 1, 0, 1],
+            [1, 0, 0, 1],
+        ], dtype=bool)
+        regions = _label_regions(mask)
+        # Ordered by first cell in row-major order; diagonals don't connect
+        assert [sorted(zip(xs, ys)) for xs, ys in regions] == [
+            [(0, 0), (0, 1), (1, 1)],
+            [(1, 3), (2, 3)],
+            [(2, 0)],
+        ]
+
+    def test_polygons_cover_uses_real_outline(self):
+        """An L-shaped zone doesn't cover its bounding box's missing corner."""
+        l_shape = Polygon2D(vertices=[
+            Point2D(x=0, y=0), Point2D(x=4, y=0), Point2D(x=4, y=2),
+            Point2D(x=2, y=2), Point2D(x=2, y=4), Point2D(x=0, y=4),
+        ])
+        gx = np.array([1.0, 2.04, 3.0])
+        gy = np.array([1.0, 3.0])
+        covered = _polygons_cover([l_shape], gx, gy, 0.05)
+        # x=3, y=3 lies in the notch; x=2.04 is within tolerance of the edge
+        assert covered.tolist() == [[True, True], [True, True], [True, False]]
+
+    def test_polygons_cover_mixed_vertex_counts(self):
+        """Zones with different vertex counts are covered together."""
+        l_shape = Polygon2D(vertices=[
+            Point2D(x=0, y=0), Point2D(x=4, y=0), Point2D(x=4, y=2),
+            Point2D(x=2, y=2), Point2D(x=2, y=4), Point2D(x=0, y=4),
+        ])
+        pentagon = Polygon2D(vertices=[
+            Point2D(x=5, y=0), Point2D(x=8, y=0), Point2D(x=8, y=3),
+            Point2D(x=6.5, y=4), Point2D(x=5, y=3),
+        ])
+        gx = np.array([1.0, 3.0, 6.5])
+        gy = np.array([1.0, 3.0])
+        covered = _polygons_cover([l_shape, pentagon], gx, gy, 0.05)
+        assert covered.tolist() == [[True, True], [True, False], [True, True]]
+
+    def test_e032_grid_step_scales_with_floor_size(self):
+        assert _e032_grid_step(16.0, 12.0) == 0.5
+        assert _e032_grid_step(30.0, 30.0) == pytest.approx(0.6)
+        # Capped so a 1m² region still spans two cells
+        assert _e032_grid_step(60.0, 60.0) == pytest.approx(0.5 ** 0.5)
+
+    def test_find_unassigned_regions_reports_gap_extent(self):
+        """A 4×2 floor with the left 3m zoned leaves a 1×2m gap at the east."""
+        regions = _find_unassigned_regions([(0, 0, 3, 2)], [], 4.0, 2.0, 0.5)
+        assert regions == [(2.0, 3.25, 3.75, 0.25, 1.75)]
+        # Gaps under the minimum area are dropped
+        assert _find_unassigned_regions([(0, 0, 3.5, 1)], [], 4.0, 1.0, 0.5) == []
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Phase 5: Room Subdivision Tests
@@ -339,6 +517,32 @@ class TestPhase5Rooms:
                         f"{apt.name} has {len(bedrooms)} bedrooms but no WC"
                     )
 
+    def test_e048_checks_l_shaped_apartment_outline(self):
+        """A room in the notch of an L-shaped apartment is outside it."""
+        def rect(x0, y0, x1, y1):
+            return Polygon2D(vertices=[
+                Point2D(x0, y0), Point2D(x1, y0),
+                Point2D(x1, y1), Point2D(x0, y1),
+            ])
+
+        b = Building(name="L")
+        b.add_story("GF", height=2.89)
+        b.stories[0].apartments.append(Apartment(
+            name="Apt L",
+            boundary=Polygon2D(vertices=[
+                Point2D(0, 0), Point2D(10, 0), Point2D(10, 4),
+                Point2D(4, 4), Point2D(4, 10), Point2D(0, 10),
+            ]),
+            spaces=[
+                Space(name="Living", room_type=RoomType.LIVING,
+                      boundary=rect(0, 0, 10, 4)),
+                Space(name="Storage", room_type=RoomType.STORAGE,
+                      boundary=rect(6, 6, 9, 9)),
+            ],
+        ))
+        e048 = [e for e in validate_phase5_rooms(b) if "E048" in e.message]
+        assert [e.message.split("'")[1] for e in e048] == ["Storage"]
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Phase 6: Vertical Consistency Tests
@@ -353,6 +557,20 @@ class TestPhase6Vertical:
         e050 = [e for e in errors if "E050" in e.message]
         assert len(e050) == 0, f"Bearing wall misalignment: {e050}"
 
+    def test_reversed_bearing_wall_aligned(self):
+        """A bearing wall drawn end→start above its match still aligns."""
+        b = Building(name="Test")
+        b.add_story("GF", height=3.0)
+        b.add_story("1F", height=3.0)
+        b.add_wall("GF", (0, 0), (10, 0), 3.0, 0.25).load_bearing = True
+        b.add_wall("GF", (0, 5), (10, 5), 3.0, 0.25).load_bearing = True
+        b.add_wall("1F", (10.05, 5), (0, 5), 3.0, 0.25).load_bearing = True
+        b.add_wall("1F", (0, 2), (10, 2), 3.0, 0.25).load_bearing = True
+
+        errors = validate_phase6_vertical(b)
+        e050 = [e for e in errors if "E050" in e.message]
+        assert len(e050) == 1
+
     def test_core_aligned(self):
         b = generate_building_4apt()
         errors = validate_phase6_vertical(b)
@@ -416,6 +634,33 @@ class TestFullPipeline:
             msgs = "\n".join(f"  {e.message}" for e in v2_errors)
             pytest.fail(f"Phase validation errors:\n{msgs}")
 
+    def test_all_phases_skips_apartment_validators_without_apartments(self):
+        assert validate_all_phases(Building(name="Empty")) == []
+
+        b = generate_shell_v2()
+        ci = place_core_v2(b)
+        carve_corridor_v2(b, ci)
+        individual = [
+            e
+            for validator in (
+                validate_phase1_shell, validate_phase2_core,
+                validate_phase3_corridor, validate_phase4_facade,
+                validate_phase5_rooms, validate_apartment_connectivity,
+                validate_phase6_vertical, validate_core_integrity,
+                validate_interior_enclosure, validate_optimizations,
+            )
+            for e in validator(b)
+        ]
+        combined = validate_all_phases(b)
+        assert [e.message for e in combined] == [e.message for e in individual]
+
+    def test_all_phases_parallel_matches_serial(self):
+        b = generate_building_4apt()
+        serial = [(e.element_id, e.message) for e in validate_all_phases(b)]
+        parallel = validate_all_phases_parallel(b, workers=3)
+        assert [(e.element_id, e.message) for e in parallel] == serial
+        assert validate_all_phases_parallel(Building(name="Empty")) == []
+
     def test_existing_validators_still_pass(self):
         """The new building should also pass existing validators."""
         b = generate_building_4apt()
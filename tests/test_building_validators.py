@@ -11,7 +11,13 @@ from archicad_builder.validators.building import (
     validate_slab_completeness,
     validate_wall_closure,
     validate_building,
+    validate_all,
+    validate_all_parallel,
 )
+from archicad_builder.validators.codes import validate_building_codes
+from archicad_builder.validators.connectivity import validate_connectivity
+from archicad_builder.validators.structural import validate_story
+from archicad_builder.validators.story_arrays import story_arrays
 from archicad_builder.generators.shell import generate_shell
 from archicad_builder.generators.core import place_vertical_core
 
@@ -77,6 +83,32 @@ class TestBearingWallAlignment:
         errors = validate_bearing_wall_alignment(b)
         assert len(errors) == 0
 
+    def test_endpoints_must_match_same_lower_wall(self):
+        """Endpoints matching two different walls below is not alignment."""
+        b = Building(name="Test")
+        b.add_story("GF", height=3.0)
+        b.add_story("1F", height=3.0)
+
+        for start, end in [((0, 0), (0, 5)), ((10, 0), (10, 5))]:
+            b.add_wall("GF", start, end, 3.0, 0.25).load_bearing = True
+        # Spans x=0 → x=10: start matches one wall, end matches the other
+        b.add_wall("1F", (0, 0), (10, 0.05), 3.0, 0.25).load_bearing = True
+
+        errors = validate_bearing_wall_alignment(b)
+        assert len(errors) == 1
+
+    def test_offset_within_tolerance_across_grid_cells(self):
+        """Endpoints in neighbouring hash-grid cells still match."""
+        b = Building(name="Test")
+        b.add_story("GF", height=3.0)
+        b.add_story("1F", height=3.0)
+
+        b.add_wall("GF", (0.13, 0), (10.13, 0), 3.0, 0.25).load_bearing = True
+        b.add_wall("1F", (0.21, 0), (10.21, 0), 3.0, 0.25).load_bearing = True
+
+        errors = validate_bearing_wall_alignment(b)
+        assert len(errors) == 0
+
     def test_single_story_no_check(self):
         """Single-storey building has nothing to align."""
         b = generate_shell(num_floors=1)
@@ -183,6 +215,33 @@ class TestWallClosure:
         assert len(errors) == 0
 
 
+class TestStoryArrays:
+    """Tests for the struct-of-arrays wall view."""
+
+    def test_columns_match_walls(self):
+        b = Building(name="Test")
+        b.add_story("GF", height=3.0)
+        w1 = b.add_wall("GF", (0, 0), (10, 0), 3.0, 0.25, name="South")
+        w1.load_bearing = True
+        w1.is_external = True
+        b.add_wall("GF", (5, 0), (5, 4), 3.0, 0.10)
+
+        sa = story_arrays(b.stories[0])
+        assert sa.starts.tolist() == [[0, 0], [5, 0]]
+        assert sa.ends.tolist() == [[10, 0], [5, 4]]
+        assert sa.thickness.tolist() == [0.25, 0.10]
+        assert sa.load_bearing.tolist() == [True, False]
+        assert sa.is_external.tolist() == [True, False]
+        assert sa.names == ["South", sa.walls[1].global_id]
+
+    def test_empty_story(self):
+        b = Building(name="Test")
+        b.add_story("GF", height=3.0)
+        sa = story_arrays(b.stories[0])
+        assert sa.starts.shape == (0, 2)
+        assert sa.load_bearing.shape == (0,)
+
+
 class TestValidateBuildingIntegration:
     """Integration test: validate_building runs all building-level checks."""
 
@@ -199,3 +258,34 @@ class TestValidateBuildingIntegration:
         all_errors = b.validate()
         staircase_errors = [e for e in all_errors if "staircase" in e.message.lower()]
         assert len(staircase_errors) > 0
+
+    def test_validate_all_matches_individual_validators(self):
+        """Single-pass validation reports the same issues as the separate runs."""
+        b = generate_shell(num_floors=3, width=12, depth=9)
+        place_vertical_core(b, core_x=4, core_y=3)
+        b.add_wall(b.stories[1].name, (2, 2), (4, 2), 3.0, 0.25).load_bearing = True
+        b.stories[2].slabs.clear()
+
+        def key(e):
+            return (e.severity, e.element_type, e.element_id, e.message)
+
+        expected = []
+        for story in b.stories:
+            expected += validate_story(story) + validate_connectivity(story)
+        expected += validate_building(b) + validate_building_codes(b)
+
+        actual = validate_all(b)
+        assert expected
+        assert sorted(map(key, actual)) == sorted(map(key, expected))
+
+    def test_validate_all_parallel_matches_serial(self):
+        """Process-parallel validation returns the serial result, in order."""
+        b = generate_shell(num_floors=3, width=12, depth=9)
+        b.add_wall(b.stories[1].name, (2, 2), (4, 2), 3.0, 0.25).load_bearing = True
+
+        def key(e):
+            return (e.severity, e.element_type, e.element_id, e.message)
+
+        parallel = validate_all_parallel(b, workers=2)
+        assert list(map(key, parallel)) == list(map(key, validate_all(b)))
+        assert all(w.tag for s in b.stories for w in s.walls)
@@ -144,6 +144,15 @@ class TestDoorWidths:
         assert len(errors) >= 1
         assert any("apartment entry" in e.message for e in errors)
 
+    def test_building_keyword_wins_over_earlier_entry(self):
+        b = generate_shell(num_floors=1, width=10, depth=8)
+        b.add_wall("Ground Floor", (0, 0), (5, 0), 3.0, 0.15, name="W")
+        b.add_door("Ground Floor", "W", position=1.0, width=0.95, height=2.1,
+                    name="Entry Door (Building)")
+        errors = validate_door_widths(b)
+        # 0.95m passes apartment entry but not the 1.00m building entry minimum
+        assert any("building entry" in e.message for e in errors)
+
 
 class TestCeilingHeight:
     """Tests for ceiling height validator."""
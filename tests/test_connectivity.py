@@ -107,6 +107,18 @@ def test_find_connections_corner_junctions(connected_box: Building):
     assert len(connections) == 8
 
 
+def test_unconnected_endpoint_reports_true_nearest():
+    """Gap warnings name the nearest wall even when it lies beyond tolerance."""
+    b = Building(name="Far")
+    b.add_story("GF", height=3.0)
+    b.add_wall("GF", (0, 0), (10, 0), 3.0, 0.2)
+    b.add_wall("GF", (20, 0), (30, 0), 3.0, 0.2)
+    _, errors = find_connections(b.stories[0], tolerance=0.02)
+    assert len(errors) == 4
+    assert "at 10.000m" in errors[1].message
+    assert "W2 start" in errors[1].message
+
+
 # ── Snap tests ────────────────────────────────────────────────────
 
 
@@ -39,6 +39,26 @@ class TestPoint2D:
         assert hash(p1) == hash(p2)
         assert len({p1, p2}) == 1
 
+    def test_immutable(self):
+        p = Point2D(x=1.0, y=2.0)
+        with pytest.raises(AttributeError):
+            p.x = 3.0
+
+    def test_coordinates_coerced_to_float(self):
+        p = Point2D(x=1, y=2)
+        assert isinstance(p.x, float) and isinstance(p.y, float)
+
+    def test_validated_as_model_field(self):
+        poly = Polygon2D.model_validate(
+            {"vertices": [{"x": 0, "y": 0}, {"x": 4, "y": 0}, {"x": 0, "y": "3"}]}
+        )
+        assert poly.vertices[2] == Point2D(x=0.0, y=3.0)
+        assert poly.model_dump()["vertices"][1] == {"x": 4.0, "y": 0.0}
+        with pytest.raises(ValueError):
+            Polygon2D.model_validate(
+                {"vertices": [{"x": 0}, {"x": 4, "y": 0}, {"x": 0, "y": 3}]}
+            )
+
 
 class TestPoint3D:
     def test_create(self):
@@ -84,6 +104,52 @@ class TestPolygon2D:
         )
         assert math.isclose(poly.perimeter, 30.0)
 
+    def test_bbox_and_coords(self):
+        poly = Polygon2D(
+            vertices=[
+                Point2D(x=1, y=-2),
+                Point2D(x=6, y=0),
+                Point2D(x=3, y=4),
+            ]
+        )
+        assert poly.bbox == (1, -2, 6, 4)
+        assert poly.coords == ((1, -2), (6, 0), (3, 4))
+        poly.vertices = poly.vertices[:2] + [Point2D(x=0, y=1)]
+        assert poly.bbox == (0, -2, 6, 1)
+        assert poly.coords[-1] == (0, 1)
+
+    def test_center_refreshes_on_vertex_reassignment(self):
+        poly = Polygon2D(
+            vertices=[
+                Point2D(x=0, y=0),
+                Point2D(x=10, y=0),
+                Point2D(x=10, y=5),
+                Point2D(x=0, y=5),
+            ]
+        )
+        assert poly.center == Point2D(x=5, y=2.5)
+        poly.vertices = [Point2D(x=0, y=0), Point2D(x=4, y=0), Point2D(x=4, y=4)]
+        assert math.isclose(poly.center.x, 8 / 3)
+        assert math.isclose(poly.center.y, 4 / 3)
+
+    def test_cached_properties_refresh_on_model_copy(self):
+        poly = Polygon2D(
+            vertices=[
+                Point2D(x=0, y=0),
+                Point2D(x=10, y=0),
+                Point2D(x=10, y=5),
+                Point2D(x=0, y=5),
+            ]
+        )
+        assert poly.bbox == (0, 0, 10, 5) and poly.is_axis_aligned_rect
+        tri = poly.model_copy(update={
+            "vertices": [Point2D(x=0, y=0), Point2D(x=3, y=0), Point2D(x=0, y=3)],
+        })
+        assert tri.bbox == (0, 0, 3, 3)
+        assert tri.center == Point2D(x=1, y=1)
+        assert tri.coords == ((0, 0), (3, 0), (0, 3))
+        assert not tri.is_axis_aligned_rect
+
     def test_min_vertices(self):
         with pytest.raises(ValueError, match="at least 3"):
             Polygon2D(vertices=[Point2D(x=0, y=0), Point2D(x=1, y=0)])
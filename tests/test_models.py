@@ -3,6 +3,7 @@
 import pytest
 
 from archicad_builder.models import (
+    Apartment,
     Building,
     Door,
     Point2D,
@@ -10,6 +11,7 @@ from archicad_builder.models import (
     Roof,
     RoofType,
     Slab,
+    Space,
     Story,
     VirtualElement,
     Wall,
@@ -38,6 +40,35 @@ class TestWall:
         )
         assert abs(wall.length - 5.0) < 1e-6
 
+    def test_derived_geometry_refreshes_on_endpoint_reassignment(self):
+        wall = Wall(
+            start=Point2D(x=0, y=0),
+            end=Point2D(x=4, y=0),
+            height=3.0,
+            thickness=0.2,
+        )
+        assert wall.center == Point2D(x=2, y=0)
+        assert wall.unit_normal == (-0.0, 1.0)
+        wall.start = Point2D(x=4, y=0)
+        wall.end = Point2D(x=4, y=6)
+        assert wall.center == Point2D(x=4, y=3)
+        assert abs(wall.length - 6.0) < 1e-9
+        assert wall.unit_tangent == (0.0, 1.0)
+        assert wall.unit_normal == (-1.0, 0.0)
+
+    def test_derived_geometry_refreshes_on_model_copy(self):
+        wall = Wall(
+            start=Point2D(x=0, y=0),
+            end=Point2D(x=4, y=0),
+            height=3.0,
+            thickness=0.2,
+        )
+        assert wall.length == 4.0 and wall.center == Point2D(x=2, y=0)
+        moved = wall.model_copy(update={"end": Point2D(x=10, y=0)})
+        assert moved.length == 10.0
+        assert moved.center == Point2D(x=5, y=0)
+        assert wall.length == 4.0
+
     def test_zero_length_rejected(self):
         with pytest.raises(ValueError, match="must be different"):
             Wall(
@@ -270,6 +301,65 @@ class TestStory:
         assert story.get_wall(wall.global_id) is not None
         assert story.get_wall(generate_ifc_id()) is None
 
+    def test_get_element_and_space_by_name(self):
+        wall = Wall(
+            start=Point2D(x=0, y=0),
+            end=Point2D(x=5, y=0),
+            height=3.0,
+            thickness=0.2,
+        )
+        square = Polygon2D(
+            vertices=[
+                Point2D(x=0, y=0),
+                Point2D(x=4, y=0),
+                Point2D(x=4, y=4),
+                Point2D(x=0, y=4),
+            ]
+        )
+        room = Space(name="Living Room", boundary=square)
+        apt = Apartment(name="Apt 1", boundary=square, spaces=[room])
+        story = Story(name="GF", height=3.0, walls=[wall], apartments=[apt])
+        assert story.get_element(wall.global_id) is wall
+        assert story.get_element(apt.global_id) is apt
+        assert story.get_element(room.global_id) is room
+        assert story.get_element(generate_ifc_id()) is None
+        assert story.get_space_by_name("living room") is room
+        assert story.get_space_by_name("Kitchen") is None
+        assert story.all_spaces == (room,)
+
+    def test_floor_slab_thickness(self):
+        outline = Polygon2D(
+            vertices=[
+                Point2D(x=0, y=0),
+                Point2D(x=10, y=0),
+                Point2D(x=10, y=8),
+                Point2D(x=0, y=8),
+            ]
+        )
+        story = Story(name="GF", height=3.0)
+        assert story.floor_slab_thickness == 0.0
+        story.slabs.append(Slab(outline=outline, thickness=0.30, is_floor=False))
+        story.slabs.append(Slab(outline=outline, thickness=0.25))
+        assert story.floor_slab_thickness == 0.25
+
+    def test_floor_slabs_and_area(self):
+        outline = Polygon2D(
+            vertices=[
+                Point2D(x=0, y=0),
+                Point2D(x=10, y=0),
+                Point2D(x=10, y=8),
+                Point2D(x=0, y=8),
+            ]
+        )
+        story = Story(name="GF", height=3.0)
+        assert story.floor_slabs == []
+        assert story.floor_area == 0
+        ceiling = Slab(outline=outline, thickness=0.30, is_floor=False)
+        floor = Slab(outline=outline, thickness=0.25)
+        story.slabs.extend([ceiling, floor])
+        assert story.floor_slabs == [floor]
+        assert story.floor_area == pytest.approx(80.0)
+
 
 class TestBuilding:
     def test_create_empty(self):
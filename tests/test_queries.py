@@ -11,6 +11,7 @@ from archicad_builder.queries.spatial import (
     find_above_below,
     extract_floor_context,
 )
+from archicad_builder.queries.wall_rooms import get_story_wall_rooms, get_wall_rooms
 
 
 class TestFindNeighbors:
@@ -49,6 +50,17 @@ class TestFindNeighbors:
         neighbors = find_neighbors(b, "Ground Floor", "nonexistent_id")
         assert len(neighbors) == 0
 
+    def test_max_distance_limits_results(self):
+        b = self._make_building()
+        wall = b.stories[0].walls[0]
+        near = find_neighbors(b, "Ground Floor", wall.global_id, max_distance=1.0)
+        far = find_neighbors(b, "Ground Floor", wall.global_id, max_distance=50.0)
+        assert all(n.distance <= 1.0 for n in near)
+        assert {n.element_id for n in near} <= {n.element_id for n in far}
+        # Every other element on the floor is within 50m
+        story = b.stories[0]
+        assert len(far) == len(story.walls) - 1 + len(story.spaces) + len(story.staircases)
+
 
 class TestFindAboveBelow:
     """Tests for vertical alignment queries."""
@@ -114,3 +126,23 @@ class TestExtractFloorContext:
         place_vertical_core(b, core_x=3, core_y=0)
         ctx = extract_floor_context(b, "Ground Floor")
         assert len(ctx.bearing_wall_names) > 4  # Exterior + core walls
+
+
+class TestStoryWallRooms:
+    """Tests for the per-floor wall-room batch query."""
+
+    def test_matches_per_wall_query(self):
+        b = generate_shell(num_floors=1, width=16, depth=12)
+        place_vertical_core(b, core_x=6.75, core_y=3.5)
+        carve_corridor(b, corridor_y=5.0, corridor_width=1.5)
+        subdivide_apartments(b, "Ground Floor", corridor_y=5.0)
+        story = b.stories[0]
+        relations = get_story_wall_rooms(b, "Ground Floor")
+        assert [r.wall_id for r in relations] == [w.global_id for w in story.walls]
+        assert any(r.side_a or r.side_b for r in relations)
+        names = [w.name for w in story.walls]
+        for rel in relations:
+            if names.count(rel.wall_name) == 1:
+                assert (rel.side_a, rel.side_b) == get_wall_rooms(
+                    b, "Ground Floor", rel.wall_name
+                )
@@ -5,10 +5,14 @@ wall-room relationships, building API extensions, and floor plan slice
 against the v3 building model.
 """
 
+import numpy as np
 import pytest
 from pathlib import Path
 
 from archicad_builder.models.building import Building
+from archicad_builder.models.elements import Wall
+from archicad_builder.models.geometry import Point2D, Polygon2D
+from archicad_builder.models.spaces import Space
 from archicad_builder.queries.connectivity import (
     ConnectivityGraph,
     GraphEdge,
@@ -17,6 +21,10 @@ from archicad_builder.queries.connectivity import (
     _point_in_polygon,
     _point_in_polygon_with_tolerance,
     _synthesize_common_zones,
+    _Zone,
+    _ZoneBuffer,
+    _ZoneIndex,
+    _find_zone_at_point,
 )
 from archicad_builder.queries.mermaid import graph_to_mermaid, graph_to_mermaid_simple
 from archicad_builder.validators.reachability import validate_reachability
@@ -25,6 +33,11 @@ from archicad_builder.queries.wall_rooms import (
     get_wall_rooms,
     get_room_exterior_walls,
     get_room_windows,
+    _find_containing_spaces,
+    _get_polygon_edges,
+    _points_in_polygon,
+    _points_in_polygon_with_tolerance,
+    _walls_touching_boundary,
 )
 from archicad_builder.queries.slice import extract_apartment, ApartmentSlice
 
@@ -192,6 +205,43 @@ class TestConnectivityGraphHelpers:
         assert not _point_in_polygon(-0.05, 0.5, square)
         assert _point_in_polygon_with_tolerance(-0.05, 0.5, square, tolerance=0.1)
 
+    def test_neighbors_index_tracks_new_edges(self):
+        """Adjacency index picks up edges added after the first query."""
+        graph = ConnectivityGraph(storey="Test")
+        for name in ("A", "B", "C"):
+            graph.nodes[name] = GraphNode(name=name, node_type="living", area=10.0, storey="Test")
+        graph.add_edge(GraphEdge(door_name="D1", door_width=0.9, from_node="A", to_node="B"))
+        assert [n for n, _ in graph.neighbors("B")] == ["A"]
+        assert not graph.has_path("A", "C")
+
+        graph.add_edge(GraphEdge(door_name="D2", door_width=0.9, from_node="B", to_node="C"))
+        assert [n for n, _ in graph.neighbors("B")] == ["A", "C"]
+        assert graph.has_path("A", "C")
+        assert graph.reachable_from("C") == {"A", "B", "C"}
+
+    def test_zone_index_candidates(self):
+        """Grid index only returns zones whose boxes can hold the probe."""
+        left = _Zone("Left", "living", [(0, 0), (4, 0), (4, 4), (0, 4)], 16.0)
+        right = _Zone("Right", "bedroom", [(4, 0), (8, 0), (8, 4), (4, 4)], 16.0)
+        far = _Zone("Far", "kitchen", [(20, 20), (23, 20), (23, 23), (20, 23)], 9.0)
+        index = _ZoneIndex([left, right, far])
+        assert far not in index.candidates(1.0, 1.0)
+        assert [z.name for z in index.candidates(3.95, 2.0, margin=0.15)] == ["Left", "Right"]
+        assert _find_zone_at_point(6.0, 2.0, index) == "Right"
+        assert _find_zone_at_point(21.0, 21.0, index) == "Far"
+        assert _find_zone_at_point(12.0, 12.0, index) is None
+
+    def test_zone_buffer_matches_scalar_ray_cast(self):
+        """Batched containment agrees with the per-zone ray cast."""
+        l_shape = [(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)]
+        square = [(1, 1), (3, 1), (3, 3), (1, 3)]
+        zones = [_Zone("L", "living", l_shape, 3.0), _Zone("Sq", "bedroom", square, 4.0)]
+        points = np.array([(0.5, 0.5), (1.5, 1.5), (1.5, 0.5), (5.0, 5.0)])
+        inside = _ZoneBuffer.from_zones(zones).contains(points[:, 0], points[:, 1])
+        for p, row in zip(points, inside):
+            expected = [_point_in_polygon(p[0], p[1], z.vertices) for z in zones]
+            assert row.tolist() == expected
+
     def test_synthesize_common_zones(self, v3_building: Building):
         """Common zones should be created for corridor, lobby, etc."""
         story = v3_building.get_story("Ground Floor")
@@ -276,6 +326,18 @@ class TestMermaidExport:
         output_tb = graph_to_mermaid(ground_graph, direction="TB")
         assert output_tb.startswith("flowchart TB")
 
+    def test_mermaid_merges_parallel_doors(self):
+        """Two doors between the same rooms render as one labelled edge."""
+        graph = ConnectivityGraph(storey="Test")
+        for name in ("Corridor", "Vorraum"):
+            graph.nodes[name] = GraphNode(name=name, node_type="hallway", area=5.0, storey="Test")
+        graph.add_edge(GraphEdge(door_name="D1", door_width=0.9, from_node="Corridor", to_node="Vorraum"))
+        graph.add_edge(GraphEdge(door_name="D2", door_width=1.0, from_node="Vorraum", to_node="Corridor"))
+        assert len(graph.edges_by_pair) == 1
+        output = graph_to_mermaid(graph)
+        edge_lines = [l for l in output.split("\n") if "-->" in l]
+        assert edge_lines == ['    Corridor -->|"D1 0.9m, D2 1.0m"| Vorraum']
+
     def test_mermaid_node_shapes(self, ground_graph: ConnectivityGraph):
         """Different node types should have different Mermaid shapes."""
         output = graph_to_mermaid(ground_graph)
@@ -411,6 +473,57 @@ class TestWallRoomRelationships:
         result = get_wall_rooms(v3_building, "1st Floor", "No Such Wall")
         assert result == (None, None)
 
+    def test_walls_touching_boundary(self):
+        """Only walls parallel to, near and overlapping an edge touch it."""
+        edges = _get_polygon_edges(Polygon2D(vertices=[
+            Point2D(x=0, y=0), Point2D(x=4, y=0),
+            Point2D(x=4, y=4), Point2D(x=0, y=4),
+        ]))
+        assert edges.shape == (4, 4)
+
+        def wall(x1, y1, x2, y2):
+            return Wall(start=Point2D(x=x1, y=y1), end=Point2D(x=x2, y=y2),
+                        height=3.0, thickness=0.2)
+
+        walls = [
+            wall(0, 0, 4, 0),        # on the south edge
+            wall(1, 4.1, 3, 4.1),    # parallel to the north edge, within tolerance
+            wall(0, 1, 4, 1),        # parallel but 1m inside
+            wall(1, -1, 1, 1),       # perpendicular through the south edge
+            wall(4.1, 3.9, 4.1, 6),  # collinear with the east edge, barely overlapping
+        ]
+        touches = _walls_touching_boundary(walls, edges, tolerance=0.25)
+        assert touches.tolist() == [True, True, False, False, False]
+
+    def test_batched_point_in_polygon(self):
+        """Batched ray cast handles concave polygons."""
+        l_shape = np.array([(0, 0), (2, 0), (2, 1), (1, 1), (1, 2), (0, 2)], dtype=float)
+        points = np.array([(0.5, 0.5), (1.5, 0.5), (0.5, 1.5), (1.5, 1.5), (-0.1, 0.5)])
+        inside = _points_in_polygon(points, l_shape)
+        assert inside.tolist() == [True, True, True, False, False]
+
+    def test_rectangle_fast_path_matches_ray_cast(self):
+        """Box test for rectangles agrees with the ray cast, boundaries included."""
+        rect = Polygon2D(vertices=[
+            Point2D(x=0, y=0), Point2D(x=4, y=0),
+            Point2D(x=4, y=3), Point2D(x=0, y=3),
+        ])
+        assert rect.is_axis_aligned_rect
+        grid = np.array([(x, y) for x in np.arange(-1, 5.5, 0.5) for y in np.arange(-1, 4.5, 0.5)])
+        found = _find_containing_spaces(grid, [Space(name="Room", boundary=rect)])
+        expected = _points_in_polygon(grid, np.array(rect.coords))
+        assert [name == "Room" for name in found] == expected.tolist()
+
+    def test_batched_point_in_polygon_with_tolerance(self):
+        """Points just outside an edge match only within tolerance."""
+        square = Polygon2D(vertices=[
+            Point2D(x=0, y=0), Point2D(x=1, y=0),
+            Point2D(x=1, y=1), Point2D(x=0, y=1),
+        ])
+        points = np.array([(0.5, 0.5), (-0.05, 0.5), (1.2, 0.5), (1.05, 1.05)])
+        near = _points_in_polygon_with_tolerance(points, square, tolerance=0.1)
+        assert near.tolist() == [True, True, False, True]
+
 
 # ══════════════════════════════════════════════════════════════════════
 # 5. BUILDING API EXTENSION TESTS